@@ -1,10 +1,17 @@
 from .logs import create_logger, logger
 from .unset import UNSET, UnsetType
 from .node import Node, NodeException, Insert, Patch, EdgeConfigBase
-from .resolver import Resolver, ResolverException
+from .node.trusted import trusted_sampler
+from .resolver import Resolver, ResolverException, NamedQuery, batch, BatchQuery
 from .resolver import enums as resolver_enums
 from . import types_generator, validators
-from .execute import ExecuteConstraintViolationException, ExecuteException
+from .execute import (
+    ExecuteConstraintViolationException,
+    ExecuteException,
+    ExecuteOverloadedException,
+)
+from .transaction import transaction
+from .routing import ClientRouter, read_your_writes
 
 __all__ = [
     "UNSET",
@@ -13,7 +20,14 @@ __all__ = [
     "Insert",
     "Patch",
     "EdgeConfigBase",
+    "trusted_sampler",
     "Resolver",
+    "NamedQuery",
+    "batch",
+    "BatchQuery",
+    "transaction",
+    "ClientRouter",
+    "read_your_writes",
     "NodeException",
     "ResolverException",
     "resolver_enums",
@@ -23,4 +37,5 @@ __all__ = [
     "validators",
     "ExecuteConstraintViolationException",
     "ExecuteException",
+    "ExecuteOverloadedException",
 ]
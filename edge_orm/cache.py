@@ -14,6 +14,19 @@ class CacheException(Exception):
     pass
 
 
+class Lazy:
+    """a nested edge still in its raw response form, parsed the first time it is read"""
+
+    __slots__ = ("parse", "raw")
+
+    def __init__(self, parse: T.Callable[[T.Any], T.Any], raw: T.Any) -> None:
+        self.parse = parse
+        self.raw = raw
+
+    def materialize(self) -> T.Any:
+        return self.parse(self.raw)
+
+
 class CacheNode(BaseModel):
     # val: T.Union["Node", list["Node"]]
     val: T.Any  # this could be a count or a string or a bool...
@@ -48,10 +61,11 @@ class Cache(BaseModel):
     def val(self, edge: str, resolver: "Resolver") -> T.Any:  # type: ignore
         for node in self.get(edge):
             if resolver.is_subset_of(node.resolver):
+                if isinstance(node.val, Lazy):
+                    # parsed once, then kept
+                    node.val = node.val.materialize()
                 return node.val
-        raise CacheException(
-            f"No node with edge {edge}, resolver {resolver.__dict__} found."
-        )
+        raise CacheException(f"No node with edge {edge}, resolver {resolver} found.")
 
     def val_or_unset(self, edge: str, resolver: "Resolver") -> T.Any:  # type: ignore
         try:
@@ -1,9 +1,11 @@
 import typing as T
 import time
+import asyncio
+import weakref
 import orjson
 from enum import Enum
 import edgedb
-from edge_orm import logger
+from edge_orm import logger, helpers
 from edge_orm.span import span
 
 
@@ -15,6 +17,10 @@ class ExecuteConstraintViolationException(ExecuteException):
     pass
 
 
+class ExecuteOverloadedException(ExecuteException):
+    pass
+
+
 MUTATION_ACTIONS = {"insert ", "update ", "delete "}
 
 
@@ -32,28 +38,342 @@ def check_enum(v: T.Any) -> T.Any:
     return v
 
 
+class SingleFlightInfo(T.NamedTuple):
+    calls: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight:
+    """opt-in coalescing of identical concurrent reads: the first caller sends the query and every
+    identical read that comes in before it returns awaits the same response.
+    Only the response text (or the immutable binary objects) is shared,
+    every caller parses its own copy"""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: dict[T.Hashable, asyncio.Task[T.Any]] = {}
+
+    def enable(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+
+    @staticmethod
+    def key(
+        client: edgedb.AsyncIOClient,
+        query_str: str,
+        variables: dict[str, T.Any],
+        only_one: bool,
+        binary: bool = False,
+    ) -> T.Hashable:
+        return (
+            id(asyncio.get_running_loop()),
+            id(client),
+            query_str,
+            only_one,
+            binary,
+            frozenset((k, type(v), helpers.freeze(v)) for k, v in variables.items()),
+        )
+
+    async def do(
+        self, key: T.Hashable, func: T.Callable[[], T.Awaitable[T.Any]]
+    ) -> T.Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        # shielded so one caller being cancelled does not cancel the query for the others
+        return await asyncio.shield(task)
+
+    def _done(self, key: T.Hashable, task: "asyncio.Task[T.Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # every caller may have been cancelled, so nobody else retrieves the exception
+            task.exception()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+
+    def info(self) -> SingleFlightInfo:
+        return SingleFlightInfo(
+            calls=self.calls, coalesced=self.coalesced, in_flight=len(self._in_flight)
+        )
+
+
+single_flight = SingleFlight()
+
+
+class Limits(T.NamedTuple):
+    """None means unlimited. max_queued and queue_timeout apply to each lane"""
+
+    max_reads: int | None = None
+    max_writes: int | None = None
+    max_queued: int | None = None
+    queue_timeout: float | None = None
+
+
+class LimiterInfo(T.NamedTuple):
+    in_flight: int
+    queued: int
+    admitted: int
+    rejected: int
+    wait_ms_total: float
+    wait_ms_max: float
+
+
+class _Lane:
+    __slots__ = (
+        "semaphore",
+        "in_flight",
+        "queued",
+        "admitted",
+        "rejected",
+        "wait_ms_total",
+        "wait_ms_max",
+    )
+
+    def __init__(self, max_in_flight: int) -> None:
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.queued = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+
+class _Pool:
+    """the limits and lanes of one connection pool, shared by every client using it"""
+
+    __slots__ = ("limits", "lanes", "__weakref__")
+
+    def __init__(self) -> None:
+        self.limits: Limits | None = None
+        self.lanes: dict[tuple[asyncio.AbstractEventLoop, str], _Lane] = {}
+
+
+class Limiter:
+    """admission control in front of the client pools: every pool gets a lane for
+    reads and a lane for writes, each with a cap on queries in flight. Clients derived
+    with with_globals and the like share the pool of their parent, transactions the pool
+    of their client. Queries over the cap wait in a bounded queue and raise
+    ExecuteOverloadedException when it is full or they time out.
+    Configure it before traffic starts, configuring drops the lanes"""
+
+    def __init__(self, limits: Limits | None = None) -> None:
+        self.default_limits = limits
+        # the clients keep the entry of their pool alive, it goes with the last of them.
+        # Pools cannot be weakly referenced themselves
+        self._clients: weakref.WeakKeyDictionary[T.Any, _Pool] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pools: weakref.WeakValueDictionary[int, _Pool] = (
+            weakref.WeakValueDictionary()
+        )
+        self._limited: weakref.WeakSet[_Pool] = weakref.WeakSet()
+
+    @property
+    def enabled(self) -> bool:
+        return self.default_limits is not None or bool(self._limited)
+
+    def _pool(self, client: T.Any) -> _Pool:
+        # a transaction runs on the pool of its client
+        client = getattr(client, "_client", client)
+        pool = self._clients.get(client)
+        if pool is None:
+            impl = getattr(client, "_impl", client)
+            pool = self._pools.get(id(impl))
+            if pool is None:
+                pool = self._pools[id(impl)] = _Pool()
+            self._clients[client] = pool
+        return pool
+
+    def configure(
+        self, limits: Limits | None, client: edgedb.AsyncIOClient | None = None
+    ) -> None:
+        """sets the limits of every pool, or of the pool of one client"""
+        if client is None:
+            self.default_limits = limits
+        else:
+            pool = self._pool(client)
+            pool.limits = limits
+            if limits is None:
+                self._limited.discard(pool)
+            else:
+                self._limited.add(pool)
+        for pool in list(self._pools.values()):
+            pool.lanes.clear()
+
+    def _max_in_flight(
+        self, pool: _Pool, operation: str
+    ) -> tuple[int | None, Limits | None]:
+        limits = pool.limits if pool.limits is not None else self.default_limits
+        if limits is None:
+            return None, None
+        if operation == "mutation":
+            return limits.max_writes, limits
+        return limits.max_reads, limits
+
+    async def run(
+        self,
+        *,
+        client: edgedb.AsyncIOClient,
+        operation: str,
+        func: T.Callable[[], T.Awaitable[T.Any]],
+    ) -> T.Any:
+        pool = self._pool(client)
+        max_in_flight, limits = self._max_in_flight(pool, operation)
+        if max_in_flight is None or limits is None:
+            return await func()
+        key = (asyncio.get_running_loop(), operation)
+        lane = pool.lanes.get(key)
+        if lane is None:
+            lane = pool.lanes[key] = _Lane(max_in_flight)
+        if lane.semaphore.locked():
+            if limits.max_queued is not None and lane.queued >= limits.max_queued:
+                lane.rejected += 1
+                raise ExecuteOverloadedException(
+                    f"The {operation} queue of {limits.max_queued} is full."
+                )
+            lane.queued += 1
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(
+                    lane.semaphore.acquire(), timeout=limits.queue_timeout
+                )
+            except asyncio.TimeoutError:
+                lane.rejected += 1
+                raise ExecuteOverloadedException(
+                    f"Waited more than {limits.queue_timeout} s for a {operation} slot."
+                )
+            finally:
+                lane.queued -= 1
+            wait_ms = (time.perf_counter() - start) * 1_000
+            lane.wait_ms_total += wait_ms
+            lane.wait_ms_max = max(lane.wait_ms_max, wait_ms)
+        else:
+            await lane.semaphore.acquire()
+        lane.admitted += 1
+        lane.in_flight += 1
+        try:
+            return await func()
+        finally:
+            lane.in_flight -= 1
+            lane.semaphore.release()
+
+    def reset(self) -> None:
+        for pool in list(self._pools.values()):
+            for lane in pool.lanes.values():
+                lane.reset()
+
+    def info(self, operation: str | None = None) -> LimiterInfo:
+        """summed over every pool, or over the lanes of one operation"""
+        lanes = [
+            lane
+            for pool in list(self._pools.values())
+            for (_, lane_operation), lane in pool.lanes.items()
+            if operation is None or lane_operation == operation
+        ]
+        return LimiterInfo(
+            in_flight=sum(lane.in_flight for lane in lanes),
+            queued=sum(lane.queued for lane in lanes),
+            admitted=sum(lane.admitted for lane in lanes),
+            rejected=sum(lane.rejected for lane in lanes),
+            wait_ms_total=sum(lane.wait_ms_total for lane in lanes),
+            wait_ms_max=max((lane.wait_ms_max for lane in lanes), default=0.0),
+        )
+
+
+limiter = Limiter()
+
+
+class SyncClient:
+    """wraps a blocking edgedb.Client so the async pipeline can call it: every query
+    coroutine returns without suspending, so it can be run without an event loop"""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: edgedb.Client) -> None:
+        self.client = client
+
+    async def query_json(self, query: str, **variables: T.Any) -> str:
+        return self.client.query_json(query, **variables)
+
+    async def query_single_json(self, query: str, **variables: T.Any) -> str:
+        return self.client.query_single_json(query, **variables)
+
+    async def query(self, query: str, **variables: T.Any) -> T.Any:
+        return self.client.query(query, **variables)
+
+    async def query_single(self, query: str, **variables: T.Any) -> T.Any:
+        return self.client.query_single(query, **variables)
+
+
 async def query(
     *,
     client: edgedb.AsyncIOClient,
     query_str: str,
     variables: dict[str, T.Any] | None = None,
     only_one: bool,
+    variable_names: dict[str, str] | None = None,
+    binary: bool = False,
+    raw: bool = False,
 ) -> T.Any | None:
-    if variables is None:
-        variables = {}
+    """variable_names maps compacted variable names back to the originals, for error logs.
+    binary uses the native codecs instead of json and returns edgedb objects.
+    raw returns the json text as the server sent it, without loading it"""
     # TODO usually would simplify vars here but should do this in earlier step
-    query_func = client.query_json if not only_one else client.query_single_json
+    if binary:
+        query_func = client.query if not only_one else client.query_single
+    else:
+        query_func = client.query_json if not only_one else client.query_single_json
     # turn enums into values
-    variables = {k: check_enum(v) for k, v in variables.items()}
+    query_variables = {k: check_enum(v) for k, v in (variables or {}).items()}
+    operation = operation_from_query_str(query_str)
+
+    # single-flight and the limiter need an event loop, sync clients skip them
+    is_sync = isinstance(client, SyncClient)
+
+    def send() -> T.Awaitable[T.Any]:
+        if limiter.enabled and not is_sync:
+            return limiter.run(
+                client=client,
+                operation=operation,
+                func=lambda: query_func(query=query_str, **query_variables),
+            )
+        return query_func(query=query_str, **query_variables)
+
     start = time.time()
     try:
-        with span(
-            op=f"edge-orm.{operation_from_query_str(query_str)}",
-            description=query_str[:200],
-        ):
-            json_str = await query_func(query=query_str, **variables)
-        with span(op=f"orjson.loads", description=f"{len(json_str)=}"):
-            response_dict = orjson.loads(json_str)
+        with span(op=f"edge-orm.{operation}", description=query_str[:200]):
+            if single_flight.enabled and operation == "query" and not is_sync:
+                response = await single_flight.do(
+                    key=single_flight.key(
+                        client=client,
+                        query_str=query_str,
+                        variables=query_variables,
+                        only_one=only_one,
+                        binary=binary,
+                    ),
+                    func=send,
+                )
+            else:
+                response = await send()
+        if binary or raw:
+            response_dict = response
+        else:
+            with span(op=f"orjson.loads", description=f"{len(response)=}"):
+                response_dict = orjson.loads(response)
     except edgedb.errors.ConstraintViolationError as e:
         logger.error(f"{e=}")
         if "is prohibited by link target policy" in str(e):
@@ -66,7 +386,8 @@ async def query(
         raise e
     except Exception as e:
         logger.error(
-            f"EdgeDB Query Exception: {e}, query_str and variables: {query_str=}, {variables=}"
+            f"EdgeDB Query Exception: {e}, query_str and variables: {query_str=}, variables={query_variables}"
+            + (f", {variable_names=}" if variable_names else "")
         )
         raise e
     took_ms = round((time.time() - start) * 1_000, 2)
@@ -1,4 +1,5 @@
 import typing as T
+import itertools
 import random
 import string
 import re
@@ -10,6 +11,8 @@ SEPARATOR = "__"
 
 ListType = T.TypeVar("ListType")
 
+_VERSIONS = itertools.count(1)
+
 
 def random_str(n: int, include_re_code: bool = False) -> str:
     pre_str = RE_CODE if include_re_code else ""
@@ -36,3 +39,30 @@ def replace_str_with_vars(s: str, variables: dict[str, T.Any]) -> str:
             rf"(\$)({var_name})(\W*)", r"\1" + f"[({var_val})]" + r"\3", s
         ).replace(f"[({var_val})]", f"{var_val}")
     return s
+
+
+def prefixed(var_name: str, prefix: str) -> str:
+    return f"{prefix}{SEPARATOR}{var_name}" if prefix else var_name
+
+
+def next_version() -> int:
+    """process-wide increasing counter, used to tell if a cached value is stale"""
+    return next(_VERSIONS)
+
+
+def freeze(v: T.Any) -> T.Hashable:
+    """hashable stand-in for a variable value. Two frozen values are only equal if the originals are,
+    unhashable objects fall back to their identity"""
+    if v is None or isinstance(v, (str, int, float, bytes)):
+        return v
+    if isinstance(v, (list, tuple)):
+        return type(v), tuple(freeze(i) for i in v)
+    if isinstance(v, (set, frozenset)):
+        return type(v), frozenset(freeze(i) for i in v)
+    if isinstance(v, dict):
+        return dict, frozenset((k, freeze(i)) for k, i in v.items())
+    try:
+        hash(v)
+        return v
+    except TypeError:
+        return "__id__", id(v)
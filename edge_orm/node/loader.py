@@ -0,0 +1,144 @@
+import typing as T
+import asyncio
+import edgedb
+from .errors import NodeException
+
+if T.TYPE_CHECKING:
+    from .models import Node
+    from edge_orm.resolver.model import Resolver
+
+IDS_FILTER = ".id IN array_unpack(<array<uuid>>$ids)"
+
+
+class EdgeLoaderInfo(T.NamedTuple):
+    loads: int
+    batches: int
+    pending: int
+
+
+class _Batch:
+    """lazy loads of the same edge, with equal edge resolvers, waiting for the next loop tick"""
+
+    __slots__ = ("resolver_cls", "edge_name", "edge_resolver", "client", "loads")
+
+    def __init__(
+        self,
+        *,
+        resolver_cls: T.Type["Resolver"],  # type: ignore
+        edge_name: str,
+        edge_resolver: "Resolver",  # type: ignore
+        client: edgedb.AsyncIOClient | None,
+    ) -> None:
+        self.resolver_cls = resolver_cls
+        self.edge_name = edge_name
+        self.edge_resolver = edge_resolver
+        self.client = client
+        self.loads: list[tuple["Node", asyncio.Future[T.Any]]] = []
+
+    async def run(self) -> None:
+        try:
+            ids = list(dict.fromkeys(node.id for node, _ in self.loads))
+            rez = self.resolver_cls().filter(IDS_FILTER, {"ids": ids})
+            getattr(rez, self.edge_name)(self.edge_resolver)
+            fetched = {n.id: n for n in await rez.query(client=self.client)}
+        except Exception as e:
+            for _, future in self.loads:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for node, future in self.loads:
+            if future.done():
+                continue
+            fetched_node = fetched.get(node.id)
+            if fetched_node is None:
+                future.set_exception(
+                    NodeException(
+                        f"No {node.__class__.__name__} in db with fields id = {node.id}."
+                    )
+                )
+                continue
+            try:
+                val = await fetched_node.resolve(
+                    edge_name=self.edge_name,
+                    edge_resolver=self.edge_resolver,
+                    cache_only=True,
+                )
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(val)
+
+
+class EdgeLoader:
+    """opt-in, collects the lazy edge loads of Node.resolve(cache_only=False) made in the same event loop tick.
+    Loads of the same edge with equal edge resolvers become one query filtered by all of their ids.
+    Only loads that are waiting at the same time are batched, like the ones of asyncio.gather:
+    awaiting each load in turn, as in `for u in users: await u.friends(cache_only=False)`,
+    still sends one query per node
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.loads = 0
+        self.batches = 0
+        self._pending: dict[T.Hashable, _Batch] = {}
+        # the loop only keeps weak references to tasks
+        self._running: set[asyncio.Task[None]] = set()
+
+    def enable(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+
+    async def load(
+        self,
+        *,
+        node: "Node",
+        edge_name: str,
+        edge_resolver: "Resolver",  # type: ignore
+        client: edgedb.AsyncIOClient | None,
+    ) -> T.Any:
+        if node._used_resolver is None:
+            raise NodeException(
+                f"{node.__class__.__name__} was not built by a resolver, so {edge_name} cannot be loaded."
+            )
+        loop = asyncio.get_running_loop()
+        resolver_cls = node._used_resolver.__class__
+        key = (
+            id(loop),
+            resolver_cls,
+            edge_name,
+            edge_resolver.fingerprint(),
+            id(client),
+        )
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _Batch(
+                resolver_cls=resolver_cls,
+                edge_name=edge_name,
+                edge_resolver=edge_resolver,
+                client=client,
+            )
+            self._pending[key] = batch
+            loop.call_soon(self._flush, key)
+        future: asyncio.Future[T.Any] = loop.create_future()
+        batch.loads.append((node, future))
+        self.loads += 1
+        return await future
+
+    def _flush(self, key: T.Hashable) -> None:
+        batch = self._pending.pop(key)
+        self.batches += 1
+        task = asyncio.ensure_future(batch.run())
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    def reset(self) -> None:
+        self.loads = 0
+        self.batches = 0
+
+    def info(self) -> EdgeLoaderInfo:
+        return EdgeLoaderInfo(
+            loads=self.loads, batches=self.batches, pending=len(self._pending)
+        )
+
+
+edge_loader = EdgeLoader()
@@ -7,6 +7,8 @@ from edgedb import AsyncIOClient
 from edge_orm.cache import Cache
 from edge_orm.unset import UNSET
 from .errors import NodeException
+from .loader import edge_loader
+from edge_orm.routing import ClientRouter
 
 if T.TYPE_CHECKING:
     # from edge_orm.cache import Cache
@@ -37,6 +39,10 @@ CONVERSION_MAP = dict[str, FieldInfo]
 class EdgeConfigBase(BaseModel):
     model_name: str
     client: AsyncIOClient
+    # used by resolver.sync
+    sync_client: edgedb.Client | None = None
+    # when set, picks the client of every call that was not given one
+    router: ClientRouter | None = None
 
     updatable_fields: set[str]
     exclusive_fields: set[str]
@@ -134,6 +140,16 @@ class Node(SetFields):
                 raise NodeException(
                     f"Could not get {edge_name} from the cache, and settings are cache_only."
                 )
+            elif edge_loader.enabled:
+                # batched with the other loads of this edge in this loop tick
+                new_val = await edge_loader.load(
+                    node=self,
+                    edge_name=edge_name,
+                    edge_resolver=edge_resolver,
+                    client=client,
+                )
+                self._cache.add(edge=edge_name, resolver=edge_resolver, val=new_val)
+                return new_val
             else:
                 new_r = self._used_resolver.__class__()
                 # UserResolver().friends(edge_resolver)
@@ -0,0 +1,162 @@
+import typing as T
+import itertools
+from uuid import UUID
+from decimal import Decimal
+from datetime import datetime, date
+from pydantic import ValidationError
+from pydantic.fields import ModelField, SHAPE_SINGLETON
+from edge_orm.logs import logger
+from edge_orm.unset import UNSET
+
+if T.TYPE_CHECKING:
+    from .models import Node
+
+NodeType = T.TypeVar("NodeType", bound="Node")
+
+# field types whose values, as they come back from the database, need no validation
+PASSTHROUGH_TYPES = frozenset({str, int, float, bool, UUID, datetime, date, Decimal})
+# cheap conversions of the strings the json protocol sends, by (field type, value type)
+CONVERTERS: dict[tuple[type, type], T.Callable[[T.Any], T.Any]] = {
+    (UUID, str): UUID,
+    (datetime, str): datetime.fromisoformat,
+    (date, str): date.fromisoformat,
+}
+
+
+class _FieldPlan(T.NamedTuple):
+    name: str
+    field: ModelField
+    passthrough: frozenset[type]
+    converters: dict[type, T.Callable[[T.Any], T.Any]]
+
+
+class _NodePlan(T.NamedTuple):
+    # (key in the response, field, default) of every field, in __fields__ order
+    fields: tuple[tuple[str, _FieldPlan, T.Callable[[], T.Any]], ...]
+    required: frozenset[str]
+    # root validators can change any value, so these nodes are always validated
+    has_root_validators: bool
+
+
+_plans: dict[type, _NodePlan] = {}
+
+
+def _field_plan(name: str, field: ModelField) -> _FieldPlan:
+    passthrough: set[type] = set()
+    converters: dict[type, T.Callable[[T.Any], T.Any]] = {}
+    # validators, like from_str on json fields, always run
+    if not field.class_validators:
+        for sub in field.sub_fields or [field]:
+            if sub.shape != SHAPE_SINGLETON or sub.sub_fields:
+                continue
+            if sub.type_ in PASSTHROUGH_TYPES:
+                passthrough.add(sub.type_)
+            for (type_, value_type), converter in CONVERTERS.items():
+                if sub.type_ is type_:
+                    converters[value_type] = converter
+    return _FieldPlan(
+        name=name,
+        field=field,
+        passthrough=frozenset(passthrough),
+        converters=converters,
+    )
+
+
+def _default_getter(field: ModelField) -> T.Callable[[], T.Any]:
+    default = field.default
+    if field.default_factory is None and (
+        default is None or default is UNSET or type(default) in PASSTHROUGH_TYPES
+    ):
+        # pydantic deep copies every default, which these do not need
+        return lambda: default
+    return field.get_default
+
+
+def _plan(node_cls: T.Type["Node"]) -> _NodePlan:
+    plan = _plans.get(node_cls)
+    if plan is None:
+        plan = _NodePlan(
+            fields=tuple(
+                (field.alias, _field_plan(name, field), _default_getter(field))
+                for name, field in node_cls.__fields__.items()
+            ),
+            required=frozenset(
+                name for name, field in node_cls.__fields__.items() if field.required
+            ),
+            has_root_validators=bool(
+                node_cls.__pre_root_validators__ or node_cls.__post_root_validators__
+            ),
+        )
+        _plans[node_cls] = plan
+    return plan
+
+
+def _value(plan: _FieldPlan, v: T.Any, values: dict[str, T.Any], cls: type) -> T.Any:
+    if v is None or type(v) in plan.passthrough:
+        return v
+    converter = plan.converters.get(type(v))
+    if converter is not None:
+        try:
+            return converter(v)
+        except ValueError:
+            pass
+    v, error = plan.field.validate(v, values, loc=plan.field.alias, cls=cls)
+    if error:
+        raise ValidationError([error], cls)
+    return v
+
+
+def construct_trusted(node_cls: T.Type[NodeType], d: dict[str, T.Any]) -> NodeType:
+    """builds a node from a database response without validating it as a whole:
+    values already of the field type are taken as they are, UUID and datetime strings are
+    converted directly and only the other fields are validated, one by one, in the order
+    pydantic would. Keys that are not fields, like nested edges and extra fields, are ignored.
+    Models with root validators are validated as a whole, as are responses missing required fields
+    """
+    plan = _plan(node_cls)
+    if plan.has_root_validators:
+        return node_cls(**d)
+    values: dict[str, T.Any] = {}
+    fields_set: set[str] = set()
+    for key, field_plan, get_default in plan.fields:
+        if key in d:
+            values[field_plan.name] = _value(field_plan, d[key], values, node_cls)
+            fields_set.add(field_plan.name)
+        elif field_plan.name in plan.required:
+            # let pydantic raise the error for the missing fields
+            return node_cls(**d)
+        else:
+            values[field_plan.name] = get_default()
+    node = node_cls.__new__(node_cls)
+    object.__setattr__(node, "__dict__", values)
+    object.__setattr__(node, "__fields_set__", fields_set)
+    node._init_private_attributes()
+    return node
+
+
+class TrustedSampler:
+    """validates every nth node built with construct_trusted the slow way, to catch the
+    database and the models drifting apart. 0 never validates"""
+
+    def __init__(self, every: int = 0) -> None:
+        self.every = every
+        self._counter = itertools.count(1)
+
+    def construct(self, node_cls: T.Type[NodeType], d: dict[str, T.Any]) -> NodeType:
+        node = construct_trusted(node_cls, d)
+        if self.every and next(self._counter) % self.every == 0:
+            validated = node_cls(**d)
+            if validated.__dict__ != node.__dict__:
+                drifted = [
+                    name
+                    for name, v in validated.__dict__.items()
+                    if node.__dict__.get(name) != v
+                ]
+                logger.warning(
+                    f"Trusted {node_cls.__name__} differs from the validated one in {drifted}."
+                )
+                return validated
+        return node
+
+
+trusted_sampler = TrustedSampler()
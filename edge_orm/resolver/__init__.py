@@ -1,5 +1,16 @@
 from .model import Resolver
 from .errors import ResolverException
+from .query_cache import query_cache
+from .named_query import NamedQuery
+from .batching import batch, BatchQuery
 from . import enums
 
-__all__ = ["Resolver", "ResolverException", "enums"]
+__all__ = [
+    "Resolver",
+    "ResolverException",
+    "enums",
+    "query_cache",
+    "NamedQuery",
+    "batch",
+    "BatchQuery",
+]
@@ -0,0 +1,158 @@
+import typing as T
+from enum import Enum
+import edgedb
+from edge_orm import helpers, execute, span
+from edge_orm.routing import Operation, mark_write
+from . import errors
+from .template import prefix_variables
+
+if T.TYPE_CHECKING:
+    from .model import Resolver, VARS
+
+
+class BatchKind(str, Enum):
+    MANY = "many"
+    ONE = "one"
+    COUNT = "count"
+
+
+class BatchQuery:
+    """one query of a batch, made by Resolver.count_query() or Resolver.get_query(),
+    or a mutation made by Resolver.insert_query() and the other *_query() methods.
+    A plain resolver in a batch is a query for many"""
+
+    __slots__ = ("resolver", "kind", "field_name", "value", "mutation")
+
+    def __init__(
+        self,
+        *,
+        resolver: "Resolver",  # type: ignore
+        kind: BatchKind,
+        field_name: str | None = None,
+        value: T.Any = None,
+        mutation: tuple[str, "VARS"] | None = None,
+    ) -> None:
+        self.resolver = resolver
+        self.kind = kind
+        self.field_name = field_name
+        self.value = value
+        # the INSERT, UPDATE or DELETE string and its variables
+        self.mutation = mutation
+
+    @staticmethod
+    def mutation_alias(key: str) -> str:
+        return f"{key}{helpers.SEPARATOR}model"
+
+    def build_with_str_and_vars(self, key: str) -> tuple[str, "VARS"]:
+        """binds the mutation in the WITH block, since mutations cannot be in a shape"""
+        mutation_s, mutation_variables = T.cast(tuple[str, "VARS"], self.mutation)
+        variables = {helpers.prefixed(k, key): v for k, v in mutation_variables.items()}
+        return (
+            f"{self.mutation_alias(key)} := ({prefix_variables(mutation_s, key)})",
+            variables,
+        )
+
+    def build_str_and_vars(self, key: str) -> tuple[str, "VARS"]:
+        """every variable is prefixed with the key, so queries in a batch cannot collide"""
+        r = self.resolver
+        if self.mutation is not None:
+            query_str, variables = r.full_query_str_and_vars(
+                include_select=True,
+                prefix=key,
+                include_filters=False,
+                model_name_override=self.mutation_alias(key),
+            )
+            if self.kind is BatchKind.ONE:
+                return f"{key} := assert_single(({query_str}))", variables
+            return f"{key} := ({query_str})", variables
+        include_select = self.kind is not BatchKind.COUNT
+        query_str, variables = r.full_query_str_and_vars(
+            include_select=include_select, prefix=key
+        )
+        if self.kind is BatchKind.COUNT:
+            return f"{key} := count({r.model_name} {query_str})", variables
+        if self.kind is BatchKind.ONE:
+            field_name = T.cast(str, self.field_name)
+            filter_str = prefix_variables(r.filter_str_from_field_name(field_name), key)
+            variables[helpers.prefixed(field_name, key)] = self.value
+            return (
+                f"{key} := assert_single(({query_str} FILTER {filter_str}))",
+                variables,
+            )
+        return f"{key} := ({query_str})", variables
+
+    def parse(self, raw_response: T.Any) -> T.Any:
+        r = self.resolver
+        if self.kind is BatchKind.COUNT:
+            if not isinstance(raw_response, int):
+                raise errors.ResolverException(f"Count must be an int {raw_response=}.")
+            return raw_response
+        if self.kind is BatchKind.ONE:
+            if not raw_response:
+                return None
+            return r.parse_obj_with_cache(raw_response)
+        if not isinstance(raw_response, list):
+            raise errors.ResolverException(
+                f"Expected a list from query, got {raw_response}."
+            )
+        return r.parse_obj_with_cache_list(raw_response)
+
+
+async def batch(
+    *,
+    client: edgedb.AsyncIOClient | None = None,
+    **queries: T.Union["Resolver", BatchQuery],  # type: ignore
+) -> dict[str, T.Any]:
+    """runs every query in one round-trip, as SELECT { users := (...), total := count(...) }.
+    Returns the parsed result of each query under its key: a list of nodes for a resolver,
+    a node or None for get_query() and an int for count_query().
+    Mutations are bound in a WITH block first, so they must not depend on each other"""
+    if not queries:
+        return {}
+    batch_queries: dict[str, BatchQuery] = {}
+    for key, query in queries.items():
+        if helpers.SEPARATOR in key:
+            raise errors.ResolverException(
+                f"Batch key {key} cannot contain {helpers.SEPARATOR}."
+            )
+        if not isinstance(query, BatchQuery):
+            query = BatchQuery(resolver=query, kind=BatchKind.MANY)
+        batch_queries[key] = query
+
+    has_mutation = any(q.mutation is not None for q in batch_queries.values())
+    if has_mutation:
+        mark_write()
+    if client is None:
+        configs = [q.resolver._node_config for q in batch_queries.values()]
+        if len({id(c.router or c.client) for c in configs}) > 1:
+            raise errors.ResolverException(
+                "Resolvers in a batch use different clients, pass in a client."
+            )
+        client = next(iter(batch_queries.values())).resolver._client_for(
+            Operation.MUTATION if has_mutation else Operation.QUERY
+        )
+
+    with_strs: list[str] = []
+    query_strs: list[str] = []
+    variables: "VARS" = {}
+    for key, query in batch_queries.items():
+        if query.mutation is not None:
+            with_str, with_variables = query.build_with_str_and_vars(key=key)
+            with_strs.append(with_str)
+            variables.update(with_variables)
+        query_str, query_variables = query.build_str_and_vars(key=key)
+        query_strs.append(query_str)
+        variables.update(query_variables)
+    query_str = f"SELECT {{ {', '.join(query_strs)} }}"
+    if with_strs:
+        query_str = f"WITH {', '.join(with_strs)} {query_str}"
+
+    with span.span(op="edgedb.batch", description=", ".join(batch_queries)):
+        raw_response = await execute.query(
+            client=client, query_str=query_str, variables=variables, only_one=True
+        )
+    if not isinstance(raw_response, dict):
+        raise errors.ResolverException(
+            f"Expected an object from batch, got {raw_response}."
+        )
+    return {key: query.parse(raw_response[key]) for key, query in batch_queries.items()}
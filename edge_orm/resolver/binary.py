@@ -0,0 +1,52 @@
+import typing as T
+import orjson
+import edgedb
+from edgedb.datatypes.datatypes import get_object_descriptor
+
+# (field name, is link property) of the fields of a shape, by the descriptor edgedb shares
+# between every object of that shape
+_plans: dict[T.Any, tuple[tuple[str, bool], ...]] = {}
+MAX_PLANS = 1_024
+
+
+def _plan(obj: edgedb.Object) -> tuple[tuple[str, bool], ...]:
+    descriptor = get_object_descriptor(obj)
+    plan = _plans.get(descriptor)
+    if plan is None:
+        # implicit fields (like an id that was not selected) are not in the json either
+        plan = tuple(
+            (name, descriptor.is_linkprop(name))
+            for name in dir(descriptor)
+            if not descriptor.is_implicit(name)
+        )
+        if len(_plans) >= MAX_PLANS:
+            _plans.clear()
+        _plans[descriptor] = plan
+    return plan
+
+
+def _value(v: T.Any) -> T.Any:
+    if isinstance(v, edgedb.EnumValue):
+        return v.value
+    if isinstance(v, list) and v and isinstance(v[0], edgedb.EnumValue):
+        return [e.value for e in v]
+    return v
+
+
+def dict_from_object(
+    obj: edgedb.Object, json_fields: T.AbstractSet[str] = frozenset()
+) -> dict[str, T.Any]:
+    """the dict the json protocol would have given for this object, one level deep.
+    Scalars keep their native types (UUID, datetime, Decimal...) so pydantic does not parse
+    strings again. Nested objects are left as they are, for the nested resolvers"""
+    d: dict[str, T.Any] = {}
+    for name, is_linkprop in _plan(obj):
+        if is_linkprop:
+            d[name] = _value(obj[name])
+            continue
+        v = getattr(obj, name)
+        if name in json_fields and v is not None:
+            # json comes back as text over the binary protocol
+            v = [orjson.loads(s) for s in v] if isinstance(v, list) else orjson.loads(v)
+        d[name] = _value(v)
+    return d
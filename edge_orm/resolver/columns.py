@@ -0,0 +1,83 @@
+import typing as T
+import warnings
+from operator import attrgetter, itemgetter
+import edgedb
+from edge_orm.node import CONVERSION_MAP
+from edge_orm.node.models import Cardinality
+from . import errors
+
+try:
+    import numpy as np
+
+    USE_NUMPY = True
+except ModuleNotFoundError:
+    USE_NUMPY = False
+
+COLUMNS = dict[str, T.Any]
+
+# numpy dtypes for the casts of single numbers, bools and datetimes, the rest stay lists
+NUMPY_DTYPES = {
+    "std::int16": "int64",
+    "std::int32": "int64",
+    "std::int64": "int64",
+    "std::float32": "float64",
+    "std::float64": "float64",
+    "std::bool": "bool",
+    "std::datetime": "datetime64[us]",
+    "cal::local_datetime": "datetime64[us]",
+    "cal::local_date": "datetime64[D]",
+}
+
+
+def _transpose(
+    rows: list[T.Any], fields: tuple[str, ...]
+) -> tuple[tuple[T.Any, ...], ...]:
+    """the values of each field, in one pass over the rows"""
+    if not rows:
+        return tuple(() for _ in fields)
+    getter = attrgetter if isinstance(rows[0], edgedb.Object) else itemgetter
+    if len(fields) == 1:
+        return (tuple(map(getter(fields[0]), rows)),)
+    return tuple(zip(*map(getter(*fields), rows)))
+
+
+def _to_array(column: tuple[T.Any, ...], dtype: str) -> T.Any:
+    if None in column:
+        if dtype == "int64":
+            # nan for the missing ints
+            dtype = "float64"
+        elif dtype == "bool":
+            return list(column)
+    with warnings.catch_warnings():
+        # std::datetime is UTC, numpy converts the offsets and warns it drops them:
+        # numpy 1 with a DeprecationWarning, numpy 2 with a UserWarning
+        for category in (DeprecationWarning, UserWarning):
+            warnings.filterwarnings("ignore", ".*timezone", category)
+        return np.array(column, dtype=dtype)
+
+
+def columns_from_rows(
+    rows: list[T.Any],
+    fields: tuple[str, ...],
+    *,
+    conversion_map: CONVERSION_MAP,
+    use_numpy: bool | None = None,
+) -> COLUMNS:
+    """rows of a query, dicts or edgedb objects, as a dict of columns"""
+    if use_numpy is None:
+        use_numpy = USE_NUMPY
+    elif use_numpy and not USE_NUMPY:
+        raise errors.ResolverException("numpy is not installed.")
+    columns: COLUMNS = {}
+    for field_name, column in zip(fields, _transpose(rows, fields)):
+        info = conversion_map.get(field_name)
+        if (
+            use_numpy
+            and info is not None
+            and info.cardinality == Cardinality.One
+            and (dtype := NUMPY_DTYPES.get(info.cast))
+        ):
+            columns[field_name] = _to_array(column, dtype)
+        else:
+            columns[field_name] = list(column)
+    return columns
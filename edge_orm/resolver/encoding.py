@@ -0,0 +1,49 @@
+import typing as T
+import orjson
+from pydantic import BaseModel
+from pydantic.json import ENCODERS_BY_TYPE
+
+OPTIONS = orjson.OPT_NON_STR_KEYS
+ENCODER = T.Callable[[T.Any], T.Any]
+
+# orjson encodes str, numbers, dicts, lists, datetimes, UUIDs, enums and dataclasses itself
+# and only calls default for the rest, so this is filled lazily, once per type
+_encoders_by_type: dict[type, ENCODER] = {}
+
+
+def _model_dict(model: BaseModel) -> dict[str, T.Any]:
+    return model.dict(by_alias=True)
+
+
+def encoder_for(type_: type) -> ENCODER:
+    encoder = _encoders_by_type.get(type_)
+    if encoder is None:
+        if issubclass(type_, BaseModel):
+            encoder = _model_dict
+        else:
+            for base in type_.__mro__:
+                if base in ENCODERS_BY_TYPE:
+                    encoder = ENCODERS_BY_TYPE[base]
+                    break
+            else:
+                raise TypeError(f"Type {type_} is not JSON serializable.")
+        _encoders_by_type[type_] = encoder
+    return encoder
+
+
+def default(obj: T.Any) -> T.Any:
+    return encoder_for(type(obj))(obj)
+
+
+def dumps_bytes(v: T.Any) -> bytes:
+    return orjson.dumps(v, default=default, option=OPTIONS)
+
+
+def dumps(v: T.Any) -> str:
+    """json for a query variable, edgedb takes json variables as str"""
+    return dumps_bytes(v).decode()
+
+
+def dumps_model(model: BaseModel) -> str:
+    """what model.json() gives, without pydantic's json encoding"""
+    return dumps(model.dict())
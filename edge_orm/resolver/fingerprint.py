@@ -0,0 +1,55 @@
+import typing as T
+
+
+class Fingerprint:
+    """canonical description of a resolver tree. Built once per version of the tree so equality checks
+    (and the query cache key) do not have to rebuild filter strings or walk the tree again"""
+
+    __slots__ = ("shape", "filters_str", "variables", "conversion_funcs", "hash")
+
+    shape: tuple[T.Any, ...]
+    filters_str: str
+    variables: tuple[T.Any, ...]
+    conversion_funcs: tuple[T.Any, ...]
+    hash: int
+
+    def __init__(
+        self,
+        *,
+        shape: tuple[T.Any, ...],
+        filters_str: str,
+        variables: frozenset[tuple[str, T.Hashable]],
+        conversion_funcs: frozenset[str],
+        nested: tuple[tuple[str, tuple["Fingerprint", ...]], ...],
+    ) -> None:
+        # shape is everything that changes the query text, nested shapes included
+        self.shape = (
+            *shape,
+            tuple((edge, tuple(fp.shape for fp in fps)) for edge, fps in nested),
+        )
+        self.filters_str = filters_str
+        self.variables = (
+            variables,
+            tuple((edge, tuple(fp.variables for fp in fps)) for edge, fps in nested),
+        )
+        self.conversion_funcs = (
+            conversion_funcs,
+            tuple(
+                (edge, tuple(fp.conversion_funcs for fp in fps)) for edge, fps in nested
+            ),
+        )
+        self.hash = hash((self.shape, self.variables, self.conversion_funcs))
+
+    def __hash__(self) -> int:
+        return self.hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Fingerprint) or self.hash != other.hash:
+            return False
+        return (
+            self.shape == other.shape
+            and self.variables == other.variables
+            and self.conversion_funcs == other.conversion_funcs
+        )
@@ -23,7 +23,13 @@ def merge_fields(
     a_val = getattr(a, key, None)
     b_val = getattr(b, key, None)
 
-    if a_val == b_val:
+    # sets and dicts are copied like clone() does, so changing the merged resolver
+    # never changes a or b, which may be frozen templates
+    if isinstance(a_val, set) and isinstance(b_val, set):
+        setattr(merged_resolver, key, a_val | b_val)
+    elif isinstance(a_val, dict) and isinstance(b_val, dict):
+        setattr(merged_resolver, key, {**a_val, **b_val})
+    elif a_val == b_val:
         setattr(merged_resolver, key, a_val)
     elif a_val is None or b_val is None:
         # one is None, so just use the other one's
@@ -51,19 +57,13 @@ def merge_resolvers(
     merged_resolver._offset = a._offset
 
     merge_fields(a, b, merged_resolver, key="_extra_fields")
+    merge_fields(a, b, merged_resolver, key="_extra_fields_conversion_funcs")
     # merge_fields(a, b, merged_resolver, key="_modules")
 
     # can ignore update operation? -> yeah because these aren't used for updating
     merged_resolver._query_variables = {**a._query_variables, **b._query_variables}
 
-    if a._fields_to_return is None and b._fields_to_return is None:
-        merged_resolver._fields_to_return = None
-    else:
-        merged_resolver._fields_to_return = {
-            *(a._fields_to_return or set()),
-            *(b._fields_to_return or set()),
-        }
-    merged_resolver._fields_to_return = {*a._fields_to_return, *b._fields_to_return}
+    merged_resolver._fields_to_return = a._fields_to_return | b._fields_to_return
 
     merged_resolver._nested_resolvers = merge_nested_resolvers(
         a._nested_resolvers, b._nested_resolvers
@@ -72,6 +72,8 @@ def merge_resolvers(
     # okay, now if subsets, return ! else None
     # or separate this??
     if a.is_subset_of(merged_resolver) and b.is_subset_of(merged_resolver):
+        # only now, so a failed merge leaves the nested resolvers of a and b with their parents
+        merged_resolver._nested_resolvers.adopt_all()
         return merged_resolver
     if should_debug:
         logger.warning("NOT SUBSETS!")
@@ -1,17 +1,25 @@
 import typing as T
-import json
+import asyncio
+import functools
+import orjson
 import re
 import edgedb
-from pydantic import BaseModel, PrivateAttr
-from pydantic.main import ModelMetaclass
 from edge_orm.node import Node, Insert, Patch, EdgeConfigBase
 from edge_orm.logs import logger
-from edge_orm.external import encoders
 from edge_orm import helpers, execute, span
-from . import enums, errors, utils
+from edge_orm.routing import Operation, mark_write
+from . import enums, errors, utils, encoding, columns
 from .nested_resolvers import NestedResolvers
 from devtools import debug
 from .merging import merge_nested_resolver
+from .query_cache import query_cache
+from .fingerprint import Fingerprint
+from .template import tokenize, compact_query_str_and_vars
+from .batching import BatchQuery, BatchKind
+from .binary import dict_from_object
+from edge_orm.node.trusted import trusted_sampler
+from edge_orm.cache import Lazy
+from .sync import SyncResolver
 
 NodeType = T.TypeVar("NodeType", bound=Node)
 InsertType = T.TypeVar("InsertType", bound=Insert)
@@ -26,54 +34,271 @@ FILTER_FIELDS = ["_filter", "_limit", "_offset", "_order_by"]
 RAW_RESP_ONE = dict[str, T.Any]
 RAW_RESP_MANY = list[RAW_RESP_ONE]
 RAW_RESPONSE = RAW_RESP_ONE | RAW_RESP_MANY
-
-
-class Meta(ModelMetaclass):
-    """adds property _node_config to resolver from _node_cls"""
+LIMIT_VARIABLE = "__limit"
+OFFSET_VARIABLE = "__offset"
+AFTER_VARIABLE = "__after"
+# setting any of these makes cached state (like the fingerprint) stale
+SHAPE_FIELDS = {
+    "_filter",
+    "_order_by",
+    "_limit",
+    "_offset",
+    "_query_variables",
+    "_fields_to_return",
+    "_extra_fields",
+    "_extra_fields_conversion_funcs",
+    "_nested_resolvers",
+    "_parameterize_pagination",
+    "is_count",
+}
+# caches, these can still be set on a frozen resolver
+CACHE_FIELDS = {"_fingerprint", "_fingerprint_version", "_merged_tree_version"}
+
+
+class Meta(type):
+    """adds property _node_config to resolver from _node_cls,
+    and the default fields to return, which every new resolver of this class shares"""
 
     def __new__(mcs, name, bases, dct, **kwargs):  # type: ignore
         x = super().__new__(mcs, name, bases, dct, **kwargs)
         if "_node_cls" in dct:
-            x._node_config: EdgeConfigBase = dct["_node_cls"].EdgeConfig  # type: ignore
+            node_config: EdgeConfigBase = dct["_node_cls"].EdgeConfig
+            node_field_names: set[str] = {
+                field.alias for field in dct["_node_cls"].__fields__.values()
+            }
+            x._node_config = node_config  # type: ignore
+            x._default_fields_to_return = frozenset(  # type: ignore
+                node_field_names
+                - node_config.appendix_properties
+                - node_config.computed_properties
+            )
+            x._node_field_aliases = frozenset(node_field_names)  # type: ignore
+            # json comes back as text over the binary protocol
+            x._json_fields = frozenset(  # type: ignore
+                name
+                for name, info in node_config.node_edgedb_conversion_map.items()
+                if "json" in info.cast
+            )
         return x
 
 
-class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=Meta):
-    _filter: str = PrivateAttr(None)
-    _order_by: str = PrivateAttr(None)
-    _limit: int = PrivateAttr(None)
-    _offset: int = PrivateAttr(None)
+class Resolver(T.Generic[NodeType, InsertType, PatchType], metaclass=Meta):
+    """a plain slotted class, not a pydantic model: big resolver trees are built on every request"""
+
+    __slots__ = (
+        "_filter",
+        "_order_by",
+        "_limit",
+        "_offset",
+        "_query_variables",
+        "_fields_to_return",
+        "_extra_fields",
+        "_extra_fields_conversion_funcs",
+        "_nested_resolvers",
+        "is_count",
+        "update_operation",
+        "_merged",
+        "_parameterize_pagination",
+        "_compact_variables",
+        "_binary",
+        "_trusted",
+        "_lazy",
+        "_version",
+        "_tree_version",
+        "_parent",
+        "_fingerprint",
+        "_fingerprint_version",
+        "_merged_tree_version",
+        "_frozen",
+        "_compiled",
+    )
+
+    _filter: str | None
+    _order_by: str | None
+    _limit: int | None
+    _offset: int | None
 
-    _query_variables: VARS = PrivateAttr(default_factory=dict)
+    _query_variables: VARS
 
-    _fields_to_return: set[str] = PrivateAttr(default_factory=set)  # init this?
-    _extra_fields: set[str] = PrivateAttr(default_factory=set)
-    _extra_fields_conversion_funcs: dict[str, CONVERSION_FUNC] = PrivateAttr(
-        default_factory=dict
-    )
+    # never mutated in place, so new resolvers can share the class default until they change it
+    _fields_to_return: frozenset[str]
+    _extra_fields: set[str]
+    _extra_fields_conversion_funcs: dict[str, CONVERSION_FUNC]
 
-    _nested_resolvers: NestedResolvers = PrivateAttr(default_factory=NestedResolvers)
+    _nested_resolvers: NestedResolvers
 
     _node_cls: T.ClassVar[T.Type[NodeType]]  # type: ignore
     _insert_cls: T.ClassVar[T.Type[InsertType]]  # type: ignore
     _patch_cls: T.ClassVar[T.Type[PatchType]]  # type: ignore
 
     _node_config: T.ClassVar[EdgeConfigBase]
+    _default_fields_to_return: T.ClassVar[frozenset[str]] = frozenset()
+    # the keys of a response that are node fields, everything else is an edge or extra field
+    _node_field_aliases: T.ClassVar[frozenset[str]] = frozenset()
 
-    is_count: bool = False
-    update_operation: enums.UpdateOperation | None = None
-    _merged: bool = PrivateAttr(False)
+    is_count: bool
+    update_operation: enums.UpdateOperation | None
+    _merged: bool
 
     _edge_resolver_map: T.ClassVar[dict[str, T.Type["Resolver"]]]  # type: ignore
 
-    def __init__(self, **data: T.Any) -> None:
-        super().__init__(**data)
-        if not self._fields_to_return:
-            self._fields_to_return = (
-                self.node_field_names()
-                - self._node_config.appendix_properties
-                - self._node_config.computed_properties
+    # set to True on Resolver (or a subclass) to parameterize pagination of every new resolver
+    _parameterize_pagination_default: T.ClassVar[bool] = False
+    _parameterize_pagination: bool
+    # set to True on Resolver (or a subclass) to send every query with $v0, $v1... variable names
+    _compact_variables_default: T.ClassVar[bool] = False
+    _compact_variables: bool
+    # set to True on Resolver (or a subclass) to run every query over the binary protocol
+    _binary_default: T.ClassVar[bool] = False
+    _binary: bool
+    _json_fields: T.ClassVar[frozenset[str]] = frozenset()
+    # set to True on Resolver (or a subclass) to build every node without validating it
+    _trusted_default: T.ClassVar[bool] = False
+    _trusted: bool
+    # set to True on Resolver (or a subclass) to parse nested edges only when they are read
+    _lazy_default: T.ClassVar[bool] = False
+    _lazy: bool
+
+    _version: int
+    # the newest version of anything in this tree, bumped by nested resolvers when they change
+    _tree_version: int
+    # the nested resolvers this resolver was added to, if any
+    _parent: NestedResolvers | None
+    _fingerprint: Fingerprint | None
+    _fingerprint_version: int
+    _merged_tree_version: int
+
+    _frozen: bool
+    # compiled query strings and variables of a frozen resolver, by the compile arguments
+    _compiled: dict[tuple[T.Any, ...], tuple[str, VARS]] | None
+
+    def __init__(
+        self,
+        *,
+        is_count: bool = False,
+        update_operation: enums.UpdateOperation | None = None,
+    ) -> None:
+        # skips __setattr__, nothing can be stale yet
+        set_ = object.__setattr__
+        set_(self, "_filter", None)
+        set_(self, "_order_by", None)
+        set_(self, "_limit", None)
+        set_(self, "_offset", None)
+        set_(self, "_query_variables", {})
+        set_(self, "_fields_to_return", self._default_fields_to_return)
+        set_(self, "_extra_fields", set())
+        set_(self, "_extra_fields_conversion_funcs", {})
+        set_(self, "_nested_resolvers", NestedResolvers(owner=self))
+        set_(self, "is_count", is_count)
+        set_(self, "update_operation", update_operation)
+        set_(self, "_merged", False)
+        set_(self, "_parameterize_pagination", self._parameterize_pagination_default)
+        set_(self, "_compact_variables", self._compact_variables_default)
+        set_(self, "_binary", self._binary_default)
+        set_(self, "_trusted", self._trusted_default)
+        set_(self, "_lazy", self._lazy_default)
+        set_(self, "_version", helpers.next_version())
+        set_(self, "_tree_version", self._version)
+        set_(self, "_parent", None)
+        set_(self, "_fingerprint", None)
+        set_(self, "_fingerprint_version", 0)
+        set_(self, "_merged_tree_version", 0)
+        set_(self, "_frozen", False)
+        set_(self, "_compiled", None)
+
+    def __setattr__(self, name: str, value: T.Any) -> None:
+        if name not in CACHE_FIELDS:
+            self._assert_mutable()
+        object.__setattr__(self, name, value)
+        if name in SHAPE_FIELDS:
+            if name == "_nested_resolvers":
+                value._owner = self
+            self._invalidate()
+
+    def __repr__(self) -> str:
+        filters_str = self.build_filters_str(prefix="", literal=True)
+        return f"{self.__class__.__name__}({filters_str!r}, is_count={self.is_count})"
+
+    def _invalidate(self) -> None:
+        """call after mutating any of the SHAPE_FIELDS in place"""
+        self._version = helpers.next_version()
+        self._bump_tree_version(self._version)
+
+    def _bump_tree_version(self, version: int) -> None:
+        """versions only grow, so the newest one is the tree version of this resolver
+        and of every resolver it is nested in"""
+        set_ = object.__setattr__
+        rez: Resolver | None = self  # type: ignore
+        while rez is not None:
+            set_(rez, "_tree_version", version)
+            parent = rez._parent
+            rez = parent._owner if parent is not None else None
+
+    def _assert_mutable(self) -> None:
+        """call before mutating anything in place"""
+        if self._frozen:
+            raise errors.ResolverException(
+                f"{self.__class__.__name__} is frozen, clone() it to change it."
+            )
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self: ThisResolverType) -> ThisResolverType:
+        """makes this resolver and everything nested in it immutable, so the tree can be
+        built once and shared between concurrent requests. Vary it with with_vars()"""
+        if self._frozen:
+            return self
+        self.merge()
+        self._nested_resolvers.freeze()
+        self._compiled = {}
+        self._frozen = True
+        return self
+
+    def clone(self: ThisResolverType) -> ThisResolverType:
+        """a mutable copy. Frozen nested resolvers are shared instead of copied,
+        so cloning a frozen template only copies the root"""
+        set_ = object.__setattr__
+        rez = object.__new__(self.__class__)
+        for name in Resolver.__slots__:
+            set_(rez, name, getattr(self, name))
+        if hasattr(self, "__dict__"):
+            rez.__dict__.update(self.__dict__)
+        set_(rez, "_query_variables", {**self._query_variables})
+        set_(rez, "_extra_fields", {*self._extra_fields})
+        set_(
+            rez,
+            "_extra_fields_conversion_funcs",
+            {**self._extra_fields_conversion_funcs},
+        )
+        set_(rez, "_nested_resolvers", self._nested_resolvers.clone(owner=rez))
+        set_(rez, "_parent", None)
+        set_(rez, "_frozen", False)
+        set_(rez, "_compiled", None)
+        return rez
+
+    def copy(self: ThisResolverType) -> ThisResolverType:
+        return self.clone()
+
+    def with_vars(self: ThisResolverType, variables: VARS) -> ThisResolverType:
+        """a clone with new values for variables of the root filter or order by"""
+        var_names = {
+            *self._query_variables,
+            *tokenize(self._filter or "").names,
+            *tokenize(self._order_by or "").names,
+        }
+        if unknown_var_names := variables.keys() - var_names:
+            raise errors.ResolverException(
+                f"{self.__class__.__name__} does not use variables {unknown_var_names}."
             )
+        rez = self.clone()
+        rez._query_variables.update(variables)
+        rez._invalidate()
+        return rez
+
+    def tree_version(self) -> int:
+        return self._tree_version
 
     @property
     def model_name(self) -> str:
@@ -111,6 +336,7 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         # also do conflict nested later
         if not variables:
             return
+        self._assert_mutable()
         for key, val in variables.items():
             if key in self._query_variables:
                 if val is not self._query_variables[key]:
@@ -118,6 +344,7 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
                         f"Variable {key}, {val=} is already used."
                     )
             self._query_variables[key] = val
+        self._invalidate()
 
     def filter(
         self: ThisResolverType,
@@ -242,25 +469,63 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         self._limit = _
         return self
 
+    def parameterize_pagination(
+        self: ThisResolverType, parameterize: bool = True
+    ) -> ThisResolverType:
+        """sends limit and offset as query variables instead of inlining them,
+        so every page of a listing compiles to the same query text"""
+        self._parameterize_pagination = parameterize
+        return self
+
+    def compact_variables(
+        self: ThisResolverType, compact: bool = True
+    ) -> ThisResolverType:
+        """renames the variables of the final query to $v0, $v1... before sending it,
+        instead of the long prefixed names of nested resolvers"""
+        self._compact_variables = compact
+        return self
+
+    def binary(self: ThisResolverType, binary: bool = True) -> ThisResolverType:
+        """runs the queries of this resolver with the native codecs instead of json,
+        so nodes are built from UUID, datetime and Decimal values instead of strings"""
+        self._binary = binary
+        return self
+
+    def trusted(self: ThisResolverType, trusted: bool = True) -> ThisResolverType:
+        """builds the nodes of this resolver, and of its nested resolvers, from the database
+        response without validating them as pydantic models. Set
+        edge_orm.trusted_sampler.every to validate every nth node anyway"""
+        self._trusted = trusted
+        return self
+
+    def lazy(self: ThisResolverType, lazy: bool = True) -> ThisResolverType:
+        """keeps the nested edges of the nodes of this resolver as raw responses, parsed
+        the first time they are awaited, like await node.friends(). Saves the parsing, and
+        the memory, of the edges that are never read"""
+        self._lazy = lazy
+        return self
+
     def include_fields(
         self: ThisResolverType, *fields_to_include: str
     ) -> ThisResolverType:
-        self._fields_to_return.update(fields_to_include)
+        if not self._fields_to_return.issuperset(fields_to_include):
+            self._fields_to_return = self._fields_to_return.union(fields_to_include)
         return self
 
     def exclude_fields(
         self: ThisResolverType, *fields_to_exclude: str
     ) -> ThisResolverType:
-        self._fields_to_return = self._fields_to_return - set(fields_to_exclude)
+        if not self._fields_to_return.isdisjoint(fields_to_exclude):
+            self._fields_to_return = self._fields_to_return.difference(
+                fields_to_exclude
+            )
         return self
 
     def include_appendix_properties(self: ThisResolverType) -> ThisResolverType:
-        self._fields_to_return.update(self._node_config.appendix_properties)
-        return self
+        return self.include_fields(*self._node_config.appendix_properties)
 
     def include_computed_properties(self: ThisResolverType) -> ThisResolverType:
-        self._fields_to_return.update(self._node_config.computed_properties)
-        return self
+        return self.include_fields(*self._node_config.computed_properties)
 
     def extra_field(
         self: ThisResolverType,
@@ -269,69 +534,160 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         conversion_func: CONVERSION_FUNC | None = None,
     ) -> ThisResolverType:
         """extra fields do NOT take in variables"""
+        self._assert_mutable()
         extra_field_str = f"{field_name} := {expression}"
         self._extra_fields.add(extra_field_str)
         if conversion_func:
             self._extra_fields_conversion_funcs[field_name] = conversion_func
+        self._invalidate()
         return self
 
     """QUERY BUILDING METHODS"""
 
-    def _filter_str(self) -> str:
+    def _filter_str(self, prefix: str = "") -> str:
         if not self._filter:
             return ""
-        return f"FILTER {self._filter}"
+        return f"FILTER {tokenize(self._filter).render(prefix)}"
 
-    def _order_by_str(self) -> str:
+    def _order_by_str(self, prefix: str = "") -> str:
         if not self._order_by:
             return ""
-        return f"ORDER BY {self._order_by}"
+        return f"ORDER BY {tokenize(self._order_by).render(prefix)}"
 
-    def _limit_str(self) -> str:
+    def _limit_str(self, prefix: str = "", literal: bool = False) -> str:
         if not self._limit or self._limit == 0:
             return ""
+        if self._parameterize_pagination and not literal:
+            return f"LIMIT <int64>${helpers.prefixed(LIMIT_VARIABLE, prefix)}"
         return f"LIMIT {self._limit}"
 
-    def _offset_str(self) -> str:
+    def _offset_str(self, prefix: str = "", literal: bool = False) -> str:
         if not self._offset or self._offset == 0:
             return ""
+        if self._parameterize_pagination and not literal:
+            return f"OFFSET <int64>${helpers.prefixed(OFFSET_VARIABLE, prefix)}"
         return f"OFFSET {self._offset}"
 
-    def build_filters_str_and_vars(self, prefix: str) -> tuple[str, VARS]:
-        """Only returning the vars for THIS obj"""
+    def build_filters_str(self, prefix: str, literal: bool = False) -> str:
+        """filter and order by templates are tokenized once, so prefixing their variables
+        does not touch $ signs inside of string literals.
+        literal inlines limit and offset even when pagination is parameterized"""
         s_lst = [
-            self._filter_str(),
-            self._order_by_str(),
-            self._offset_str(),
-            self._limit_str(),
+            self._filter_str(prefix),
+            self._order_by_str(prefix),
+            self._offset_str(prefix, literal=literal),
+            self._limit_str(prefix, literal=literal),
         ]
-        s = " ".join([s for s in s_lst if s])
+        return " ".join([s for s in s_lst if s])
+
+    def _pagination_vars(self) -> VARS:
+        if not self._parameterize_pagination:
+            return {}
+        variables: VARS = {}
+        if self._offset:
+            variables[OFFSET_VARIABLE] = self._offset
+        if self._limit:
+            variables[LIMIT_VARIABLE] = self._limit
+        return variables
+
+    def build_filters_vars(self, prefix: str, variables: VARS | None = None) -> VARS:
+        """adds the prefixed vars of THIS obj to variables, if given"""
+        if variables is None:
+            variables = {}
         if prefix:
-            # regex out the vars to include this prefix
             new_prefix = f"{prefix}{helpers.SEPARATOR}"
-            new_s = s.replace("$", f"${new_prefix}")
-            new_vars = {f"{new_prefix}{k}": v for k, v in self._query_variables.items()}
-            return new_s, new_vars
+            for k, v in self._query_variables.items():
+                variables[f"{new_prefix}{k}"] = v
+            for k, v in self._pagination_vars().items():
+                variables[f"{new_prefix}{k}"] = v
         else:
-            return s, self._query_variables
+            variables.update(self._query_variables)
+            variables.update(self._pagination_vars())
+        return variables
 
-    def full_query_str_and_vars(
+    def build_filters_str_and_vars(self, prefix: str) -> tuple[str, VARS]:
+        """Only returning the vars for THIS obj"""
+        return self.build_filters_str(prefix=prefix), self.build_filters_vars(
+            prefix=prefix
+        )
+
+    def fingerprint(self) -> Fingerprint:
+        """cached until this resolver or anything nested in it changes.
+        Parameterized limits and offsets are part of the variables, not the shape"""
+        tree_version = self.tree_version()
+        if self._fingerprint is None or self._fingerprint_version != tree_version:
+            variables = {**self._query_variables, **self._pagination_vars()}
+            self._fingerprint = Fingerprint(
+                shape=(
+                    self.__class__,
+                    self.is_count,
+                    frozenset(self._fields_to_return),
+                    frozenset(self._extra_fields),
+                    self._filters_shape(),
+                ),
+                filters_str=self.build_filters_str(prefix="", literal=True),
+                variables=frozenset(
+                    (k, helpers.freeze(v)) for k, v in variables.items()
+                ),
+                conversion_funcs=frozenset(self._extra_fields_conversion_funcs),
+                nested=self._nested_resolvers.fingerprints(),
+            )
+            self._fingerprint_version = tree_version
+        return self._fingerprint
+
+    def _filters_shape(self) -> tuple[T.Any, ...]:
+        """what the filters add to the query text. Parameterized limits and offsets are
+        variables, so only whether they are set matters. Like None, 0 adds no clause"""
+        if self._parameterize_pagination:
+            return (
+                self._filter,
+                self._order_by,
+                True,
+                bool(self._limit),
+                bool(self._offset),
+            )
+        return (self._filter, self._order_by, False, self._limit, self._offset)
+
+    def shape_key_and_vars(
+        self,
+        prefix: str,
+        include_filters: bool = True,
+        variables: VARS | None = None,
+    ) -> tuple[tuple[T.Any, ...], VARS]:
+        """the structural key of this resolver tree: everything that changes the query text
+        but no variable values or rendered filters. Collects the vars of the tree in the same walk
+        """
+        if variables is None:
+            variables = {}
+        if include_filters:
+            self.build_filters_vars(prefix=prefix, variables=variables)
+        key = (
+            self.__class__,
+            self.is_count,
+            self._fields_to_return,
+            frozenset(self._extra_fields),
+            self._filters_shape(),
+            self._nested_resolvers.shape_key_and_vars(
+                prefix=prefix, variables=variables
+            ),
+        )
+        return key, variables
+
+    def shape_key(self) -> tuple[T.Any, ...]:
+        return self.shape_key_and_vars(prefix="")[0]
+
+    def full_query_str(
         self,
         include_select: bool,
         prefix: str,
         include_filters: bool = True,
         include_detached: bool = False,
-        check_for_intersecting_variables: bool = False,
         model_name_override: str = None,
-    ) -> tuple[str, VARS]:
-        self.merge()
+    ) -> str:
         model_name = model_name_override or self.model_name
         detached_str = f" DETACHED" if include_detached else ""
         select = f"SELECT{detached_str} {model_name} " if include_select else ""
-        (
-            nested_query_str,
-            nested_vars,
-        ) = self._nested_resolvers.build_query_str_and_vars(prefix=prefix)
+        nested_query_str = self._nested_resolvers.build_query_str(prefix=prefix)
         brackets_strs = [
             *sorted(self._fields_to_return),
             *sorted(self._extra_fields),
@@ -341,29 +697,103 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         s = f"{select}{{ {brackets_str} }}"
 
         if include_filters:
-            filters_str, query_vars = self.build_filters_str_and_vars(prefix=prefix)
+            filters_str = self.build_filters_str(prefix=prefix)
             if filters_str:
                 s += f" {filters_str}"
-        else:
-            query_vars = {}
+        return s
 
-        if check_for_intersecting_variables:
-            # this is unlikely to happen because of the separator and prefix but just for sanity you can do this
-            # if you do not have "__" in your variables this *is* impossible
-            if inters := (query_vars.keys() & nested_vars.keys()):
-                for var_name in inters:
-                    if query_vars[var_name] != nested_vars[var_name]:
-                        raise errors.ResolverException(
-                            f"Variable {var_name} was given multiple times with different values: "
-                            f"{query_vars[var_name]} != {nested_vars[var_name]}"
-                        )
+    def full_query_vars(
+        self,
+        prefix: str,
+        include_filters: bool = True,
+        check_for_intersecting_variables: bool = False,
+        variables: VARS | None = None,
+    ) -> VARS:
+        """collects the vars of the whole tree into one dict in a single pass"""
+        if variables is None:
+            variables = {}
+        if not check_for_intersecting_variables:
+            if include_filters:
+                self.build_filters_vars(prefix=prefix, variables=variables)
+            return self._nested_resolvers.build_vars(prefix=prefix, variables=variables)
+
+        nested_vars = self._nested_resolvers.build_vars(prefix=prefix)
+        query_vars = self.build_filters_vars(prefix=prefix) if include_filters else {}
+        # this is unlikely to happen because of the separator and prefix but just for sanity you can do this
+        # if you do not have "__" in your variables this *is* impossible
+        if inters := (query_vars.keys() & nested_vars.keys()):
+            for var_name in inters:
+                if query_vars[var_name] != nested_vars[var_name]:
+                    raise errors.ResolverException(
+                        f"Variable {var_name} was given multiple times with different values: "
+                        f"{query_vars[var_name]} != {nested_vars[var_name]}"
+                    )
+        variables.update(query_vars)
+        variables.update(nested_vars)
+        return variables
 
-        return s, {**query_vars, **nested_vars}
+    def full_query_str_and_vars(
+        self,
+        include_select: bool,
+        prefix: str,
+        include_filters: bool = True,
+        include_detached: bool = False,
+        check_for_intersecting_variables: bool = False,
+        model_name_override: str = None,
+    ) -> tuple[str, VARS]:
+        """compiled query strings are cached by shape, so on a hit only the variables are built.
+        Frozen resolvers also keep their own compiled strings and variables"""
+        compile_args = (
+            include_select,
+            prefix,
+            include_filters,
+            include_detached,
+            check_for_intersecting_variables,
+            model_name_override,
+        )
+        if self._compiled is not None and compile_args in self._compiled:
+            s, variables = self._compiled[compile_args]
+            return s, {**variables}
+        self.merge()
+        if check_for_intersecting_variables:
+            shape_key = self.shape_key()
+            variables = self.full_query_vars(
+                prefix=prefix,
+                include_filters=include_filters,
+                check_for_intersecting_variables=True,
+            )
+        else:
+            shape_key, variables = self.shape_key_and_vars(
+                prefix=prefix, include_filters=include_filters
+            )
+        cache_key = (
+            shape_key,
+            include_select,
+            prefix,
+            include_filters,
+            include_detached,
+            model_name_override,
+        )
+        cached = query_cache.get(cache_key)
+        if cached is None:
+            s = self.full_query_str(
+                include_select=include_select,
+                prefix=prefix,
+                include_filters=include_filters,
+                include_detached=include_detached,
+                model_name_override=model_name_override,
+            )
+            query_cache.set(cache_key, s)
+        else:
+            s = cached
+        if self._compiled is not None:
+            self._compiled[compile_args] = (s, {**variables})
+        return s, variables
 
     """MERGING LOGIC"""
 
     def build_hydrated_filters_str(self) -> str:
-        filters_str, _ = self.build_filters_str_and_vars(prefix="")
+        filters_str = self.build_filters_str(prefix="", literal=True)
         return helpers.replace_str_with_vars(
             s=filters_str, variables=self._query_variables
         )
@@ -371,6 +801,10 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
     def is_subset_of(self, other: "Resolver", should_debug: bool = False) -> bool:  # type: ignore
         if self is other:
             return True
+        self_fingerprint = self.fingerprint()
+        other_fingerprint = other.fingerprint()
+        if self_fingerprint == other_fingerprint:
+            return True
         if self._fields_to_return:
             self_additional_fields_to_return = (
                 self._fields_to_return - other._fields_to_return
@@ -403,8 +837,8 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
 
         # PROs of this... it should be very safe since you are comparing the actual VARS
         # cons, it could be overly restrictive. If one is called $start_time vs $startTime it will break...fine tho
-        self_filters_str, _ = self.build_filters_str_and_vars(prefix="")
-        other_filters_str, _ = other.build_filters_str_and_vars(prefix="")
+        self_filters_str = self_fingerprint.filters_str
+        other_filters_str = other_fingerprint.filters_str
         if self_filters_str != other_filters_str:
             if should_debug:
                 logger.debug(
@@ -422,6 +856,43 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
 
     """QUERY METHODS"""
 
+    async def _execute(
+        self,
+        *,
+        client: edgedb.AsyncIOClient | None,
+        query_str: str,
+        variables: VARS,
+        only_one: bool,
+        operation: Operation = Operation.QUERY,
+        raw: bool = False,
+    ) -> T.Any | None:
+        variable_names: dict[str, str] | None = None
+        if self._compact_variables:
+            query_str, variables, variable_names = compact_query_str_and_vars(
+                query_str=query_str, variables=variables
+            )
+        if operation is Operation.MUTATION:
+            mark_write()
+        return await execute.query(
+            client=client or self._client_for(operation),
+            query_str=query_str,
+            variables=variables,
+            only_one=only_one,
+            variable_names=variable_names,
+            binary=self._binary and not raw,
+            raw=raw,
+        )
+
+    @property
+    def sync(self) -> SyncResolver:
+        """the query and mutation methods of this resolver, run on EdgeConfig.sync_client"""
+        return SyncResolver(self)
+
+    def _client_for(self, operation: Operation) -> edgedb.AsyncIOClient:
+        if router := self._node_config.router:
+            return router.client_for(operation)
+        return self._node_config.client
+
     async def query(
         self, client: edgedb.AsyncIOClient | None = None
     ) -> T.List[NodeType]:
@@ -431,8 +902,8 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         with span.span(
             op=f"edgedb.query.{self.model_name}", description=query_str[:200]
         ):
-            raw_response = await execute.query(
-                client=client or self._node_config.client,
+            raw_response = await self._execute(
+                client=client,
                 query_str=query_str,
                 variables=variables,
                 only_one=False,
@@ -443,6 +914,73 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
             )
         return self.parse_obj_with_cache_list(raw_response)
 
+    async def query_raw(
+        self, client: edgedb.AsyncIOClient | None = None, *, decode: bool = False
+    ) -> str | RAW_RESP_MANY:
+        """the json text of query() as edgedb sends it, without loading it or building any
+        nodes, for responses that are relayed as they are. Its keys are the edgedb names,
+        created_at and not created_at_. decode=True loads it into dicts and lists instead
+        """
+        query_str, variables = self.full_query_str_and_vars(
+            include_select=True, prefix=""
+        )
+        with span.span(
+            op=f"edgedb.query_raw.{self.model_name}", description=query_str[:200]
+        ):
+            raw_response = await self._execute(
+                client=client,
+                query_str=query_str,
+                variables=variables,
+                only_one=False,
+                raw=True,
+            )
+        if not isinstance(raw_response, str):
+            raise errors.ResolverException(
+                f"Expected json text from {self.model_name}, got {raw_response}."
+            )
+        return orjson.loads(raw_response) if decode else raw_response
+
+    async def query_columns(
+        self,
+        *fields: str,
+        client: edgedb.AsyncIOClient | None = None,
+        numpy: bool | None = None,
+    ) -> columns.COLUMNS:
+        """the fields of every node this resolver queries as columns, without building any
+        nodes: a dict of lists, or of numpy arrays for numbers, bools and datetimes when
+        numpy is installed. Runs the same filters, order and pagination, but leaves the
+        nested resolvers and extra fields out of the shape"""
+        if not fields:
+            raise errors.ResolverException("Give at least one field to query_columns.")
+        if unknown_fields := set(fields) - self._node_field_aliases:
+            raise errors.ResolverException(
+                f"{unknown_fields} are not fields of {self.model_name}."
+            )
+        rez = self.clone()
+        rez._fields_to_return = frozenset(fields)
+        rez._extra_fields = set()
+        rez._extra_fields_conversion_funcs = {}
+        rez._nested_resolvers = NestedResolvers()
+        query_str, variables = rez.full_query_str_and_vars(
+            include_select=True, prefix=""
+        )
+        with span.span(
+            op=f"edgedb.query_columns.{self.model_name}", description=query_str[:200]
+        ):
+            raw_response = await rez._execute(
+                client=client,
+                query_str=query_str,
+                variables=variables,
+                only_one=False,
+            )
+        with span.span(op=f"columns.{self.model_name}"):
+            return columns.columns_from_rows(
+                raw_response or [],
+                fields,
+                conversion_map=self._node_config.node_edgedb_conversion_map,
+                use_numpy=numpy,
+            )
+
     async def query_first(
         self, client: edgedb.AsyncIOClient | None = None
     ) -> NodeType | None:
@@ -450,12 +988,78 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
             raise errors.ResolverException(
                 f"Limit is set to {self._limit} so you cannot query_first."
             )
-        self._limit = 1
-        model_lst = await self.query(client=client)
+        rez = self.clone() if self._frozen else self
+        rez._limit = 1
+        model_lst = await rez.query(client=client)
         if not model_lst:
             return None
         return model_lst[0]
 
+    def _keyset_templates(
+        self: ThisResolverType, *, batch_size: int, field_name: str
+    ) -> tuple[ThisResolverType, ThisResolverType]:
+        """frozen first and next page resolvers, so every page after the first is the
+        same compiled query with a new $__after"""
+        if self._order_by or self._limit or self._offset:
+            raise errors.ResolverException(
+                "iterate() orders and pages by its key, "
+                "so the resolver cannot have an order by, limit or offset."
+            )
+        if field_name not in self._node_config.exclusive_fields:
+            raise errors.ResolverException(
+                f"Field '{field_name}' is not exclusive, so it cannot be the key."
+            )
+        cast = self._node_config.node_edgedb_conversion_map[field_name].cast
+        first = self.clone().include_fields(field_name).parameterize_pagination()
+        first.order_by(f".{field_name} ASC").limit(batch_size)
+        after = first.clone()
+        if after._filter:
+            # an existing OR must not bind to the keyset filter
+            after._filter = f"({after._filter})"
+        after.filter(f".{field_name} > <{cast}>${AFTER_VARIABLE}")
+        return first.freeze(), after.freeze()
+
+    async def iterate(
+        self,
+        *,
+        batch_size: int = 1_000,
+        key: str = ".id",
+        prefetch: bool = True,
+        client: edgedb.AsyncIOClient | None = None,
+    ) -> T.AsyncIterator[NodeType]:
+        """async for node in resolver.iterate(): pages through every match by an exclusive
+        key, FILTER .key > $__after ORDER BY .key LIMIT batch_size, so no page needs an
+        OFFSET and at most two pages are in memory. With prefetch the next page is fetched
+        while the current one is consumed, so turn it off inside a transaction"""
+        field_name = key.removeprefix(".")
+        first, after = self._keyset_templates(
+            batch_size=batch_size, field_name=field_name
+        )
+        page_task: asyncio.Future[list[NodeType]] | None = None
+        try:
+            page = await first.query(client=client)
+            while page:
+                next_page = None
+                if len(page) == batch_size:
+                    next_page = after.with_vars(
+                        {AFTER_VARIABLE: getattr(page[-1], field_name)}
+                    )
+                    if prefetch:
+                        page_task = asyncio.ensure_future(
+                            next_page.query(client=client)
+                        )
+                for node in page:
+                    yield node
+                if next_page is None:
+                    return
+                if page_task is not None:
+                    page, page_task = await page_task, None
+                else:
+                    page = await next_page.query(client=client)
+        finally:
+            if page_task is not None:
+                page_task.cancel()
+
     async def count(self, client: edgedb.AsyncIOClient | None = None) -> int:
         query_str, variables = self.full_query_str_and_vars(
             include_select=False, prefix=""
@@ -465,8 +1069,8 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         with span.span(
             op=f"edgedb.query.{self.model_name}", description=query_str[:200]
         ):
-            c = await execute.query(
-                client=client or self._node_config.client,
+            c = await self._execute(
+                client=client,
                 query_str=query_str,
                 variables=variables,
                 only_one=True,
@@ -482,6 +1086,22 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         *,
         client: edgedb.AsyncIOClient | None = None,
     ) -> NodeType | None:
+        query_str, variables = self.build_get_str_and_vars(
+            field_name=field_name, value=value
+        )
+        with span.span(op=f"edgedb.get.{self.model_name}", description=query_str[:200]):
+            raw_response = await self._execute(
+                client=client,
+                query_str=query_str,
+                variables=variables,
+                only_one=True,
+            )
+
+        if not raw_response:
+            return None
+        return self.parse_obj_with_cache(raw_response)
+
+    def build_get_str_and_vars(self, field_name: str, value: T.Any) -> tuple[str, VARS]:
         self.validate_field_name_value_filters(
             operation_name="get", field_name=field_name, value=value
         )
@@ -490,17 +1110,62 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         )
         custom_filter_str = f"FILTER {self.filter_str_from_field_name(field_name)}"
         query_str += f" {custom_filter_str}"
-        with span.span(op=f"edgedb.get.{self.model_name}", description=query_str[:200]):
-            raw_response = await execute.query(
-                client=client or self._node_config.client,
+        return query_str, {**variables, field_name: value}
+
+    async def get_raw(
+        self,
+        *,
+        client: edgedb.AsyncIOClient | None = None,
+        decode: bool = False,
+        **kwargs: T.Any,
+    ) -> str | RAW_RESP_ONE | None:
+        """get by one exclusive field, like get_raw(id=...), as the json text edgedb sends,
+        "null" when there is no match. decode=True loads it into a dict or None instead
+        """
+        field_name, value = self._field_name_value_from_kwargs("get", kwargs)
+        query_str, variables = self.build_get_str_and_vars(
+            field_name=field_name, value=value
+        )
+        with span.span(
+            op=f"edgedb.get_raw.{self.model_name}", description=query_str[:200]
+        ):
+            raw_response = await self._execute(
+                client=client,
                 query_str=query_str,
-                variables={**variables, field_name: value},
+                variables=variables,
                 only_one=True,
+                raw=True,
+            )
+        if not isinstance(raw_response, str):
+            raise errors.ResolverException(
+                f"Expected json text from {self.model_name}, got {raw_response}."
             )
+        return orjson.loads(raw_response) if decode else raw_response
 
-        if not raw_response:
-            return None
-        return self.parse_obj_with_cache(raw_response)
+    def count_query(self) -> BatchQuery:
+        """the count of this resolver, to run in a batch"""
+        return BatchQuery(resolver=self, kind=BatchKind.COUNT)
+
+    def _field_name_value_from_kwargs(
+        self, operation_name: str, kwargs: dict[str, T.Any]
+    ) -> tuple[str, T.Any]:
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        if len(kwargs) != 1:
+            raise errors.ResolverException(
+                f"Must only give one argument, received {kwargs}."
+            )
+        field_name, value = list(kwargs.items())[0]
+        self.validate_field_name_value_filters(
+            operation_name=operation_name, field_name=field_name, value=value
+        )
+        return field_name, value
+
+    def get_query(self, **kwargs: T.Any) -> BatchQuery:
+        """get by one exclusive field, like get_query(id=...), to run in a batch"""
+        field_name, value = self._field_name_value_from_kwargs("get", kwargs)
+        return BatchQuery(
+            resolver=self, kind=BatchKind.ONE, field_name=field_name, value=value
+        )
 
     async def _gerror(
         self,
@@ -569,16 +1234,16 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
 
         return conflict_str, conflict_variables
 
-    async def insert_one(
+    def build_insert_str_and_vars(
         self,
         insert: InsertType,
         *,
-        client: edgedb.AsyncIOClient | None = None,
-        upsert_given_conflict_on: str = None,
-        custom_conflict_on_str: str = None,
-        return_model_for_conflict_on: str = None,
-        mutate_on_update: bool = True,
-    ) -> NodeType:
+        upsert_given_conflict_on: str | None,
+        custom_conflict_on_str: str | None,
+        return_model_for_conflict_on: str | None,
+        mutate_on_update: bool,
+    ) -> tuple[str, VARS]:
+        """the INSERT, without the select of the inserted model"""
         if existing_filter_str := self.has_filters():
             raise errors.ResolverException(
                 f"This resolver already has filters: {existing_filter_str}. "
@@ -598,26 +1263,63 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         )
         if conflict_str:
             insert_s += f" {conflict_str}"
+        return insert_s, {**insert_variables, **conflict_variables}
 
+    async def insert_one(
+        self,
+        insert: InsertType,
+        *,
+        client: edgedb.AsyncIOClient | None = None,
+        upsert_given_conflict_on: str = None,
+        custom_conflict_on_str: str = None,
+        return_model_for_conflict_on: str = None,
+        mutate_on_update: bool = True,
+    ) -> NodeType:
+        insert_s, insert_variables = self.build_insert_str_and_vars(
+            insert=insert,
+            upsert_given_conflict_on=upsert_given_conflict_on,
+            custom_conflict_on_str=custom_conflict_on_str,
+            return_model_for_conflict_on=return_model_for_conflict_on,
+            mutate_on_update=mutate_on_update,
+        )
         # do not need the prefix since any var HAS to be nested, so will already have prefixes
         select_s, select_variables = self.full_query_str_and_vars(
             prefix="", model_name_override="model", include_select=True
         )
         final_insert_s = f"WITH model := ({insert_s}) {select_s}"
         with span.span(op=f"edgedb.add.{self.model_name}"):
-            raw_response = await execute.query(
-                client=client or self._node_config.client,
+            raw_response = await self._execute(
+                client=client,
                 query_str=final_insert_s,
-                variables={
-                    **select_variables,
-                    **insert_variables,
-                    **conflict_variables,
-                },
+                variables={**select_variables, **insert_variables},
                 only_one=True,
+                operation=Operation.MUTATION,
             )
         raw_response = T.cast(RAW_RESP_ONE, raw_response)
         return self.parse_obj_with_cache(raw_response)
 
+    def insert_query(
+        self,
+        insert: InsertType,
+        *,
+        upsert_given_conflict_on: str = None,
+        custom_conflict_on_str: str = None,
+        return_model_for_conflict_on: str = None,
+        mutate_on_update: bool = True,
+    ) -> BatchQuery:
+        """insert_one, to run in a batch"""
+        return BatchQuery(
+            resolver=self,
+            kind=BatchKind.ONE,
+            mutation=self.build_insert_str_and_vars(
+                insert=insert,
+                upsert_given_conflict_on=upsert_given_conflict_on,
+                custom_conflict_on_str=custom_conflict_on_str,
+                return_model_for_conflict_on=return_model_for_conflict_on,
+                mutate_on_update=mutate_on_update,
+            ),
+        )
+
     async def insert_many(
         self, inserts: list[InsertType], *, client: edgedb.AsyncIOClient | None = None
     ) -> list[NodeType]:
@@ -656,15 +1358,16 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
                 """
         variables = {
             **select_variables,
-            "__data": json.dumps(encoders.jsonable_encoder(insert_vars_list)),
+            "__data": encoding.dumps(insert_vars_list),
         }
         # debug(variables)
         with span.span(op=f"edgedb.add_many.{self.model_name}"):
-            raw_response = await execute.query(
-                client=client or self._node_config.client,
+            raw_response = await self._execute(
+                client=client,
                 query_str=final_insert_str,
                 variables=variables,
                 only_one=False,
+                operation=Operation.MUTATION,
             )
         raw_response = T.cast(RAW_RESP_MANY, raw_response)
         return self.parse_obj_with_cache_list(raw_response)
@@ -684,16 +1387,16 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         mutate_on_update_str = ", ".join(mutate_on_update_strs)
         return mutate_on_update_str
 
-    async def _update(
+    def build_update_str_and_vars(
         self,
         patch: PatchType,
         *,
-        field_name: str = None,
+        field_name: str | None = None,
         value: T.Any = None,
         only_one: bool,
         mutate_on_update: bool,
-        client: edgedb.AsyncIOClient | None,
-    ) -> RAW_RESPONSE:
+    ) -> tuple[str, VARS]:
+        """the UPDATE, without the select of the updated models"""
         update_s, update_variables = utils.model_to_set_str_vars(
             model=patch,
             conversion_map=self._node_config.patch_edgedb_conversion_map,
@@ -713,6 +1416,25 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
             filters_vars[field_name] = value
 
         update_s = f"UPDATE {self.model_name} {filters_s} SET {update_s}"
+        return update_s, {**filters_vars, **update_variables}
+
+    async def _update(
+        self,
+        patch: PatchType,
+        *,
+        field_name: str = None,
+        value: T.Any = None,
+        only_one: bool,
+        mutate_on_update: bool,
+        client: edgedb.AsyncIOClient | None,
+    ) -> RAW_RESPONSE:
+        update_s, update_variables = self.build_update_str_and_vars(
+            patch=patch,
+            field_name=field_name,
+            value=value,
+            only_one=only_one,
+            mutate_on_update=mutate_on_update,
+        )
         select_s, select_variables = self.full_query_str_and_vars(
             prefix="",
             model_name_override="model",
@@ -721,11 +1443,12 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         )
         final_update_s = f"WITH model := ({update_s}) {select_s}"
         with span.span(op=f"edgedb.update.{self.model_name}"):
-            raw_response = await execute.query(
-                client=client or self._node_config.client,
+            raw_response = await self._execute(
+                client=client,
                 query_str=final_update_s,
-                variables={**select_variables, **filters_vars, **update_variables},
+                variables={**select_variables, **update_variables},
                 only_one=only_one,
+                operation=Operation.MUTATION,
             )
         raw_response = T.cast(RAW_RESPONSE, raw_response)
         return raw_response
@@ -753,8 +1476,7 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         client: edgedb.AsyncIOClient | None = None,
         mutate_on_update: bool = True,
     ) -> NodeType:
-        if not patch.set_fields_:
-            raise errors.ResolverException("Patch is empty.")
+        self.validate_update(patch)
         self.validate_field_name_value_filters(
             operation_name="update_one", field_name=field_name, value=value
         )
@@ -779,6 +1501,17 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         client: edgedb.AsyncIOClient | None = None,
         mutate_on_update: bool = True,
     ) -> list[NodeType]:
+        self.validate_update(patch, update_all=update_all)
+        raw_response = await self._update(
+            patch=patch,
+            only_one=False,
+            client=client,
+            mutate_on_update=mutate_on_update,
+        )
+        raw_response = T.cast(RAW_RESP_MANY, raw_response)
+        return self.parse_obj_with_cache_list(raw_response)
+
+    def validate_update(self, patch: PatchType, update_all: bool = True) -> None:
         if not patch.set_fields_:
             raise errors.ResolverException("Patch is empty.")
         if not update_all:
@@ -787,23 +1520,50 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
                     "You did not give filters which means this will update *all* models. "
                     "If this is your intention, pass update_all=True."
                 )
-        raw_response = await self._update(
-            patch=patch,
-            only_one=False,
-            client=client,
-            mutate_on_update=mutate_on_update,
+
+    def update_one_query(
+        self, patch: PatchType, *, mutate_on_update: bool = True, **kwargs: T.Any
+    ) -> BatchQuery:
+        """update by one exclusive field, like update_one_query(patch, id=...)"""
+        self.validate_update(patch)
+        field_name, value = self._field_name_value_from_kwargs("update_one", kwargs)
+        return BatchQuery(
+            resolver=self,
+            kind=BatchKind.ONE,
+            mutation=self.build_update_str_and_vars(
+                patch=patch,
+                field_name=field_name,
+                value=value,
+                only_one=True,
+                mutate_on_update=mutate_on_update,
+            ),
         )
-        raw_response = T.cast(RAW_RESP_MANY, raw_response)
-        return self.parse_obj_with_cache_list(raw_response)
 
-    async def _delete(
+    def update_many_query(
         self,
+        patch: PatchType,
         *,
-        field_name: str = None,
+        update_all: bool = False,
+        mutate_on_update: bool = True,
+    ) -> BatchQuery:
+        """update_many, to run in a batch"""
+        self.validate_update(patch, update_all=update_all)
+        return BatchQuery(
+            resolver=self,
+            kind=BatchKind.MANY,
+            mutation=self.build_update_str_and_vars(
+                patch=patch, only_one=False, mutate_on_update=mutate_on_update
+            ),
+        )
+
+    def build_delete_str_and_vars(
+        self,
+        *,
+        field_name: str | None = None,
         value: T.Any = None,
         only_one: bool,
-        client: edgedb.AsyncIOClient | None,
-    ) -> RAW_RESPONSE:
+    ) -> tuple[str, VARS]:
+        """the DELETE, without the select of the deleted models"""
         filters_s, filters_vars = self.build_filters_str_and_vars(prefix="")
 
         if only_one:
@@ -816,6 +1576,19 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
             filters_vars[field_name] = value
 
         delete_s = f"DELETE {self.model_name} {filters_s}"
+        return delete_s, filters_vars
+
+    async def _delete(
+        self,
+        *,
+        field_name: str = None,
+        value: T.Any = None,
+        only_one: bool,
+        client: edgedb.AsyncIOClient | None,
+    ) -> RAW_RESPONSE:
+        delete_s, filters_vars = self.build_delete_str_and_vars(
+            field_name=field_name, value=value, only_one=only_one
+        )
         select_s, select_variables = self.full_query_str_and_vars(
             prefix="",
             model_name_override="model",
@@ -824,11 +1597,12 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         )
         final_delete_s = f"WITH model := ({delete_s}) {select_s}"
         with span.span(op=f"edgedb.delete.{self.model_name}"):
-            raw_response = await execute.query(
-                client=client or self._node_config.client,
+            raw_response = await self._execute(
+                client=client,
                 query_str=final_delete_s,
                 variables={**select_variables, **filters_vars},
                 only_one=only_one,
+                operation=Operation.MUTATION,
             )
         raw_response = T.cast(RAW_RESPONSE, raw_response)
         return raw_response
@@ -857,15 +1631,38 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
         delete_all: bool = False,
         client: edgedb.AsyncIOClient | None = None,
     ) -> list[NodeType]:
+        self.validate_delete(delete_all=delete_all)
+        raw_response = await self._delete(only_one=False, client=client)
+        raw_response = T.cast(RAW_RESP_MANY, raw_response)
+        return self.parse_obj_with_cache_list(raw_response)
+
+    def validate_delete(self, delete_all: bool) -> None:
         if not delete_all:
             if not self.has_filters():
                 raise errors.ResolverException(
                     "You did not give filters which means this will delete *all* models. "
                     "If this is your intention, pass delete_all=True."
                 )
-        raw_response = await self._delete(only_one=False, client=client)
-        raw_response = T.cast(RAW_RESP_MANY, raw_response)
-        return self.parse_obj_with_cache_list(raw_response)
+
+    def delete_one_query(self, **kwargs: T.Any) -> BatchQuery:
+        """delete by one exclusive field, like delete_one_query(id=...)"""
+        field_name, value = self._field_name_value_from_kwargs("delete one", kwargs)
+        return BatchQuery(
+            resolver=self,
+            kind=BatchKind.ONE,
+            mutation=self.build_delete_str_and_vars(
+                field_name=field_name, value=value, only_one=True
+            ),
+        )
+
+    def delete_many_query(self, *, delete_all: bool = False) -> BatchQuery:
+        """delete_many, to run in a batch"""
+        self.validate_delete(delete_all=delete_all)
+        return BatchQuery(
+            resolver=self,
+            kind=BatchKind.MANY,
+            mutation=self.build_delete_str_and_vars(only_one=False),
+        )
 
     """HELPERS"""
 
@@ -884,43 +1681,73 @@ class Resolver(BaseModel, T.Generic[NodeType, InsertType, PatchType], metaclass=
 
     """PARSING"""
 
-    def _parse_obj_with_cache(self, d: RAW_RESP_ONE) -> NodeType:
+    def _parse_child(
+        self,
+        child: RAW_RESP_ONE | RAW_RESP_MANY | edgedb.Object | list[edgedb.Object],
+        trusted: bool = False,
+        lazy: bool = False,
+    ) -> NodeType | list[NodeType]:
+        if isinstance(child, list):
+            return [
+                self._parse_obj_with_cache(d, trusted=trusted, lazy=lazy) for d in child
+            ]
+        return self._parse_obj_with_cache(child, trusted=trusted, lazy=lazy)
+
+    def _parse_obj_with_cache(
+        self, d: RAW_RESP_ONE | edgedb.Object, trusted: bool = False, lazy: bool = False
+    ) -> NodeType:
         # TODO counts will fail, catch counts early
-        node = self._node_cls(**d)
-        # TODO speed test
-        fields_set = {re.sub(r"_$", "", s) for s in node.set_fields_}
-        other_fields = d.keys() - fields_set
-        for field_name in sorted(other_fields):
-            resolver = self._nested_resolvers.resolver_from_field_name(field_name)
-            if not resolver:
-                # must be an extra field
-                node.computed[field_name] = d[field_name]
-            else:
-                child = d[field_name]
-                if child:
-                    if isinstance(child, list):
-                        val = [resolver._parse_obj_with_cache(d) for d in child]
-                    elif isinstance(child, int):
-                        # counts
-                        val = child
+        if isinstance(d, edgedb.Object):
+            d = dict_from_object(d, json_fields=self._json_fields)
+        if trusted:
+            node = trusted_sampler.construct(self._node_cls, d)
+        else:
+            node = self._node_cls(**d)
+        other_keys = d.keys() - self._node_field_aliases
+        if other_keys:
+            edges, edge_keys = self._nested_resolvers.parse_plan()
+            for key, edge_name, resolver in edges:
+                if key not in other_keys:
+                    continue
+                val = d[key]
+                # counts are ints
+                if val and not isinstance(val, int):
+                    if lazy:
+                        val = Lazy(
+                            functools.partial(
+                                resolver._parse_child, trusted=trusted, lazy=lazy
+                            ),
+                            val,
+                        )
                     else:
-                        val = resolver._parse_obj_with_cache(child)
-                else:
-                    val = child
-                edge_name = field_name.split(helpers.SEPARATOR)[0]
+                        val = resolver._parse_child(val, trusted=trusted)
                 node._cache.add(edge=edge_name, resolver=resolver, val=val)
+            for key in other_keys - edge_keys:
+                # must be an extra field
+                node.computed[key] = d[key]
         node._used_resolver = self
         return node
 
     def parse_obj_with_cache(self, d: RAW_RESP_ONE) -> NodeType:
         with span.span(op=f"parse.{self.model_name}"):
-            return self._parse_obj_with_cache(d)
+            return self._parse_obj_with_cache(d, trusted=self._trusted, lazy=self._lazy)
 
     def parse_obj_with_cache_list(self, lst: RAW_RESP_MANY) -> list[NodeType]:
         with span.span(op=f"parse_list.{self.model_name}", description=f"{len(lst)}"):
-            return [self._parse_obj_with_cache(d) for d in lst]
+            return [
+                self._parse_obj_with_cache(d, trusted=self._trusted, lazy=self._lazy)
+                for d in lst
+            ]
 
     """merge"""
 
     def merge(self) -> None:
+        """merges the nested resolvers, unless nothing in the tree changed since the last merge"""
+        if self._merged_tree_version == self.tree_version():
+            return
         self._nested_resolvers = merge_nested_resolver(self._nested_resolvers)
+        # resolvers created by merging have not merged their own nested resolvers yet
+        for resolvers in self._nested_resolvers.d.values():
+            for r in resolvers:
+                r.merge()
+        self._merged_tree_version = self.tree_version()
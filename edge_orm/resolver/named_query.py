@@ -0,0 +1,147 @@
+import typing as T
+import edgedb
+from edge_orm.node import Node
+from edge_orm import execute, span, helpers
+from edge_orm.routing import Operation
+from . import errors
+from .template import tokenize
+from .nested_resolvers import NestedResolvers
+
+if T.TYPE_CHECKING:
+    from .model import Resolver, VARS
+
+NodeType = T.TypeVar("NodeType", bound=Node)
+
+
+class NamedQuery(T.Generic[NodeType]):
+    """a query declared in the types generator config, so calling it only binds the
+    variables and parses the response. The resolver is built, frozen and compiled to a
+    fixed query string once, on first use. The string needs the generated node classes,
+    so it is compiled here rather than by the generator; check() every query in
+    NAMED_QUERIES at startup to compile them all up front.
+    variable_names are the arguments of the query, as written in the filters. A nested
+    filter's $min_age is sent as $friends__min_age, and an argument used by several
+    filters is sent to all of them. Values given in the resolver are bound to it"""
+
+    __slots__ = (
+        "name",
+        "variable_names",
+        "_build_resolver",
+        "_resolver",
+        "_query_str",
+        "_bound_variables",
+        "_variable_paths",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        variable_names: tuple[str, ...] = (),
+        build_resolver: T.Callable[[], "Resolver[NodeType, T.Any, T.Any]"],
+    ) -> None:
+        self.name = name
+        self.variable_names = variable_names
+        self._build_resolver = build_resolver
+        self._resolver: "Resolver[NodeType, T.Any, T.Any] | None" = None
+        self._query_str: str | None = None
+        self._bound_variables: "VARS" = {}
+        # argument -> the prefixed variables of the query it is sent as
+        self._variable_paths: dict[str, tuple[str, ...]] = {}
+
+    def __repr__(self) -> str:
+        return f"NamedQuery({self.name!r})"
+
+    @property
+    def resolver(self) -> "Resolver[NodeType, T.Any, T.Any]":
+        if self._resolver is None:
+            self._resolver = self._build_resolver().freeze()
+        return self._resolver
+
+    @property
+    def query_str(self) -> str:
+        if self._query_str is None:
+            query_str, bound_variables = self.resolver.full_query_str_and_vars(
+                include_select=True, prefix=""
+            )
+            self._bound_variables = bound_variables
+            query_names = set(tokenize(query_str).names) - bound_variables.keys()
+            paths: dict[str, list[str]] = {}
+            for name, path in dict.fromkeys(variable_paths(self.resolver)):
+                if path in query_names:
+                    paths.setdefault(name, []).append(path)
+            self._variable_paths = {k: tuple(v) for k, v in paths.items()}
+            self._query_str = query_str
+        return self._query_str
+
+    def check(self) -> None:
+        """raises if the variables of the compiled query are not the declared ones
+        plus the bound ones, for example when the config and the resolver disagree"""
+        unbound = set(tokenize(self.query_str).names) - self._bound_variables.keys()
+        sent = {path for paths in self._variable_paths.values() for path in paths}
+        undeclared = {
+            name for name in self._variable_paths if name not in self.variable_names
+        } | (unbound - sent)
+        if undeclared:
+            raise errors.ResolverException(
+                f"Named query {self.name} does not declare variables {undeclared}."
+            )
+        if unknown := set(self.variable_names) - self._variable_paths.keys():
+            raise errors.ResolverException(
+                f"Named query {self.name} has no variables {unknown}."
+            )
+
+    async def _execute(
+        self, *, variables: "VARS", client: edgedb.AsyncIOClient | None, only_one: bool
+    ) -> T.Any:
+        query_str = self.query_str
+        with span.span(op=f"edgedb.named_query.{self.name}"):
+            return await execute.query(
+                client=client or self.resolver._client_for(Operation.QUERY),
+                query_str=query_str,
+                variables={
+                    **self._bound_variables,
+                    **{
+                        path: value
+                        for name, value in variables.items()
+                        for path in self._variable_paths.get(name, (name,))
+                    },
+                },
+                only_one=only_one,
+            )
+
+    async def query_many(
+        self, *, variables: "VARS", client: edgedb.AsyncIOClient | None = None
+    ) -> list[NodeType]:
+        raw_response = await self._execute(
+            variables=variables, client=client, only_one=False
+        )
+        if not isinstance(raw_response, list):
+            raise errors.ResolverException(
+                f"Expected a list from named query {self.name}, got {raw_response}."
+            )
+        return self.resolver.parse_obj_with_cache_list(raw_response)
+
+    async def query_one(
+        self, *, variables: "VARS", client: edgedb.AsyncIOClient | None = None
+    ) -> NodeType | None:
+        raw_response = await self._execute(
+            variables=variables, client=client, only_one=True
+        )
+        if not raw_response:
+            return None
+        return self.resolver.parse_obj_with_cache(raw_response)
+
+
+def variable_paths(
+    resolver: "Resolver[T.Any, T.Any, T.Any]", prefix: str = ""
+) -> T.Iterator[tuple[str, str]]:
+    """(name in the filter, prefixed name in the query) of every variable of the tree"""
+    for s in (resolver._filter, resolver._order_by):
+        if s:
+            for name in tokenize(s).names:
+                yield name, helpers.prefixed(name, prefix)
+    for edge, resolvers in resolver._nested_resolvers.d.items():
+        for i, r in enumerate(resolvers):
+            _, new_prefix = NestedResolvers.key_name_and_prefix(edge, i, prefix)
+            yield from variable_paths(r, new_prefix)
@@ -1,18 +1,33 @@
 import typing as T
-from pydantic import BaseModel
 from edge_orm import helpers
 from edge_orm.types_generator.main import COUNT_POSTFIX
+from .errors import ResolverException
 
 if T.TYPE_CHECKING:
     from .model import Resolver, VARS
+    from .fingerprint import Fingerprint
 
 ResolverType = T.TypeVar("ResolverType", bound="Resolver")
+# (key in the response, edge, resolver) of every nested resolver
+PARSE_EDGES = tuple[tuple[str, str, "Resolver"], ...]  # type: ignore
 
 
-class NestedResolvers(BaseModel):
-    d: dict[str, list[T.Any]] = {}
+class NestedResolvers:
+    __slots__ = ("d", "_version", "_owner", "_frozen", "_parse_plan")
 
-    def get(self, edge: str) -> list[ResolverType]:
+    def __init__(
+        self,
+        d: dict[str, list[T.Any]] | None = None,
+        owner: T.Optional["Resolver"] = None,  # type: ignore
+    ) -> None:
+        self.d: dict[str, list[T.Any]] = {} if d is None else d
+        self._version = helpers.next_version()
+        # the resolver these are nested in, whose tree version changes with them
+        self._owner = owner
+        self._frozen = False
+        self._parse_plan: tuple[int, PARSE_EDGES, frozenset[str]] | None = None
+
+    def get(self, edge: str) -> list[T.Any]:
         return self.d.get(edge, [])
 
     def has(self, edge: str) -> bool:
@@ -28,6 +43,13 @@ class NestedResolvers(BaseModel):
     ) -> None:
         from .merging import merge_resolvers
 
+        if self._frozen:
+            raise ResolverException(
+                f"Cannot add {edge} to a frozen resolver, clone() it to change it."
+            )
+        self._version = helpers.next_version()
+        if self._owner is not None:
+            self._owner._bump_tree_version(self._version)
         if not self.has(edge):
             self.d[edge] = []
 
@@ -39,6 +61,7 @@ class NestedResolvers(BaseModel):
                 if has_merged is False and (
                     merged_r := merge_resolvers(resolver, existing_r)
                 ):
+                    self.adopt(merged_r)
                     new_resolvers.append(merged_r)
                     has_merged = True
                 else:
@@ -47,13 +70,25 @@ class NestedResolvers(BaseModel):
             if has_merged is True:
                 return
 
+        self.adopt(resolver)
         if make_first:
             self.d[edge].insert(0, resolver)
         else:
             self.d[edge].append(resolver)
 
+    def adopt(self, resolver: ResolverType) -> None:
+        """changes to resolver now bump the tree version of the owner of these.
+        A resolver only has one parent, the nested resolvers it was added to last"""
+        if not resolver.is_frozen:
+            resolver._parent = self
+
+    def adopt_all(self) -> None:
+        for resolvers in self.d.values():
+            for r in resolvers:
+                self.adopt(r)
+
     def has_subset(self, edge: str, resolver: ResolverType) -> bool:
-        for r in self.get(edge):  # type: ignore
+        for r in self.get(edge):
             if resolver.is_subset_of(r):
                 return True
         return False
@@ -65,56 +100,109 @@ class NestedResolvers(BaseModel):
                     return False
         return True
 
-    def edge_to_query_str_and_vars(self, edge: str, prefix: str) -> tuple[str, "VARS"]:
+    @staticmethod
+    def key_name_and_prefix(edge: str, index: int, prefix: str) -> tuple[str, str]:
+        key_name = edge if index == 0 else f"{edge}{helpers.SEPARATOR}{index}"
+        new_prefix = f"{prefix}{helpers.SEPARATOR}{key_name}" if prefix else key_name
+        return key_name, new_prefix
+
+    def edge_to_query_str(self, edge: str, prefix: str) -> str:
         resolvers: list["Resolver"] = self.get(edge)
         resolvers_str = []
-        vars_lst = []
         for i, r in enumerate(resolvers):
-            if i == 0:
-                new_prefix = f"{prefix}{helpers.SEPARATOR}{edge}" if prefix else edge
-                if r.is_count and COUNT_POSTFIX in edge:
-                    # avoid not copying resolver and having it break. make SURE it is a count
-                    filters_str, variables = r.build_filters_str_and_vars(
-                        prefix=new_prefix
-                    )
-                    resolver_s = f"{edge} := count((SELECT .{edge.split(COUNT_POSTFIX)[0]} {filters_str}))"
-                else:
-                    filters_str, variables = r.full_query_str_and_vars(
-                        include_select=False, prefix=new_prefix
-                    )
-                    resolver_s = f"{edge}: {filters_str}"
+            key_name, new_prefix = self.key_name_and_prefix(edge, i, prefix)
+            if r.is_count and COUNT_POSTFIX in edge:
+                # avoid not copying resolver and having it break. make SURE it is a count
+                filters_str = r.build_filters_str(prefix=new_prefix)
+                resolver_s = f"{key_name} := count((SELECT .{edge.split(COUNT_POSTFIX)[0]} {filters_str}))"
             else:
-                key_name = f"{edge}{helpers.SEPARATOR}{i}"
-                new_prefix = (
-                    f"{prefix}{helpers.SEPARATOR}{key_name}" if prefix else key_name
-                )
-                if r.is_count and COUNT_POSTFIX in edge:
-                    filters_str, variables = r.build_filters_str_and_vars(
-                        prefix=new_prefix
-                    )
-                    resolver_s = f"{key_name} := count((SELECT .{edge.split(COUNT_POSTFIX)[0]} {filters_str}))"
+                filters_str = r.full_query_str(include_select=False, prefix=new_prefix)
+                if i == 0:
+                    resolver_s = f"{edge}: {filters_str}"
                 else:
-                    filters_str, variables = r.full_query_str_and_vars(
-                        include_select=False, prefix=new_prefix
-                    )
                     resolver_s = f"{key_name} := (SELECT .{edge} {filters_str})"
             resolvers_str.append(resolver_s)
-            vars_lst.append(variables)
-        flattened_d = {k: v for d in vars_lst for k, v in d.items()}
-        return ", ".join(resolvers_str), flattened_d
+        return ", ".join(resolvers_str)
+
+    def edge_to_vars(
+        self, edge: str, prefix: str, variables: T.Optional["VARS"] = None
+    ) -> "VARS":
+        if variables is None:
+            variables = {}
+        for i, r in enumerate(self.get(edge)):
+            _, new_prefix = self.key_name_and_prefix(edge, i, prefix)
+            if r.is_count and COUNT_POSTFIX in edge:
+                r.build_filters_vars(prefix=new_prefix, variables=variables)
+            else:
+                r.full_query_vars(prefix=new_prefix, variables=variables)
+        return variables
 
-    def build_query_str_and_vars(self, prefix: str) -> tuple[str, "VARS"]:
-        edge_strs: list[str] = []
-        vars_lst: list["VARS"] = []
-        keys = self.d.keys()
-        for i, edge in enumerate(keys):
-            s, v = self.edge_to_query_str_and_vars(edge=edge, prefix=prefix)
-            edge_strs.append(s)
-            vars_lst.append(v)
+    def edge_to_query_str_and_vars(self, edge: str, prefix: str) -> tuple[str, "VARS"]:
+        return self.edge_to_query_str(edge=edge, prefix=prefix), self.edge_to_vars(
+            edge=edge, prefix=prefix
+        )
+
+    def build_query_str(self, prefix: str) -> str:
+        edge_strs = [
+            self.edge_to_query_str(edge=edge, prefix=prefix) for edge in self.d.keys()
+        ]
         edge_strs.sort()
-        s = ", ".join(edge_strs)
-        flattened_d = {k: v for d in vars_lst for k, v in d.items()}
-        return s, flattened_d
+        return ", ".join(edge_strs)
+
+    def build_vars(self, prefix: str, variables: T.Optional["VARS"] = None) -> "VARS":
+        if variables is None:
+            variables = {}
+        for edge in self.d.keys():
+            self.edge_to_vars(edge=edge, prefix=prefix, variables=variables)
+        return variables
+
+    def build_query_str_and_vars(self, prefix: str) -> tuple[str, "VARS"]:
+        return self.build_query_str(prefix=prefix), self.build_vars(prefix=prefix)
+
+    def shape_key_and_vars(
+        self, prefix: str, variables: "VARS"
+    ) -> tuple[tuple[str, tuple[tuple[T.Any, ...], ...]], ...]:
+        """the structural keys of the nested resolvers, adding their vars to variables"""
+        keys = []
+        for edge, resolvers in self.d.items():
+            edge_keys = []
+            for i, r in enumerate(resolvers):
+                _, new_prefix = self.key_name_and_prefix(edge, i, prefix)
+                if r.is_count and COUNT_POSTFIX in edge:
+                    r.build_filters_vars(prefix=new_prefix, variables=variables)
+                    edge_keys.append((True, r._filters_shape()))
+                else:
+                    key, _ = r.shape_key_and_vars(
+                        prefix=new_prefix, variables=variables
+                    )
+                    edge_keys.append(key)
+            keys.append((edge, tuple(edge_keys)))
+        return tuple(keys)
+
+    def fingerprints(self) -> tuple[tuple[str, tuple["Fingerprint", ...]], ...]:
+        return tuple(
+            (edge, tuple(r.fingerprint() for r in resolvers))
+            for edge, resolvers in self.d.items()
+        )
+
+    def parse_plan(self) -> tuple[PARSE_EDGES, frozenset[str]]:
+        """the nested resolvers by their key in the response, sorted so edge__1 comes after
+        edge in the cache, and the set of those keys. Built once per version"""
+        if self._parse_plan is None or self._parse_plan[0] != self._version:
+            edges = sorted(
+                (
+                    (self.key_name_and_prefix(edge, i, "")[0], edge, r)
+                    for edge, resolvers in self.d.items()
+                    for i, r in enumerate(resolvers)
+                ),
+                key=lambda edge: edge[0],
+            )
+            self._parse_plan = (
+                self._version,
+                tuple(edges),
+                frozenset(key for key, _, _ in edges),
+            )
+        return self._parse_plan[1], self._parse_plan[2]
 
     def resolver_from_field_name(self, field_name: str) -> ResolverType | None:
         possible_edge = field_name.split(helpers.SEPARATOR)[0]
@@ -129,6 +217,25 @@ class NestedResolvers(BaseModel):
         except (IndexError, ValueError):
             return None
 
+    def freeze(self) -> None:
+        for resolvers in self.d.values():
+            for r in resolvers:
+                r.freeze()
+        self._frozen = True
+
+    def clone(self, owner: T.Optional["Resolver"] = None) -> "NestedResolvers":  # type: ignore
+        """frozen resolvers are shared, the rest are cloned"""
+        nested_resolvers = NestedResolvers(
+            {
+                edge: [r if r.is_frozen else r.clone() for r in resolvers]
+                for edge, resolvers in self.d.items()
+            },
+            owner=owner,
+        )
+        nested_resolvers._version = self._version
+        nested_resolvers.adopt_all()
+        return nested_resolvers
+
     """MERGE"""
 
     def merge(self) -> "NestedResolvers":
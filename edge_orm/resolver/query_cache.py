@@ -0,0 +1,66 @@
+import typing as T
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 1_024
+
+
+class QueryCacheInfo(T.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class QueryCache:
+    """process-wide LRU of compiled query strings, keyed by the structural shape of a resolver tree.
+    Variable values are never part of the key, so they must be bound separately on every call."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._d: OrderedDict[T.Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: T.Hashable) -> str | None:
+        with self._lock:
+            query_str = self._d.get(key)
+            if query_str is None:
+                self.misses += 1
+                return None
+            self._d.move_to_end(key)
+            self.hits += 1
+            return query_str
+
+    def set(self, key: T.Hashable, query_str: str) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._d[key] = query_str
+            self._d.move_to_end(key)
+            while len(self._d) > self.maxsize:
+                self._d.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._d) > max(maxsize, 0):
+                self._d.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._d.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> QueryCacheInfo:
+        return QueryCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._d),
+        )
+
+
+query_cache = QueryCache()
@@ -0,0 +1,77 @@
+import typing as T
+import inspect
+import edgedb
+from edge_orm.execute import SyncClient
+from . import errors
+
+if T.TYPE_CHECKING:
+    from .model import Resolver
+
+ReturnType = T.TypeVar("ReturnType")
+
+
+def run_sync(coro: T.Coroutine[T.Any, T.Any, ReturnType]) -> ReturnType:
+    """runs a coroutine that never suspends, like the resolver methods on a SyncClient,
+    to completion without an event loop"""
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    coro.close()
+    raise errors.ResolverException(
+        "The coroutine waited on something asynchronous, so it cannot run synchronously."
+    )
+
+
+def iterate_sync(agen: T.AsyncIterator[ReturnType]) -> T.Iterator[ReturnType]:
+    while True:
+        try:
+            yield run_sync(agen.__anext__())  # type: ignore
+        except StopAsyncIteration:
+            return
+
+
+class SyncResolver:
+    """resolver.sync: the async methods of the resolver, like query(), get(...) or
+    insert_one(...), run to completion on a blocking edgedb.Client without an event loop.
+    They share the compile and parse pipeline of the async methods.
+    Safe to use from a thread pool as long as threads do not share unfrozen resolvers"""
+
+    __slots__ = ("_resolver",)
+
+    def __init__(self, resolver: "Resolver") -> None:  # type: ignore
+        self._resolver = resolver
+
+    def _client(self, client: edgedb.Client | None) -> SyncClient:
+        client = client or self._resolver._node_config.sync_client
+        if client is None:
+            raise errors.ResolverException(
+                f"{self._resolver.model_name} has no sync_client in its EdgeConfig, "
+                "pass in a client."
+            )
+        return SyncClient(client)
+
+    def __getattr__(self, name: str) -> T.Callable[..., T.Any]:
+        method = getattr(self._resolver, name)
+        if inspect.isasyncgenfunction(method):
+
+            def iterate(
+                *args: T.Any, client: edgedb.Client | None = None, **kwargs: T.Any
+            ) -> T.Iterator[T.Any]:
+                if kwargs.get("prefetch"):
+                    raise errors.ResolverException("Sync iteration cannot prefetch.")
+                kwargs["prefetch"] = False
+                return iterate_sync(
+                    method(*args, client=self._client(client), **kwargs)
+                )
+
+            return iterate
+        if inspect.iscoroutinefunction(method):
+
+            def call(
+                *args: T.Any, client: edgedb.Client | None = None, **kwargs: T.Any
+            ) -> T.Any:
+                return run_sync(method(*args, client=self._client(client), **kwargs))
+
+            return call
+        raise AttributeError(f"{name} is not an async method of {self._resolver}.")
@@ -0,0 +1,127 @@
+import typing as T
+from functools import lru_cache
+from edge_orm import helpers
+from .errors import ResolverException
+
+QUOTES = {"'", '"', "`"}
+
+
+class Template:
+    """EdgeQL text split into literal segments and the query variables between them,
+    so prefixing the variables is a single join instead of a string replace.
+    len(literals) is always len(names) + 1"""
+
+    __slots__ = ("literals", "names")
+
+    def __init__(self, literals: tuple[str, ...], names: tuple[str, ...]) -> None:
+        self.literals = literals
+        self.names = names
+
+    def render(self, prefix: str = "") -> str:
+        if not self.names:
+            return self.literals[0]
+        var_prefix = f"${prefix}{helpers.SEPARATOR}" if prefix else "$"
+        parts = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            parts.append(var_prefix)
+            parts.append(name)
+            parts.append(literal)
+        return "".join(parts)
+
+
+def _is_ident_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _end_of_quoted(s: str, start: int) -> int:
+    """index just past the string literal that starts at s[start]"""
+    quote = s[start]
+    is_raw = (
+        quote != "`"
+        and start > 0
+        and s[start - 1] == "r"
+        and (start < 2 or not _is_ident_char(s[start - 2]))
+    )
+    i = start + 1
+    while i < len(s):
+        c = s[i]
+        if c == "\\" and not is_raw and quote != "`":
+            i += 2
+            continue
+        if c == quote:
+            return i + 1
+        i += 1
+    return len(s)
+
+
+def _tokenize(s: str) -> Template:
+    literals: list[str] = []
+    names: list[str] = []
+    literal_start = 0
+    i = 0
+    n = len(s)
+    while i < n:
+        c = s[i]
+        if c in QUOTES:
+            i = _end_of_quoted(s, i)
+        elif c == "#":
+            newline = s.find("\n", i)
+            i = n if newline == -1 else newline
+        elif c == "$":
+            j = i + 1
+            while j < n and _is_ident_char(s[j]):
+                j += 1
+            if j < n and s[j] == "$":
+                # dollar-quoted string: $$...$$ or $tag$...$tag$
+                tag = s[i : j + 1]
+                end = s.find(tag, j + 1)
+                i = n if end == -1 else end + len(tag)
+            elif j > i + 1:
+                literals.append(s[literal_start:i])
+                names.append(s[i + 1 : j])
+                literal_start = i = j
+            else:
+                i += 1
+        else:
+            i += 1
+    literals.append(s[literal_start:])
+    return Template(literals=tuple(literals), names=tuple(names))
+
+
+@lru_cache(maxsize=4_096)
+def tokenize(s: str) -> Template:
+    """finds the $variables in s, skipping string literals, dollar-quoted strings and comments"""
+    return _tokenize(s)
+
+
+@lru_cache(maxsize=1_024)
+def compact(s: str) -> tuple[str, tuple[str, ...]]:
+    """renames the variables of a whole query to $v0, $v1... in order of first appearance.
+    Returns the new text and the original names, where names[i] is now $v{i}"""
+    template = _tokenize(s)
+    index: dict[str, int] = {}
+    for name in template.names:
+        index.setdefault(name, len(index))
+    compact_names = tuple(f"v{index[name]}" for name in template.names)
+    return Template(literals=template.literals, names=compact_names).render(), tuple(
+        index
+    )
+
+
+def compact_query_str_and_vars(
+    query_str: str, variables: dict[str, T.Any]
+) -> tuple[str, dict[str, T.Any], dict[str, str]]:
+    """only for finished queries, two compacted pieces cannot be joined together.
+    The last item maps each short name back to the original, for debugging"""
+    compact_str, names = compact(query_str)
+    missing = [name for name in names if name not in variables]
+    if missing:
+        raise ResolverException(f"Missing variables for ${', $'.join(missing)}.")
+    compact_vars = {f"v{i}": variables[name] for i, name in enumerate(names)}
+    variable_names = {f"v{i}": name for i, name in enumerate(names)}
+    return compact_str, compact_vars, variable_names
+
+
+def prefix_variables(s: str, prefix: str) -> str:
+    """renames every $var in s to $<prefix>__var"""
+    return tokenize(s).render(prefix)
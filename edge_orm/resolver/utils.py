@@ -1,10 +1,8 @@
 import typing as T
-import json
 from enum import Enum
 from pydantic import BaseModel
-from edge_orm.external import encoders
 from edge_orm.node.models import Insert, Patch, CONVERSION_MAP, FieldInfo
-from edge_orm.resolver import errors, enums
+from edge_orm.resolver import errors, enums, encoding
 
 if T.TYPE_CHECKING:
     from .model import VARS
@@ -25,9 +23,9 @@ def line_var_from_field_info(
     field_str = f"{field_name} := <{type_cast}>{var_field_name}"
     if isinstance(val, (dict, list)):
         if type_cast.endswith("::str") or type_cast.endswith("::json"):
-            val = json.dumps(encoders.jsonable_encoder(val))
+            val = encoding.dumps(val)
     elif isinstance(val, BaseModel):
-        val = val.json()
+        val = encoding.dumps_model(val)
     elif isinstance(val, set):
         val = list(val)
         field_str = (
@@ -73,7 +71,8 @@ def model_to_set_str_vars(
     additional_link_str: str | None = None,
 ) -> tuple[str, "VARS"]:
     """takes in a model dictionary and returns a string that represents a mutation with this dictionary
-    eg: {"name": "Jeremy Berman", "age": UNSET, "last_updated": 2022...} -> { name := <str>$name, age := <int>{}, ...}"""
+    eg: {"name": "Jeremy Berman", "age": UNSET, "last_updated": 2022...} -> { name := <str>$name, age := <int>{}, ...}
+    """
     str_lst: list[str] = []
     variables: VARS = {}
     for field_name in model.set_fields_:
@@ -0,0 +1,59 @@
+import typing as T
+import itertools
+import contextlib
+from contextvars import ContextVar
+from enum import Enum
+from edgedb import AsyncIOClient
+
+
+class Operation(str, Enum):
+    QUERY = "query"
+    MUTATION = "mutation"
+
+
+class _Writes:
+    __slots__ = ("wrote",)
+
+    def __init__(self) -> None:
+        self.wrote = False
+
+
+_writes: ContextVar[_Writes | None] = ContextVar("edge_orm_writes", default=None)
+
+
+@contextlib.contextmanager
+def read_your_writes() -> T.Iterator[None]:
+    """wrap a request in this so that, once it has mutated anything, its reads go to the
+    primary too and see the write instead of a replica that may lag behind"""
+    token = _writes.set(_Writes())
+    try:
+        yield
+    finally:
+        _writes.reset(token)
+
+
+def mark_write() -> None:
+    """records a mutation in the current read_your_writes() context, whichever client ran it"""
+    writes = _writes.get()
+    if writes is not None:
+        writes.wrote = True
+
+
+class ClientRouter:
+    """picks a client per operation: mutations go to the primary and queries go
+    round-robin to the replicas. Set it as EdgeConfig.router, client= still wins"""
+
+    def __init__(
+        self, *, primary: AsyncIOClient, replicas: T.Sequence[AsyncIOClient] = ()
+    ) -> None:
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self._replicas_cycle = itertools.cycle(self.replicas)
+
+    def client_for(self, operation: Operation) -> AsyncIOClient:
+        if operation is Operation.MUTATION:
+            return self.primary
+        writes = _writes.get()
+        if not self.replicas or (writes is not None and writes.wrote):
+            return self.primary
+        return next(self._replicas_cycle)
@@ -0,0 +1,21 @@
+import typing as T
+import contextlib
+import edgedb
+from edgedb.asyncio_client import AsyncIOIteration
+
+# one attempt: edgedb retries a transaction by running its block again,
+# which a context manager cannot do
+NO_RETRIES = edgedb.RetryOptions(attempts=1)
+
+
+@contextlib.asynccontextmanager
+async def transaction(
+    client: edgedb.AsyncIOClient,
+) -> T.AsyncIterator[AsyncIOIteration]:
+    """async with transaction(client) as tx: every resolver called with client=tx runs in
+    the same transaction, which commits when the block exits and rolls back if it raises.
+    Use edge_orm.batch(client=tx, ...) to send independent mutations in one query.
+    Use client.transaction() directly to retry on serialization errors"""
+    async for tx in client.with_retry_options(NO_RETRIES).transaction():
+        async with tx:
+            yield tx
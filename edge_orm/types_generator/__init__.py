@@ -1,4 +1,12 @@
-from .main import DBConfig, DBVendor, NodeConfig, generate, PropertyConfig
+from .main import (
+    DBConfig,
+    DBVendor,
+    NodeConfig,
+    NamedQueryConfig,
+    QueryShape,
+    generate,
+    PropertyConfig,
+)
 from edge_orm.node import PropertyCardinality
 
 __all__ = [
@@ -6,6 +14,8 @@ __all__ = [
     "DBVendor",
     "generate",
     "NodeConfig",
+    "NamedQueryConfig",
+    "QueryShape",
     "PropertyConfig",
     "PropertyCardinality",
 ]
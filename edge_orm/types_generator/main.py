@@ -45,6 +45,38 @@ class NodeConfig(BaseModel):
     basemodel_properties: T.Dict[str, PropertyConfig] = {}
     custom_annotations: T.Dict[str, str] = {}
     mutate_on_update: T.Dict[str, str] = {}
+    named_queries: T.Dict[str, "NamedQueryConfig"] = {}
+
+
+class QueryShape(BaseModel):
+    """a resolver tree written as config, for named queries"""
+
+    filter: str | None = None
+    order_by: str | None = None
+    limit: int | None = None
+    offset: int | None = None
+    include_fields: T.List[str] = []
+    exclude_fields: T.List[str] = []
+    links: T.Dict[str, "QueryShape"] = {}
+
+
+class NamedQueryConfig(BaseModel):
+    """a query the generator emits with a typed async function to call it,
+    compiled to a fixed string on first use.
+    Give either resolver, a python expression written into the generated module
+    (like 'UserResolver().filter(".name = <str>$name")'), or shape.
+    Every $variable without a value in the resolver must be in variables, by the name
+    in its filter: $min_age in a filter of friends is the argument min_age"""
+
+    resolver: str | None = None
+    shape: QueryShape | None = None
+    only_one: bool = False
+    # variable name -> type annotation of the argument
+    variables: T.Dict[str, str] = {}
+
+
+QueryShape.update_forward_refs()
+NodeConfig.update_forward_refs()
 
 
 class DBConfig(BaseModel):
@@ -55,6 +87,8 @@ class DBConfig(BaseModel):
     nodes: T.Dict[str, NodeConfig] = dict()
     cache_only: bool = True
     resolver_mixin_path: str | None = None
+    # also generate a blocking SYNC_CLIENT, for Resolver.sync
+    sync: bool = False
 
     @property
     def is_plaintext_dsn(self) -> bool:
@@ -87,7 +121,10 @@ def indent_lines(s: str, indent: str = DEFAULT_INDENT) -> str:
 
 
 def imports(
-    enums_module: str, client_module: str, resolver_mixin_path: str | None
+    enums_module: str,
+    client_module: str,
+    resolver_mixin_path: str | None,
+    sync: bool = False,
 ) -> str:
     lines = [
         "from __future__ import annotations",
@@ -100,10 +137,10 @@ def imports(
         "from edgedb import RelativeDuration, AsyncIOClient, create_async_client",
         "from pydantic import BaseModel, Field, PrivateAttr, validator",
         f"from {PATH_TO_MODULE}.node.models import Cardinality, FieldInfo, classproperty",
-        f"from {PATH_TO_MODULE} import Node, Insert, Patch, EdgeConfigBase, Resolver, NodeException, ResolverException, UNSET, UnsetType, validators, errors, resolver_enums",
+        f"from {PATH_TO_MODULE} import Node, Insert, Patch, EdgeConfigBase, Resolver, NamedQuery, NodeException, ResolverException, UNSET, UnsetType, validators, errors, resolver_enums",
         "FilterConnector = resolver_enums.FilterConnector",
         f"from . import {enums_module} as enums",
-        f"from .{client_module} import CLIENT",
+        f"from .{client_module} import CLIENT{', SYNC_CLIENT' if sync else ''}",
     ]
     if resolver_mixin_path:
         lines.append(resolver_mixin_path)
@@ -163,6 +200,8 @@ async def {link.name}{COUNT_POSTFIX}(
     client: AsyncIOClient | None = None
 ) -> int:
     rez = resolver or {link_resolver_name}()
+    if rez.is_frozen:
+        rez = rez.clone()
     rez.is_count = True
     return await self.resolve(
         edge_name="{link.name}{COUNT_POSTFIX}",
@@ -187,6 +226,8 @@ def {link.name}(self, _: T.Optional[{link_resolver_name}] = None, /, make_first:
     count = f"""
 def {link.name}{COUNT_POSTFIX}(self, _: T.Optional[{link_resolver_name}] = None, /, make_first: bool = False) -> {node_resolver_name}:
     rez = _ or {link_resolver_name}()
+    if rez.is_frozen:
+        rez = rez.clone()
     rez.is_count = True
     self._nested_resolvers.add(
         "{link.name}{COUNT_POSTFIX}",
@@ -305,11 +346,14 @@ def build_orm_config(
     insert_edgedb_conversion_map: CONVERSION_MAP,
     patch_edgedb_conversion_map: CONVERSION_MAP,
     insert_link_conversion_map: CONVERSION_MAP,
+    sync: bool = False,
 ) -> str:
+    sync_client_str = "sync_client = SYNC_CLIENT," if sync else ""
     return f"""
 EdgeConfig: T.ClassVar[EdgeConfigBase] = EdgeConfigBase(
     model_name = "{model_name}",
     client = CLIENT,
+    {sync_client_str}
 
     updatable_fields = {{{', '.join(add_quotes(sorted(list(updatable_fields))))}}},
     exclusive_fields = {{{', '.join(add_quotes(sorted(list(exclusive_fields))))}}},
@@ -482,6 +526,7 @@ def build_node_and_resolver(
     dehydrate: bool,
     allow_inserting_id: bool = True,
     resolver_mixin_model: str | None = None,
+    sync: bool = False,
 ) -> str:
     is_hydrate = hydrate or insert_hydrate or patch_hydrate
     # need to sort props and links by required, exclusive, no default, rest
@@ -641,7 +686,7 @@ def {prop.name}(self) -> {type_str}:
     updatable_links: T.Set[str] = set()
     exclusive_links: T.Set[str] = set()
     link_conversion_map: CONVERSION_MAP = {}
-    edge_resolver_map: T.Dict[str, str] = {}
+    edge_resolver_map = build_edge_resolver_map(object_type)
 
     for link in object_type.links:
         if link.name == "__type__":
@@ -653,11 +698,6 @@ def {prop.name}(self) -> {type_str}:
             readonly=link.readonly,
             required=link.required,
         )
-        edge_resolver_map[link.name] = f"{link.target.model_name}Resolver"
-        if link.cardinality == Cardinality.Many:
-            edge_resolver_map[
-                link.name + COUNT_POSTFIX
-            ] = f"{link.target.model_name}Resolver"
         if not link.readonly and not link.is_computed:
             updatable_links.add(link.name)
         if link.is_exclusive:
@@ -710,6 +750,7 @@ def {prop.name}(self) -> {type_str}:
         insert_edgedb_conversion_map=insert_edgedb_conversion_map,
         patch_edgedb_conversion_map=patch_edgedb_conversion_map,
         insert_link_conversion_map=link_conversion_map,
+        sync=sync,
     )
 
     insert_model_name = f"{object_type.node_name}Insert"
@@ -778,6 +819,7 @@ def {prop.name}(self) -> {type_str}:
 
     # resolver
     clses = [
+        "__slots__ = ()",
         f"_node_cls = {object_type.node_name}",
         f"_insert_cls = {object_type.node_name}Insert",
         f"_patch_cls = {object_type.node_name}Patch",
@@ -824,6 +866,20 @@ def {prop.name}(self) -> {type_str}:
     return f"{node_s}\n{insert_s}\n{patch_s}\n{resolver_s}"
 
 
+def build_edge_resolver_map(object_type: ObjectType) -> T.Dict[str, str]:
+    """edge name -> name of the resolver class of its target, count edges included"""
+    edge_resolver_map: T.Dict[str, str] = {}
+    for link in object_type.links:
+        if link.name == "__type__":
+            continue
+        edge_resolver_map[link.name] = f"{link.target.model_name}Resolver"
+        if link.cardinality == Cardinality.Many:
+            edge_resolver_map[link.name + COUNT_POSTFIX] = (
+                f"{link.target.model_name}Resolver"
+            )
+    return edge_resolver_map
+
+
 async def build_nodes_and_resolvers(
     client: edgedb.AsyncIOClient,
     db_config: DBConfig,
@@ -851,6 +907,7 @@ async def build_nodes_and_resolvers(
                 and not dehydrate,
                 dehydrate=dehydrate,
                 resolver_mixin_model=resolver_mixin_model,
+                sync=db_config.sync,
             )
         )
     update_forward_refs_inserts_str = "\n".join(
@@ -867,6 +924,132 @@ async def build_nodes_and_resolvers(
     return f"{nodes_str}\n\n{update_forward_refs_inserts_str}\n\n{update_forward_refs_patches_str}\n\n{update_forward_refs_nodes_str}\n\n{edge_resolver_map_str}"
 
 
+def resolver_str_from_shape(
+    shape: QueryShape,
+    resolver_name: str,
+    edge_resolver_maps: T.Dict[str, T.Dict[str, str]],
+) -> str:
+    strs = [f"{resolver_name}()"]
+    if shape.filter:
+        strs.append(f".filter({shape.filter!r})")
+    if shape.order_by:
+        strs.append(f".order_by({shape.order_by!r})")
+    if shape.offset is not None:
+        strs.append(f".offset({shape.offset})")
+    if shape.limit is not None:
+        strs.append(f".limit({shape.limit})")
+    if shape.include_fields:
+        strs.append(f".include_fields({', '.join(map(repr, shape.include_fields))})")
+    if shape.exclude_fields:
+        strs.append(f".exclude_fields({', '.join(map(repr, shape.exclude_fields))})")
+    for edge, edge_shape in shape.links.items():
+        edge_resolver_name = edge_resolver_maps[resolver_name].get(edge)
+        if edge_resolver_name is None:
+            raise GeneratorException(
+                f"{resolver_name} has no link {edge} for a named query."
+            )
+        strs.append(
+            f".{edge}({resolver_str_from_shape(edge_shape, edge_resolver_name, edge_resolver_maps)})"
+        )
+    return "".join(strs)
+
+
+def shape_variable_names(shape: QueryShape) -> T.Set[str]:
+    """the $variables of a shape and its links, as written in their filters"""
+    from edge_orm.resolver.template import tokenize
+
+    names: T.Set[str] = set()
+    for s in (shape.filter, shape.order_by):
+        if s:
+            names.update(tokenize(s).names)
+    for edge_shape in shape.links.values():
+        names |= shape_variable_names(edge_shape)
+    return names
+
+
+def build_named_query_str(
+    *,
+    name: str,
+    node_name: str,
+    config: NamedQueryConfig,
+    edge_resolver_maps: T.Dict[str, T.Dict[str, str]],
+) -> str:
+    if not name.isidentifier():
+        raise GeneratorException(f"Named query {name} must be a valid identifier.")
+    if (config.resolver is None) == (config.shape is None):
+        raise GeneratorException(
+            f"Named query {name} must have exactly one of resolver or shape."
+        )
+    resolver_name = f"{node_name}Resolver"
+    if resolver_name not in edge_resolver_maps:
+        raise GeneratorException(f"Named query {name} has no node {node_name}.")
+    if config.shape is not None:
+        resolver_str = resolver_str_from_shape(
+            config.shape, resolver_name, edge_resolver_maps
+        )
+        shape_names = shape_variable_names(config.shape)
+        if undeclared := shape_names - config.variables.keys():
+            raise GeneratorException(
+                f"Named query {name} does not declare variables {undeclared}."
+            )
+        if unknown := config.variables.keys() - shape_names:
+            raise GeneratorException(f"Named query {name} has no variables {unknown}.")
+    else:
+        resolver_str = T.cast(str, config.resolver)
+    var_names = list(config.variables)
+    arg_strs: T.List[str] = []
+    for var_name in var_names:
+        if not var_name.isidentifier() or var_name == "client":
+            raise GeneratorException(
+                f"Named query {name} cannot have a variable named {var_name}."
+            )
+        arg_strs.append(f"{var_name}: {config.variables[var_name]}")
+    arg_strs.append("client: AsyncIOClient | None = None")
+
+    constant_name = name.upper()
+    if config.only_one:
+        return_type, method_name = f"T.Optional[{node_name}]", "query_one"
+    else:
+        return_type, method_name = f"T.List[{node_name}]", "query_many"
+    variables_str = ", ".join(f'"{var_name}": {var_name}' for var_name in var_names)
+    lines = [
+        f"{constant_name}: NamedQuery[{node_name}] = NamedQuery(name={name!r}, variable_names={tuple(var_names)!r}, build_resolver=lambda: {resolver_str})",
+        f"async def {name}(*, {', '.join(arg_strs)}) -> {return_type}:",
+        indent_lines(
+            f"return await {constant_name}.{method_name}(variables={{{variables_str}}}, client=client)"
+        ),
+    ]
+    return "\n".join(lines)
+
+
+def build_named_queries(db_config: DBConfig, object_types: T.List[ObjectType]) -> str:
+    """builds the named queries of db_config from the config alone,
+    the generated module is not imported"""
+    edge_resolver_maps = {
+        f"{object_type.node_name}Resolver": build_edge_resolver_map(object_type)
+        for object_type in object_types
+    }
+    named_query_strs: T.List[str] = []
+    constant_names: T.List[str] = []
+    for node_name, node_config in db_config.nodes.items():
+        for name, config in node_config.named_queries.items():
+            named_query_strs.append(
+                build_named_query_str(
+                    name=name,
+                    node_name=node_name,
+                    config=config,
+                    edge_resolver_maps=edge_resolver_maps,
+                )
+            )
+            constant_names.append(name.upper())
+    if not named_query_strs:
+        return ""
+    named_query_strs.append(
+        f"NAMED_QUERIES: T.List[NamedQuery[T.Any]] = [{', '.join(constant_names)}]"
+    )
+    return "\n\n".join(named_query_strs)
+
+
 def add_quotes_to_non_env_vars(s: str) -> str:
     if re.fullmatch(ENV_VAR_PATTERN, s) is not None:
         return s
@@ -874,7 +1057,10 @@ def add_quotes_to_non_env_vars(s: str) -> str:
 
 
 def build_client(db_config: DBConfig) -> str:
-    return f"CLIENT = create_async_client(dsn={db_config.dsn_str()})"
+    lines = [f"CLIENT = create_async_client(dsn={db_config.dsn_str()})"]
+    if db_config.sync:
+        lines.append(f"SYNC_CLIENT = create_client(dsn={db_config.dsn_str()})")
+    return "\n".join(lines)
 
 
 def validate_output_path(path: Path) -> None:
@@ -949,6 +1135,7 @@ async def build_from_config(
         enums_module=enums_module,
         client_module=client_module,
         resolver_mixin_path=db_config.resolver_mixin_path,
+        sync=db_config.sync,
     )
     cache_only_str = f"CACHE_ONLY: bool = {db_config.cache_only}"
     validator_module_imports = build_validator_module_imports(db_config)
@@ -1007,13 +1194,14 @@ async def generate(
             os.makedirs(output_path)
         open(output_path / f"{enums_module}.py", "w").write(enums_s)
         # build client file
+        client_names = ["CLIENT", "SYNC_CLIENT"] if db_config.sync else ["CLIENT"]
         client_s = format_str(
             "\n".join(
                 [
                     "import os",
-                    "from edgedb import create_async_client",
+                    f"from edgedb import create_async_client{', create_client' if db_config.sync else ''}",
                     build_client(db_config),
-                    '__all__ = ["CLIENT"]',
+                    f"__all__ = {client_names!r}",
                 ]
             ),
             mode=FileMode(),
@@ -1031,10 +1219,26 @@ async def generate(
         )
         open(output_path / f"{db_name}.py", "w").write(s)
         if hydrate:
-            s = await build_from_config(
+            hydrated_s = await build_from_config(
                 db_config=db_config,
                 hydrate=True,
                 enums_module=enums_module,
                 client_module=client_module,
             )
-            open(output_path / f"{db_name}_hydrated.py", "w").write(s)
+            open(output_path / f"{db_name}_hydrated.py", "w").write(hydrated_s)
+
+        # named queries only need the config and the links, added to both modules
+        if any(node.named_queries for node in db_config.nodes.values()):
+            named_queries_s = build_named_queries(
+                db_config=db_config,
+                object_types=await introspect_objects(
+                    edgedb.create_async_client(dsn=db_config.dsn)
+                ),
+            )
+            s = format_str(f"{s}\n{named_queries_s}", mode=FileMode())
+            open(output_path / f"{db_name}.py", "w").write(s)
+            if hydrate:
+                hydrated_s = format_str(
+                    f"{hydrated_s}\n{named_queries_s}", mode=FileMode()
+                )
+                open(output_path / f"{db_name}_hydrated.py", "w").write(hydrated_s)
@@ -0,0 +1,67 @@
+import asyncio
+import typing as T
+import orjson
+
+# a fixed response, or a function of (query, variables) returning one
+Answer = T.Union[T.Any, T.Callable[[str, dict[str, T.Any]], T.Any]]
+
+
+class FakeClient:
+    """stands in for an AsyncIOClient: answers queries with many and single queries with
+    one, sent as json, or as they are over the binary protocol.
+    Records the queries it was sent and how many ran at once"""
+
+    def __init__(
+        self, *, many: Answer = None, one: Answer = None, delay: float = 0
+    ) -> None:
+        self.many = [] if many is None else many
+        self.one = one
+        self.delay = delay
+        self.queries: list[tuple[str, dict[str, T.Any]]] = []
+        self.binary_queries: list[tuple[str, dict[str, T.Any]]] = []
+        self.running = 0
+        self.max_running = 0
+
+    def _answer_now(
+        self, answer: Answer, query: str, variables: dict[str, T.Any]
+    ) -> T.Any:
+        return answer(query, variables) if callable(answer) else answer
+
+    async def _answer(
+        self, answer: Answer, query: str, variables: dict[str, T.Any]
+    ) -> T.Any:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return self._answer_now(answer, query, variables)
+
+    async def query_json(self, query: str, **variables: T.Any) -> str:
+        self.queries.append((query, variables))
+        return orjson.dumps(await self._answer(self.many, query, variables)).decode()
+
+    async def query_single_json(self, query: str, **variables: T.Any) -> str:
+        self.queries.append((query, variables))
+        return orjson.dumps(await self._answer(self.one, query, variables)).decode()
+
+    async def query(self, query: str, **variables: T.Any) -> T.Any:
+        self.binary_queries.append((query, variables))
+        return await self._answer(self.many, query, variables)
+
+    async def query_single(self, query: str, **variables: T.Any) -> T.Any:
+        self.binary_queries.append((query, variables))
+        return await self._answer(self.one, query, variables)
+
+
+class FakeBlockingClient(FakeClient):
+    """stands in for a blocking edgedb.Client, answers like FakeClient"""
+
+    def query_json(self, query: str, **variables: T.Any) -> str:  # type: ignore
+        self.queries.append((query, variables))
+        return orjson.dumps(self._answer_now(self.many, query, variables)).decode()
+
+    def query_single_json(self, query: str, **variables: T.Any) -> str:  # type: ignore
+        self.queries.append((query, variables))
+        return orjson.dumps(self._answer_now(self.one, query, variables)).decode()
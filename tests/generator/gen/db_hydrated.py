@@ -14,6 +14,7 @@ from edge_orm import (
     Patch,
     EdgeConfigBase,
     Resolver,
+    NamedQuery,
     NodeException,
     ResolverException,
     UNSET,
@@ -127,6 +128,8 @@ class User(Node):
         client: AsyncIOClient | None = None,
     ) -> int:
         rez = resolver or UserResolver()
+        if rez.is_frozen:
+            rez = rez.clone()
         rez.is_count = True
         return await self.resolve(
             edge_name="friends_Count",
@@ -366,6 +369,7 @@ class UserPatch(Patch):
 
 
 class UserResolver(Resolver[User, UserInsert, UserPatch], ResolverMixin):
+    __slots__ = ()
     _node_cls = User
     _insert_cls = UserInsert
     _patch_cls = UserPatch
@@ -382,6 +386,8 @@ class UserResolver(Resolver[User, UserInsert, UserPatch], ResolverMixin):
         self, _: T.Optional[UserResolver] = None, /, make_first: bool = False
     ) -> UserResolver:
         rez = _ or UserResolver()
+        if rez.is_frozen:
+            rez = rez.clone()
         rez.is_count = True
         self._nested_resolvers.add("friends_Count", rez, make_first=make_first)
         return self
@@ -625,6 +631,7 @@ class DateModelPatch(Patch):
 class DateModelResolver(
     Resolver[DateModel, DateModelInsert, DateModelPatch], ResolverMixin
 ):
+    __slots__ = ()
     _node_cls = DateModel
     _insert_cls = DateModelInsert
     _patch_cls = DateModelPatch
@@ -714,3 +721,45 @@ UserResolver._edge_resolver_map: T.Dict[str, T.Union[T.Type[UserResolver]]] = {
     "friends_Count": UserResolver,
 }
 DateModelResolver._edge_resolver_map: T.Dict[str, T.Type[Resolver]] = {}
+
+USERS_BY_NAME: NamedQuery[User] = NamedQuery(
+    name="users_by_name",
+    variable_names=("name",),
+    build_resolver=lambda: UserResolver()
+    .filter(".name = <str>$name")
+    .order_by(".created_at")
+    .limit(20)
+    .friends(UserResolver().limit(3)),
+)
+
+
+async def users_by_name(
+    *, name: str, client: AsyncIOClient | None = None
+) -> T.List[User]:
+    return await USERS_BY_NAME.query_many(variables={"name": name}, client=client)
+
+
+USER_WITH_FRIENDS_BY_PHONE_NUMBER: NamedQuery[User] = NamedQuery(
+    name="user_with_friends_by_phone_number",
+    variable_names=("phone_number", "min_age"),
+    build_resolver=lambda: UserResolver()
+    .filter(".phone_number = <str>$phone_number")
+    .include_fields("created_at")
+    .friends(UserResolver().filter(".age > <int16>$min_age").order_by(".name").limit(5))
+    .friends_Count(UserResolver()),
+)
+
+
+async def user_with_friends_by_phone_number(
+    *, phone_number: str, min_age: int, client: AsyncIOClient | None = None
+) -> T.Optional[User]:
+    return await USER_WITH_FRIENDS_BY_PHONE_NUMBER.query_one(
+        variables={"phone_number": phone_number, "min_age": min_age},
+        client=client,
+    )
+
+
+NAMED_QUERIES: T.List[NamedQuery[T.Any]] = [
+    USERS_BY_NAME,
+    USER_WITH_FRIENDS_BY_PHONE_NUMBER,
+]
@@ -5,6 +5,8 @@ from edge_orm.types_generator import (
     DBVendor,
     generate,
     NodeConfig,
+    NamedQueryConfig,
+    QueryShape,
     PropertyConfig,
     PropertyCardinality,
 )
@@ -40,6 +42,28 @@ db_config_map: dict[str, DBConfig] = {
                     ),
                 },
                 mutate_on_update={"last_updated_at": "datetime_current()"},
+                named_queries={
+                    "users_by_name": NamedQueryConfig(
+                        resolver='UserResolver().filter(".name = <str>$name").order_by(".created_at").limit(20).friends(UserResolver().limit(3))',
+                        variables={"name": "str"},
+                    ),
+                    "user_with_friends_by_phone_number": NamedQueryConfig(
+                        shape=QueryShape(
+                            filter=".phone_number = <str>$phone_number",
+                            include_fields=["created_at"],
+                            links={
+                                "friends": QueryShape(
+                                    filter=".age > <int16>$min_age",
+                                    order_by=".name",
+                                    limit=5,
+                                ),
+                                "friends_Count": QueryShape(),
+                            },
+                        ),
+                        only_one=True,
+                        variables={"phone_number": "str", "min_age": "int"},
+                    ),
+                },
             )
         },
     )
@@ -1,3 +1,5 @@
 class ResolverMixin:
+    __slots__ = ()
+
     def hello(self) -> str:
         return "hi"
@@ -0,0 +1,118 @@
+import asyncio
+import typing as T
+import uuid
+import pytest
+from edge_orm.node import loader
+from tests.fakes import FakeClient
+from tests.generator.gen import db_hydrated as db
+
+FRIEND_ID = str(uuid.uuid4())
+
+
+def with_friends(query: str, variables: dict[str, T.Any]) -> T.Any:
+    """every user of $ids has one friend"""
+    friend = {"id": FRIEND_ID, "name": "f", "age": 1, "phone_number": "+1"}
+    return [
+        {
+            "id": str(i),
+            "name": "u",
+            "age": 1,
+            "phone_number": "+1",
+            "friends": [friend],
+        }
+        for i in variables["ids"]
+    ]
+
+
+def make_users(n: int) -> list[db.User]:
+    return db.UserResolver().parse_obj_with_cache_list(
+        [
+            {"id": str(uuid.uuid4()), "name": "u", "age": 1, "phone_number": "+1"}
+            for _ in range(n)
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def enable_edge_loader() -> T.Iterator[None]:
+    assert not loader.edge_loader.enabled
+    loader.edge_loader.enable()
+    loader.edge_loader.reset()
+    try:
+        yield
+    finally:
+        loader.edge_loader.enable(False)
+
+
+@pytest.mark.asyncio
+async def test_edge_loader_batches_a_tick() -> None:
+    client = FakeClient(many=with_friends)
+    users = make_users(10)
+    friends = await asyncio.gather(
+        *[u.friends(cache_only=False, client=client) for u in users]  # type: ignore
+    )
+    [(query, variables)] = client.queries
+    assert loader.IDS_FILTER in query
+    assert variables["ids"] == [u.id for u in users]
+    assert all(str(f[0].id) == FRIEND_ID for f in friends)
+    assert loader.edge_loader.info() == loader.EdgeLoaderInfo(
+        loads=10, batches=1, pending=0
+    )
+    await asyncio.sleep(0)
+    assert not loader.edge_loader._running
+    # the loads were stored in each node's cache
+    assert (await users[0].friends())[0].id == friends[0][0].id
+
+    # different edge resolvers are different batches
+    users = make_users(2)
+    await asyncio.gather(
+        users[0].friends(cache_only=False, client=client),  # type: ignore
+        users[1].friends(db.UserResolver().limit(1), cache_only=False, client=client),  # type: ignore
+    )
+    assert len(client.queries) == 3
+
+
+@pytest.mark.asyncio
+async def test_edge_loader_does_not_batch_sequential_loads() -> None:
+    client = FakeClient(many=with_friends)
+    users = make_users(3)
+    for u in users:
+        friends = await u.friends(cache_only=False, client=client)  # type: ignore
+        assert str(friends[0].id) == FRIEND_ID
+    # each load was awaited before the next one started, so each is its own batch
+    assert [variables["ids"] for _, variables in client.queries] == [
+        [u.id] for u in users
+    ]
+    assert loader.edge_loader.info() == loader.EdgeLoaderInfo(
+        loads=3, batches=3, pending=0
+    )
+
+
+@pytest.mark.asyncio
+async def test_edge_loader_counts_with_a_frozen_resolver() -> None:
+    def with_friend_count(query: str, variables: dict[str, T.Any]) -> T.Any:
+        return [
+            {
+                "id": str(i),
+                "name": "u",
+                "age": 1,
+                "phone_number": "+1",
+                "friends_Count": 2,
+            }
+            for i in variables["ids"]
+        ]
+
+    client = FakeClient(many=with_friend_count)
+    template = db.UserResolver().filter(".age > 21").freeze()
+    count = await make_users(1)[0].friends_Count(template, cache_only=False, client=client)  # type: ignore
+    assert count == 2
+    [(query, _)] = client.queries
+    assert "friends_Count := count((SELECT .friends FILTER .age > 21))" in query
+    # the template was cloned, not changed
+    assert template.is_frozen and not template.is_count
+
+
+@pytest.mark.asyncio
+async def test_edge_loader_missing_node() -> None:
+    with pytest.raises(db.NodeException):
+        await make_users(1)[0].friends(cache_only=False, client=FakeClient())  # type: ignore
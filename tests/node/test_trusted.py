@@ -0,0 +1,102 @@
+import uuid
+import typing as T
+import pytest
+from pydantic import ValidationError, root_validator
+from edge_orm import UNSET, Node
+from edge_orm.node.trusted import construct_trusted, TrustedSampler
+from tests.generator.gen import db_hydrated as db
+
+IMAGES = [{"url": "https://a.b/c.png", "height": 1, "width": 2}]
+
+
+def build_user(**extra: T.Any) -> dict[str, T.Any]:
+    """a user as the json protocol sends it"""
+    return {
+        "id": str(uuid.uuid4()),
+        "name": "user",
+        "phone_number": "+1",
+        "age": None,
+        "created_at": "2022-01-01T00:00:00.123456+00:00",
+        "user_role": "buyer",
+        "images": IMAGES,
+        "ids_of_friends": [str(uuid.uuid4())],
+        **extra,
+    }
+
+
+def test_construct_trusted_matches_validation() -> None:
+    d = build_user()
+    validated = db.User(**d)
+    trusted = construct_trusted(db.User, d)
+    assert trusted.__dict__ == validated.__dict__
+    assert trusted.__fields_set__ == validated.__fields_set__
+    assert trusted.created_at == validated.created_at
+    assert trusted.images == validated.images
+    assert trusted.user_role is db.enums.UserRole.buyer
+    assert trusted.email_ is UNSET
+    assert trusted._cache is not construct_trusted(db.User, d)._cache
+
+
+def test_construct_trusted_keeps_field_order() -> None:
+    d = dict(reversed(build_user().items()))
+    trusted = construct_trusted(db.User, d)
+    assert list(trusted.__dict__) == list(db.User.__fields__)
+    assert list(trusted.__dict__) == list(db.User(**d).__dict__)
+
+
+class UpperUser(Node):
+    name: str
+
+    @root_validator
+    def upper_name(cls, values: dict[str, T.Any]) -> dict[str, T.Any]:
+        values["name"] = values["name"].upper()
+        return values
+
+
+def test_construct_trusted_validates_models_with_root_validators() -> None:
+    d = {"id": str(uuid.uuid4()), "name": "user"}
+    assert construct_trusted(UpperUser, d).name == "USER"
+
+
+def test_construct_trusted_raises_on_bad_values() -> None:
+    with pytest.raises(ValidationError):
+        construct_trusted(db.User, build_user(user_role="nobody"))
+    d = build_user()
+    del d["name"]
+    with pytest.raises(ValidationError):
+        construct_trusted(db.User, d)
+
+
+def test_trusted_resolver_parse() -> None:
+    d = build_user(friends=[build_user()], friends_Count=1, extra_field=2)
+    rez = db.UserResolver().include_fields("created_at").friends().friends_Count()
+    validated = rez.parse_obj_with_cache(d)
+    trusted = rez.trusted().parse_obj_with_cache(d)
+    assert trusted == validated
+    assert trusted.computed == {"extra_field": 2}
+    friends_rez = rez._nested_resolvers.resolver_from_field_name("friends")
+    count_rez = rez._nested_resolvers.resolver_from_field_name("friends_Count")
+    assert trusted._cache.val_or_unset(edge="friends_Count", resolver=count_rez) == 1
+    [friend] = trusted._cache.val_or_unset(edge="friends", resolver=friends_rez)
+    [validated_friend] = validated._cache.val_or_unset(
+        edge="friends", resolver=friends_rez
+    )
+    assert friend.__dict__ == validated_friend.__dict__
+
+
+class StrippedUser(Node):
+    name: str
+
+    class Config:
+        anystr_strip_whitespace = True
+
+
+def test_sampler_replaces_drifted_nodes() -> None:
+    d = build_user()
+    sampler = TrustedSampler(every=1)
+    assert sampler.construct(db.User, d).__dict__ == db.User(**d).__dict__
+    # config the trusted path does not apply
+    drifted = {"id": str(uuid.uuid4()), "name": " user "}
+    assert construct_trusted(StrippedUser, drifted).name == " user "
+    assert sampler.construct(StrippedUser, drifted).name == "user"
+    assert TrustedSampler(every=2).construct(StrippedUser, drifted).name == " user "
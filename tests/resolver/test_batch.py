@@ -0,0 +1,98 @@
+import pytest
+from edge_orm import batch, BatchQuery, ResolverException, transaction
+from edge_orm.resolver.batching import BatchKind
+from tests.generator.gen import db_hydrated as db
+
+
+def test_batch_query_strs() -> None:
+    users_s, users_vars = BatchQuery(
+        resolver=db.UserResolver()
+        .filter(".name = <str>$name", {"name": "Paul"})
+        .friends(db.UserResolver().filter(".age > <int16>$age", {"age": 3})),
+        kind=BatchKind.MANY,
+    ).build_str_and_vars(key="users")
+    assert users_s.startswith("users := (SELECT User {")
+    assert "FILTER .age > <int16>$users__friends__age" in users_s
+    assert users_vars == {"users__name": "Paul", "users__friends__age": 3}
+
+    total_s, total_vars = (
+        db.UserResolver().limit(5).count_query().build_str_and_vars(key="total")
+    )
+    assert total_s == "total := count(User { age, id, name, phone_number } LIMIT 5)"
+    assert total_vars == {}
+
+    me_s, me_vars = db.UserResolver().get_query(id="abc").build_str_and_vars(key="me")
+    assert me_s.endswith("FILTER .id = <std::uuid>$me__id))")
+    assert me_s.startswith("me := assert_single((SELECT User {")
+    assert me_vars == {"me__id": "abc"}
+
+
+def test_batch_mutation_strs() -> None:
+    insert_query = db.UserResolver().insert_query(
+        db.UserInsert(name="Paul", phone_number="+16666666666")
+    )
+    with_s, with_vars = insert_query.build_with_str_and_vars(key="paul")
+    assert with_s.startswith("paul__model := (INSERT User {")
+    assert "$paul__name" in with_s and "$paul__phone_number" in with_s
+    assert with_vars == {"paul__name": "Paul", "paul__phone_number": "+16666666666"}
+    s, _ = insert_query.build_str_and_vars(key="paul")
+    assert s.startswith("paul := assert_single((SELECT paul__model {")
+
+    update_query = db.UserResolver().update_one_query(
+        db.UserPatch(age=3), phone_number="+16666666666"
+    )
+    with_s, with_vars = update_query.build_with_str_and_vars(key="old")
+    assert with_s.startswith("old__model := (UPDATE User ")
+    assert "FILTER .phone_number = <std::str>$old__phone_number SET" in with_s
+    assert with_vars == {"old__phone_number": "+16666666666", "old__age": 3}
+
+    delete_query = (
+        db.UserResolver().filter(".age > <int16>$age", {"age": 100}).delete_many_query()
+    )
+    with_s, with_vars = delete_query.build_with_str_and_vars(key="gone")
+    assert with_s == "gone__model := (DELETE User FILTER .age > <int16>$gone__age)"
+    assert with_vars == {"gone__age": 100}
+    s, _ = delete_query.build_str_and_vars(key="gone")
+    assert s.startswith("gone := (SELECT gone__model {")
+
+    with pytest.raises(ResolverException):
+        db.UserResolver().delete_many_query()
+    with pytest.raises(ResolverException):
+        db.UserResolver().update_one_query(db.UserPatch(), id="abc")
+
+
+@pytest.mark.asyncio
+async def test_batch_validation() -> None:
+    with pytest.raises(ResolverException):
+        db.UserResolver().get_query(name="Paul")
+    with pytest.raises(ResolverException):
+        db.UserResolver().get_query()
+    with pytest.raises(ResolverException):
+        await batch(my__users=db.UserResolver())
+    assert await batch() == {}
+
+
+@pytest.mark.asyncio
+async def test_batch() -> None:
+    results = await batch(
+        users=db.UserResolver().limit(3).friends(db.UserResolver().limit(2)),
+        total=db.UserResolver().count_query(),
+        me=db.UserResolver().get_query(phone_number="+16666666666"),
+    )
+    assert len(results["users"]) <= 3
+    assert isinstance(results["total"], int)
+    assert results["me"] is None or results["me"].phone_number == "+16666666666"
+
+
+@pytest.mark.asyncio
+async def test_batch_mutations_in_transaction() -> None:
+    async with transaction(db.CLIENT) as tx:
+        results = await batch(
+            client=tx,  # type: ignore
+            paul=db.UserResolver().insert_query(
+                db.UserInsert(name="Paul", phone_number="+15555555550")
+            ),
+            total=db.UserResolver().count_query(),
+        )
+        assert results["paul"].name == "Paul"
+        await db.UserResolver().delete_one(id=results["paul"].id, client=tx)  # type: ignore
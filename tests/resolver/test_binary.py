@@ -0,0 +1,117 @@
+import asyncio
+import typing as T
+import uuid
+from datetime import datetime, timezone
+import orjson
+import pytest
+from edgedb.datatypes.datatypes import create_object_factory
+from edge_orm import execute
+from tests.fakes import FakeClient
+from tests.generator.gen import db_hydrated as db
+
+friend_factory = create_object_factory(
+    id="property", name="property", phone_number="property", age="property"
+)
+user_factory = create_object_factory(
+    id="property",
+    name="property",
+    phone_number="property",
+    age="property",
+    created_at="property",
+    images="property",
+    friends="link",
+    friends_Count="property",
+    __tid__="implicit",
+)
+CREATED_AT = datetime(2022, 1, 1, tzinfo=timezone.utc)
+IMAGES = [{"url": "https://a.b/c.png", "height": 1, "width": 2}]
+
+
+def build_user_object() -> T.Any:
+    friend = friend_factory(uuid.uuid4(), "friend", "+1", 3)
+    return user_factory(
+        uuid.uuid4(),
+        "user",
+        "+2",
+        None,
+        CREATED_AT,
+        [orjson.dumps(image).decode() for image in IMAGES],
+        [friend],
+        1,
+        uuid.uuid4(),
+    )
+
+
+def build_resolver() -> db.UserResolver:
+    return (
+        db.UserResolver()
+        .include_fields("created_at", "images")
+        .friends()
+        .friends_Count()
+    )
+
+
+def test_binary_parse_matches_json_parse() -> None:
+    obj = build_user_object()
+    rez = build_resolver()
+    from_binary = rez.parse_obj_with_cache(obj)
+    json_d = orjson.loads(
+        orjson.dumps(
+            {
+                "id": obj.id,
+                "name": "user",
+                "phone_number": "+2",
+                "age": None,
+                "created_at": CREATED_AT,
+                "images": IMAGES,
+                "friends": [
+                    {
+                        "id": obj.friends[0].id,
+                        "name": "friend",
+                        "phone_number": "+1",
+                        "age": 3,
+                    }
+                ],
+                "friends_Count": 1,
+            }
+        )
+    )
+    from_json = rez.parse_obj_with_cache(json_d)
+    assert from_binary == from_json
+    assert from_binary.created_at == CREATED_AT
+    assert from_binary.images == from_json.images
+    assert from_binary.computed == {}
+    friends = from_binary._cache.val_or_unset(
+        edge="friends", resolver=db.UserResolver()
+    )
+    assert friends[0].name == "friend"
+
+
+@pytest.mark.asyncio
+async def test_binary_query() -> None:
+    client = FakeClient(many=lambda query, variables: [build_user_object()])
+    users = await build_resolver().binary().query(client=client)  # type: ignore
+    # only the binary protocol was used
+    assert len(client.binary_queries) == 1 and client.queries == []
+    assert users[0].created_at == CREATED_AT
+    assert users[0].images[0].url == IMAGES[0]["url"]
+
+    db.UserResolver._binary_default = True
+    try:
+        assert db.UserResolver()._binary
+        assert not db.UserResolver().binary(False)._binary
+    finally:
+        del db.UserResolver._binary_default
+
+
+def test_single_flight_keys_binary_apart() -> None:
+    async def keys() -> tuple[T.Hashable, T.Hashable]:
+        args: T.Any = dict(
+            client=None, query_str="SELECT User", variables={}, only_one=False
+        )
+        return execute.single_flight.key(**args), execute.single_flight.key(
+            **args, binary=True
+        )
+
+    json_key, binary_key = asyncio.run(keys())
+    assert json_key != binary_key
@@ -0,0 +1,66 @@
+import uuid
+import pytest
+from edgedb.datatypes.datatypes import create_object_factory
+from edge_orm.resolver import columns
+from tests.fakes import FakeClient
+from tests.generator.gen import db_hydrated as db
+
+ROWS = [
+    {"name": "a", "age": 1, "created_at": "2022-01-01T05:00:00+00:00"},
+    {"name": "b", "age": None, "created_at": "2022-01-02T05:00:00+00:00"},
+]
+
+
+def build_resolver() -> db.UserResolver:
+    return (
+        db.UserResolver()
+        .filter(".age > 0")
+        .order_by(".name")
+        .friends()
+        .extra_field("two", "2")
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_columns_as_lists() -> None:
+    client = FakeClient(many=ROWS)
+    rez = build_resolver()
+    cols = await rez.query_columns("name", "age", client=client, numpy=False)  # type: ignore
+    assert cols == {"name": ["a", "b"], "age": [1, None]}
+    [(query, _)] = client.queries
+    assert query.startswith("SELECT User { age, name } FILTER .age > 0 ORDER BY .name")
+    # the resolver itself is untouched
+    assert rez._nested_resolvers.has("friends")
+
+    with pytest.raises(db.ResolverException):
+        await rez.query_columns("nope", client=client)  # type: ignore
+    with pytest.raises(db.ResolverException):
+        await rez.query_columns(client=client)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_query_columns_as_arrays() -> None:
+    np = pytest.importorskip("numpy")
+    cols = await build_resolver().query_columns(
+        "name", "age", "created_at", client=FakeClient(many=ROWS)  # type: ignore
+    )
+    assert cols["name"] == ["a", "b"]
+    assert cols["age"].dtype == np.float64 and np.isnan(cols["age"][1])
+    assert cols["created_at"].dtype == np.dtype("datetime64[us]")
+    assert str(cols["created_at"][1]) == "2022-01-02T05:00:00.000000"
+
+
+def test_columns_from_objects() -> None:
+    factory = create_object_factory(id="property", age="property")
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    rows = [factory(ids[0], 1), factory(ids[1], 2)]
+    cols = columns.columns_from_rows(
+        rows,
+        ("id", "age"),
+        conversion_map=db.User.EdgeConfig.node_edgedb_conversion_map,
+        use_numpy=False,
+    )
+    assert cols == {"id": ids, "age": [1, 2]}
+    assert columns.columns_from_rows(
+        [], ("age",), conversion_map={}, use_numpy=False
+    ) == {"age": []}
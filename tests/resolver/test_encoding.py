@@ -0,0 +1,36 @@
+import json
+import uuid
+from decimal import Decimal
+from datetime import datetime, timezone
+from edge_orm.external import encoders
+from edge_orm.resolver import encoding
+from tests.models import Image
+from tests.generator.gen import db_hydrated as db
+
+
+def build_rows(n: int) -> list[dict]:  # type: ignore
+    created_at = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "name": f"user {i}",
+            "created_at": created_at,
+            "user_role": db.enums.UserRole.buyer,
+            "score": Decimal("1.5"),
+            "tags": {"a"},
+            "images": [Image(url="https://x.com/a.png", height=1, width=2)],
+        }
+        for i in range(n)
+    ]
+
+
+def test_encoding_matches_jsonable_encoder() -> None:
+    rows = build_rows(10)
+    assert json.loads(encoding.dumps(rows)) == json.loads(
+        json.dumps(encoders.jsonable_encoder(rows))
+    )
+    image = Image(url="https://x.com/a.png", height=1, width=2)
+    assert json.loads(encoding.dumps_model(image)) == json.loads(image.json())
+    assert json.loads(encoding.dumps({uuid.UUID(int=1): 1})) == {
+        str(uuid.UUID(int=1)): 1
+    }
@@ -0,0 +1,81 @@
+from tests.generator.gen import db_hydrated as db
+
+
+def build_resolver(names: list[str]) -> db.UserResolver:
+    return (
+        db.UserResolver()
+        .filter_in(name=names)
+        .friends(db.UserResolver().filter_by(age=20).limit(2))
+    )
+
+
+def test_equal_trees_have_equal_fingerprints() -> None:
+    rez1 = build_resolver(["Paul", "Jessica"])
+    rez2 = build_resolver(["Paul", "Jessica"])
+    assert rez1.fingerprint() == rez2.fingerprint()
+    assert hash(rez1.fingerprint()) == hash(rez2.fingerprint())
+    assert rez1.is_subset_of(rez2) and rez2.is_subset_of(rez1)
+
+    rez3 = build_resolver(["Paul"])
+    assert rez1.fingerprint() != rez3.fingerprint()
+    assert rez1.fingerprint().shape == rez3.fingerprint().shape
+    assert rez1.is_subset_of(rez3) is False
+
+
+def test_fingerprint_is_cached_until_mutation() -> None:
+    rez = build_resolver(["Paul"])
+    fingerprint = rez.fingerprint()
+    assert rez.fingerprint() is fingerprint
+
+    rez.include_fields("created_at")
+    assert rez.fingerprint() is not fingerprint
+    fingerprint = rez.fingerprint()
+
+    rez._limit = 3
+    assert rez.fingerprint() is not fingerprint
+
+
+def test_nested_mutation_invalidates_parent() -> None:
+    child = db.UserResolver()
+    rez = db.UserResolver().friends(child)
+    other = db.UserResolver().friends(db.UserResolver())
+    assert rez.is_subset_of(other)
+
+    child.filter_by(name="Paul")
+    assert rez.fingerprint() != other.fingerprint()
+    assert rez.is_subset_of(other) is False
+
+    rez.friends(db.UserResolver())
+    assert other.is_subset_of(rez)
+
+
+def test_deep_mutation_bumps_every_ancestor() -> None:
+    grandchild = db.UserResolver()
+    child = db.UserResolver().friends(grandchild)
+    rez = db.UserResolver().friends(child)
+    # merging moves the nested resolvers into new containers, they must still bump rez
+    rez.merge()
+    version, child_version = rez.tree_version(), child.tree_version()
+    fingerprint = rez.fingerprint()
+
+    grandchild.filter_by(name="Paul")
+    assert child.tree_version() > child_version
+    assert rez.tree_version() > version
+    assert rez.fingerprint() != fingerprint
+    assert "$friends__friends__name" in rez.full_query_str(
+        include_select=True, prefix=""
+    )
+
+
+def test_clone_has_its_own_tree_version() -> None:
+    child = db.UserResolver()
+    rez = db.UserResolver().friends(child)
+    copy = rez.clone()
+    version = rez.tree_version()
+    assert copy.tree_version() == version
+
+    copy._nested_resolvers.get("friends")[0].filter_by(name="Paul")
+    assert rez.tree_version() == version
+    assert copy.tree_version() > version
+    child.filter_by(name="Jessica")
+    assert rez.tree_version() > version
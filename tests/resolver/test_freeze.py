@@ -0,0 +1,84 @@
+import pytest
+from edge_orm import ResolverException
+from tests.generator.gen import db_hydrated as db
+
+
+def build_template() -> db.UserResolver:
+    return (
+        db.UserResolver()
+        .filter(".name = <str>$name")
+        .limit(10)
+        .friends(db.UserResolver().filter(".age > <int16>$age", {"age": 3}))
+        .freeze()
+    )
+
+
+def test_frozen_resolver_cannot_change() -> None:
+    template = build_template()
+    friends_rez = template._nested_resolvers.get("friends")[0]
+    assert template.is_frozen and friends_rez.is_frozen
+    with pytest.raises(ResolverException):
+        template.offset(5)
+    with pytest.raises(ResolverException):
+        template.include_fields("created_at")
+    with pytest.raises(ResolverException):
+        template.extra_field("n", "count(.friends)")
+    with pytest.raises(ResolverException):
+        friends_rez.filter(".name = <str>$other", {"other": "a"})
+    with pytest.raises(ResolverException):
+        template.friends()
+
+
+def test_frozen_resolver_caches_compiled_query() -> None:
+    template = build_template()
+    s, variables = template.full_query_str_and_vars(include_select=True, prefix="")
+    variables["name"] = "changed"
+    assert template.full_query_str_and_vars(include_select=True, prefix="") == (
+        s,
+        {"friends__age": 3},
+    )
+
+
+def test_clone_shares_frozen_nested_resolvers() -> None:
+    template = build_template()
+    clone = template.clone()
+    assert not clone.is_frozen
+    assert clone._nested_resolvers.get("friends")[0] is (
+        template._nested_resolvers.get("friends")[0]
+    )
+    clone.offset(5).friends_Count()
+    s, _ = clone.full_query_str_and_vars(include_select=True, prefix="")
+    assert "OFFSET 5" in s and "friends_Count" in s
+    template_s, _ = template.full_query_str_and_vars(include_select=True, prefix="")
+    assert "OFFSET" not in template_s and "friends_Count" not in template_s
+
+
+def test_with_vars() -> None:
+    template = build_template()
+    rez1 = template.with_vars({"name": "a"})
+    rez2 = template.with_vars({"name": "b"})
+    s1, v1 = rez1.full_query_str_and_vars(include_select=True, prefix="")
+    s2, v2 = rez2.full_query_str_and_vars(include_select=True, prefix="")
+    assert s1 == s2
+    assert v1 == {"name": "a", "friends__age": 3}
+    assert v2 == {"name": "b", "friends__age": 3}
+    assert template._query_variables == {}
+    with pytest.raises(ResolverException):
+        template.with_vars({"nope": 1})
+
+
+def test_merging_copies_the_containers_of_a_frozen_resolver() -> None:
+    def with_count() -> db.UserResolver:
+        return db.UserResolver().extra_field(
+            "n", "count(.friends)", conversion_func=int
+        )
+
+    template = with_count().freeze()
+    rez = db.UserResolver().friends(template).friends(with_count())
+    rez.merge()
+    [merged] = rez._nested_resolvers.get("friends")
+    assert merged is not template
+    merged.extra_field("m", "count(.friends)", conversion_func=int)
+    assert template._extra_fields == {"n := count(.friends)"}
+    assert template._extra_fields_conversion_funcs == {"n": int}
+    assert merged._extra_fields_conversion_funcs == {"n": int, "m": int}
@@ -0,0 +1,58 @@
+import typing as T
+import uuid
+import pytest
+from edge_orm import ResolverException
+from tests.fakes import FakeClient
+from tests.generator.gen import db_hydrated as db
+
+IDS = sorted(str(uuid.uuid4()) for _ in range(25))
+
+
+def page(query: str, variables: dict[str, T.Any]) -> T.Any:
+    """pages through IDS like the keyset query would"""
+    after = str(variables.get("__after", ""))
+    ids = [i for i in IDS if i > after][: variables["__limit"]]
+    return [
+        {"id": i, "name": "u", "phone_number": "+1", "age": 1, "friends": []}
+        for i in ids
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iterate() -> None:
+    for prefetch in (True, False):
+        client = FakeClient(many=page)
+        rez = db.UserResolver().filter(".age > <int16>$age", {"age": 0}).friends()
+        ids = [
+            str(user.id)
+            async for user in rez.iterate(
+                batch_size=10, prefetch=prefetch, client=client  # type: ignore
+            )
+        ]
+        assert ids == IDS
+        # 10 + 10 + 5, the short page is the last
+        assert len(client.queries) == 3
+        first_s, first_vars = client.queries[0]
+        next_s, next_vars = client.queries[1]
+        assert "ORDER BY .id ASC LIMIT <int64>$__limit" in first_s
+        assert first_vars == {"age": 0, "__limit": 10}
+        assert "FILTER (.age > <int16>$age) AND .id > <std::uuid>$__after" in next_s
+        assert client.queries[2][0] == next_s
+        assert next_vars["__after"] == uuid.UUID(IDS[9])
+        assert rez._limit is None and rez._order_by is None
+
+
+@pytest.mark.asyncio
+async def test_iterate_stops_early() -> None:
+    client = FakeClient(many=page)
+    async for user in db.UserResolver().iterate(batch_size=5, client=client):  # type: ignore
+        break
+    assert len(client.queries) <= 2
+
+
+@pytest.mark.asyncio
+async def test_iterate_validation() -> None:
+    with pytest.raises(ResolverException):
+        await db.UserResolver().limit(3).iterate().__anext__()
+    with pytest.raises(ResolverException):
+        await db.UserResolver().iterate(key=".name").__anext__()
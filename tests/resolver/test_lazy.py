@@ -0,0 +1,46 @@
+import uuid
+import typing as T
+import pytest
+from edge_orm.cache import Lazy
+from tests.generator.gen import db_hydrated as db
+
+
+def build_user(**extra: T.Any) -> dict[str, T.Any]:
+    return {"id": str(uuid.uuid4()), "name": "u", "phone_number": "+1", **extra}
+
+
+def build_resolver() -> db.UserResolver:
+    return db.UserResolver().friends(db.UserResolver().friends()).friends_Count()
+
+
+@pytest.mark.asyncio
+async def test_lazy_edges_are_parsed_once_on_read() -> None:
+    d = build_user(
+        friends=[build_user(friends=[build_user()]), build_user(friends=[])],
+        friends_Count=2,
+    )
+    eager = build_resolver().parse_obj_with_cache(d)
+    node = build_resolver().lazy().parse_obj_with_cache(d)
+
+    [cached] = node._cache.get("friends")
+    assert isinstance(cached.val, Lazy)
+    assert cached.val.raw is d["friends"]
+    assert await node.friends_Count() == 2
+
+    friends = await node.friends()
+    assert friends == await eager.friends()
+    assert await node.friends() is friends
+    assert not isinstance(cached.val, Lazy)
+
+    # the friends of friends stay lazy until they are read too
+    assert isinstance(friends[0]._cache.get("friends")[0].val, Lazy)
+    assert await friends[0].friends() == await (await eager.friends())[0].friends()
+    assert await friends[1].friends() == []
+
+
+@pytest.mark.asyncio
+async def test_lazy_and_trusted() -> None:
+    d = build_user(friends=[build_user()])
+    node = db.UserResolver().friends().lazy().trusted().parse_obj_with_cache(d)
+    eager = db.UserResolver().friends().parse_obj_with_cache(d)
+    assert await node.friends() == await eager.friends()
@@ -38,3 +38,20 @@ async def test_merge() -> None:
         db.UserResolver().include(ids_of_friends=True).limit(2)
     )
     debug(friends)
+
+
+def test_merge_is_memoized() -> None:
+    rez = db.UserResolver().friends(db.UserResolver().limit(1)).friends(
+        db.UserResolver().limit(1).include(ids_of_friends=True)
+    )
+    rez.merge()
+    merged = rez._nested_resolvers
+    assert len(merged.get("friends")) == 1
+    rez.merge()
+    rez.full_query_str_and_vars(include_select=True, prefix="")
+    assert rez._nested_resolvers is merged
+
+    rez.friends(db.UserResolver().limit(2))
+    rez.merge()
+    assert rez._nested_resolvers is not merged
+    assert len(rez._nested_resolvers.get("friends")) == 2
@@ -0,0 +1,92 @@
+import pytest
+from edge_orm import NamedQuery, ResolverException
+from edge_orm.types_generator.main import (
+    GeneratorException,
+    NamedQueryConfig,
+    QueryShape,
+    build_named_query_str,
+)
+from tests.fakes import FakeClient
+from tests.generator.gen import db_hydrated as db
+
+
+def test_named_queries_declare_their_variables() -> None:
+    assert db.NAMED_QUERIES
+    for named_query in db.NAMED_QUERIES:
+        named_query.check()
+
+
+def test_named_query_is_compiled_once() -> None:
+    resolver = db.USERS_BY_NAME.resolver
+    assert db.USERS_BY_NAME.resolver is resolver
+    assert isinstance(resolver, db.UserResolver)
+    query_str = db.USERS_BY_NAME.query_str
+    assert db.USERS_BY_NAME.query_str is query_str
+    assert "FILTER .name = <str>$name" in query_str
+
+
+def test_named_query_variables() -> None:
+    named_query: NamedQuery[db.User] = NamedQuery(
+        name="bound",
+        variable_names=("age",),
+        build_resolver=lambda: db.UserResolver().filter(
+            ".name = <str>$name AND .age = <int16>$age", {"name": "a"}
+        ),
+    )
+    named_query.check()
+    undeclared: NamedQuery[db.User] = NamedQuery(
+        name="undeclared",
+        build_resolver=lambda: db.UserResolver().filter(".name = <str>$name"),
+    )
+    with pytest.raises(ResolverException):
+        undeclared.check()
+
+
+def test_named_query_shape_variables() -> None:
+    edge_resolver_maps = {"UserResolver": {"friends": "UserResolver"}}
+    shape = QueryShape(
+        filter=".name = <str>$name",
+        links={"friends": QueryShape(filter=".age > <int16>$age")},
+    )
+    with pytest.raises(GeneratorException):
+        build_named_query_str(
+            name="q",
+            node_name="User",
+            config=NamedQueryConfig(shape=shape, variables={"name": "str"}),
+            edge_resolver_maps=edge_resolver_maps,
+        )
+    s = build_named_query_str(
+        name="q",
+        node_name="User",
+        config=NamedQueryConfig(shape=shape, variables={"name": "str", "age": "int"}),
+        edge_resolver_maps=edge_resolver_maps,
+    )
+    assert "variable_names=('name', 'age')" in s
+    assert "async def q(*, name: str, age: int," in s
+
+
+@pytest.mark.asyncio
+async def test_named_query_sends_arguments_as_prefixed_variables() -> None:
+    client = FakeClient(one=None)
+    assert db.USER_WITH_FRIENDS_BY_PHONE_NUMBER.variable_names == (
+        "phone_number",
+        "min_age",
+    )
+    await db.user_with_friends_by_phone_number(
+        phone_number="+1", min_age=21, client=client  # type: ignore
+    )
+    [(query_str, variables)] = client.queries
+    assert "$friends__min_age" in query_str
+    assert variables == {"phone_number": "+1", "friends__min_age": 21}
+
+    # one argument is sent to every filter that uses it
+    named_query: NamedQuery[db.User] = NamedQuery(
+        name="shared",
+        variable_names=("name",),
+        build_resolver=lambda: db.UserResolver()
+        .filter(".name = <str>$name")
+        .friends(db.UserResolver().filter(".name != <str>$name")),
+    )
+    named_query.check()
+    await named_query.query_many(variables={"name": "a"}, client=client)  # type: ignore
+    assert client.queries[1][1] == {"name": "a", "friends__name": "a"}
@@ -0,0 +1,72 @@
+from tests.generator.gen import db_hydrated as db
+from edge_orm.resolver import Resolver, query_cache
+
+
+def build_resolver(page: int, friends_limit: int) -> db.UserResolver:
+    return (
+        db.UserResolver()
+        .parameterize_pagination()
+        .order_by(".name")
+        .offset(page * 10)
+        .limit(10)
+        .friends(db.UserResolver().parameterize_pagination().limit(friends_limit))
+        .friends_Count(db.UserResolver().parameterize_pagination().limit(3))
+    )
+
+
+def test_parameterized_pagination_keeps_query_text() -> None:
+    s1, v1 = build_resolver(page=1, friends_limit=2).full_query_str_and_vars(
+        include_select=True, prefix=""
+    )
+    s2, v2 = build_resolver(page=2, friends_limit=5).full_query_str_and_vars(
+        include_select=True, prefix=""
+    )
+    assert s1 == s2
+    assert s1.endswith("ORDER BY .name OFFSET <int64>$__offset LIMIT <int64>$__limit")
+    assert "LIMIT <int64>$friends____limit" in s1
+    assert "LIMIT <int64>$friends_Count____limit" in s1
+    assert v1 == {
+        "__offset": 10,
+        "__limit": 10,
+        "friends____limit": 2,
+        "friends_Count____limit": 3,
+    }
+    assert v2["__offset"] == 20 and v2["friends____limit"] == 5
+
+
+def test_parameterized_pagination_is_still_compared_by_value() -> None:
+    rez1 = build_resolver(page=1, friends_limit=2)
+    rez2 = build_resolver(page=2, friends_limit=2)
+    assert rez1.shape_key() == rez2.shape_key()
+    assert rez1.fingerprint() != rez2.fingerprint()
+    assert rez1.is_subset_of(rez2) is False
+    assert rez1.is_subset_of(build_resolver(page=1, friends_limit=2))
+    assert rez1.build_hydrated_filters_str() == "ORDER BY .name OFFSET 10 LIMIT 10"
+
+
+def test_parameterize_pagination_default() -> None:
+    assert db.UserResolver().limit(5).build_filters_str(prefix="") == "LIMIT 5"
+    Resolver._parameterize_pagination_default = True
+    try:
+        rez = db.UserResolver().limit(5)
+    finally:
+        Resolver._parameterize_pagination_default = False
+    assert rez.build_filters_str_and_vars(prefix="") == (
+        "LIMIT <int64>$__limit",
+        {"__limit": 5},
+    )
+
+
+def test_first_page_does_not_share_query_text_with_later_pages() -> None:
+    query_cache.clear()
+    s0, v0 = build_resolver(page=0, friends_limit=2).full_query_str_and_vars(
+        include_select=True, prefix=""
+    )
+    s1, v1 = build_resolver(page=1, friends_limit=2).full_query_str_and_vars(
+        include_select=True, prefix=""
+    )
+    # an offset of 0 adds no OFFSET clause, so page 0 must not be served for page 1
+    assert "OFFSET" not in s0 and "__offset" not in v0
+    assert s1.endswith("ORDER BY .name OFFSET <int64>$__offset LIMIT <int64>$__limit")
+    assert v1["__offset"] == 10
+    assert query_cache.info().misses == 2
@@ -0,0 +1,39 @@
+import uuid
+import typing as T
+from tests.generator.gen import db_hydrated as db
+
+
+def build_user(**extra: T.Any) -> dict[str, T.Any]:
+    return {"id": str(uuid.uuid4()), "name": "u", "phone_number": "+1", **extra}
+
+
+def test_parse_plan_is_built_once_per_version() -> None:
+    rez = db.UserResolver().friends().friends_Count()
+    nested = rez._nested_resolvers
+    edges, keys = nested.parse_plan()
+    assert [key for key, _, _ in edges] == ["friends", "friends_Count"]
+    assert keys == {"friends", "friends_Count"}
+    assert nested.parse_plan()[0] is edges
+
+    rez.friends(db.UserResolver().limit(1))
+    edges, keys = nested.parse_plan()
+    assert [(key, edge) for key, edge, _ in edges] == [
+        ("friends", "friends"),
+        ("friends_Count", "friends_Count"),
+        ("friends__1", "friends"),
+    ]
+    assert edges[2][2] is nested.get("friends")[1]
+
+
+def test_parse_with_plan() -> None:
+    rez = db.UserResolver().friends().friends(db.UserResolver().limit(1))
+    d = build_user(
+        friends=[build_user(), build_user()],
+        friends__1=[build_user()],
+        friends__2=3,
+        extra=1,
+    )
+    node = rez.parse_obj_with_cache(d)
+    assert node.computed == {"friends__2": 3, "extra": 1}
+    assert [len(cached.val) for cached in node._cache.get("friends")] == [2, 1]
+    assert node._used_resolver is rez
@@ -0,0 +1,55 @@
+from tests.generator.gen import db_hydrated as db
+from edge_orm.resolver import query_cache
+from edge_orm.resolver.query_cache import QueryCache
+
+
+def build_resolver(name: str, age: int) -> db.UserResolver:
+    return (
+        db.UserResolver()
+        .filter_by(name=name)
+        .friends(db.UserResolver().filter_by(age=age).limit(5))
+        .order_by(".name")
+    )
+
+
+def test_same_shape_hits_cache() -> None:
+    query_cache.clear()
+    s1, v1 = build_resolver("Paul", 20).full_query_str_and_vars(
+        include_select=True, prefix=""
+    )
+    assert query_cache.info().misses == 1
+    s2, v2 = build_resolver("Jessica", 30).full_query_str_and_vars(
+        include_select=True, prefix=""
+    )
+    assert query_cache.info().hits == 1
+    assert s1 == s2
+    assert v1 == {"name": "Paul", "friends__age": 20}
+    assert v2 == {"name": "Jessica", "friends__age": 30}
+
+
+def test_different_shape_misses_cache() -> None:
+    query_cache.clear()
+    build_resolver("Paul", 20).full_query_str_and_vars(include_select=True, prefix="")
+    s, _ = (
+        build_resolver("Paul", 20)
+        .limit(3)
+        .full_query_str_and_vars(include_select=True, prefix="")
+    )
+    assert query_cache.info().misses == 2
+    assert s.endswith("LIMIT 3")
+    build_resolver("Paul", 20).full_query_str_and_vars(include_select=True, prefix="x")
+    assert query_cache.info().misses == 3
+
+
+def test_cache_is_bounded() -> None:
+    cache = QueryCache(maxsize=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.info().currsize == 2
+    cache.resize(0)
+    cache.set("d", "D")
+    assert cache.info().currsize == 0
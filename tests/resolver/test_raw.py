@@ -0,0 +1,42 @@
+import uuid
+import orjson
+import pytest
+from tests.fakes import FakeClient
+from tests.generator.gen import db_hydrated as db
+
+USER_ID = str(uuid.uuid4())
+USER = {
+    "id": USER_ID,
+    "name": "u",
+    "phone_number": "+1",
+    "created_at": "2022-01-01T00:00:00+00:00",
+}
+
+
+@pytest.mark.asyncio
+async def test_query_raw() -> None:
+    client = FakeClient(many=[USER], one=USER)
+    rez = db.UserResolver().include_fields("created_at").binary()
+    text = await rez.query_raw(client=client)  # type: ignore
+    assert text == orjson.dumps([USER]).decode()
+    assert await rez.query_raw(client=client, decode=True) == [USER]  # type: ignore
+    assert client.binary_queries == []
+    [(query, _), _] = client.queries
+    assert query == rez.full_query_str(include_select=True, prefix="")
+
+
+@pytest.mark.asyncio
+async def test_get_raw() -> None:
+    client = FakeClient(many=[USER], one=USER)
+    rez = db.UserResolver()
+    text = await rez.get_raw(id=USER_ID, client=client)  # type: ignore
+    assert orjson.loads(text) == USER
+    assert await rez.get_raw(id=USER_ID, client=client, decode=True) == USER  # type: ignore
+    [(query, variables), _] = client.queries
+    assert query.endswith("FILTER .id = <std::uuid>$id")
+    assert variables == {"id": USER_ID}
+
+    with pytest.raises(db.ResolverException):
+        await rez.get_raw(name="u", client=client)  # type: ignore
+    with pytest.raises(db.ResolverException):
+        await rez.get_raw(id=USER_ID, phone_number="+1", client=client)  # type: ignore
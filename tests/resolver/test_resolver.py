@@ -105,6 +105,29 @@ def test_filters_str_with_all() -> None:
 """TEST RETURN FIELDS"""
 
 
+def test_default_fields_to_return_are_shared() -> None:
+    rez1 = db.UserResolver()
+    rez2 = db.UserResolver()
+    assert rez1._fields_to_return is db.UserResolver._default_fields_to_return
+    assert rez2._fields_to_return is rez1._fields_to_return
+    rez1.include_fields("id").exclude_fields("created_at")
+    assert rez1._fields_to_return is rez2._fields_to_return
+    version = rez1._version
+    rez1.include_fields("created_at")
+    assert rez1._version != version
+    assert "created_at" in rez1._fields_to_return
+    assert "created_at" not in rez2._fields_to_return
+    assert "created_at" not in db.UserResolver._default_fields_to_return
+
+
+def test_copy() -> None:
+    rez = db.UserResolver().filter(".name = <str>$name", {"name": "a"})
+    copied = rez.copy()
+    copied.limit(1)._query_variables["name"] = "b"
+    assert rez._query_variables == {"name": "a"}
+    assert rez._limit is None
+
+
 def test_fields_to_return() -> None:
     rez = db.UserResolver()
     assert rez._fields_to_return == {"id", "name", "age", "phone_number"}
@@ -0,0 +1,42 @@
+import uuid
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from edge_orm import ResolverException
+from tests.fakes import FakeBlockingClient
+from tests.generator.gen import db_hydrated as db
+
+USER = {"id": str(uuid.uuid4()), "name": "a", "phone_number": "+1", "age": 1}
+
+
+def blocking_client() -> FakeBlockingClient:
+    return FakeBlockingClient(many=[{**USER, "friends": [USER]}], one=USER)
+
+
+def test_sync_resolver() -> None:
+    client = blocking_client()
+    users = db.UserResolver().friends().sync.query(client=client)
+    assert users[0].name == "a"
+    # nested edges were parsed into the cache like the async path
+    assert asyncio.run(users[0].friends())[0].name == "a"
+    user = db.UserResolver().sync.get(id=USER["id"], client=client)
+    assert user is not None and str(user.id) == USER["id"]
+    assert [str(u.id) for u in db.UserResolver().sync.iterate(client=client)] == [
+        USER["id"]
+    ]
+    with pytest.raises(AttributeError):
+        db.UserResolver().sync.filter
+    with pytest.raises(ResolverException):
+        list(db.UserResolver().sync.iterate(prefetch=True, client=client))
+
+
+def test_sync_resolver_from_threads() -> None:
+    client = blocking_client()
+    template = db.UserResolver().friends().freeze()
+
+    def work(_: int) -> str:
+        return template.sync.query(client=client)[0].name
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(work, range(32))) == ["a"] * 32
+    assert len(client.queries) == 32
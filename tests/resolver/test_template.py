@@ -0,0 +1,75 @@
+import pytest
+from tests.generator.gen import db_hydrated as db
+from edge_orm import ResolverException
+from edge_orm.resolver.template import (
+    tokenize,
+    prefix_variables,
+    compact_query_str_and_vars,
+)
+
+
+def test_tokenize() -> None:
+    template = tokenize(".name = <str>$name AND .age > <int16>$age")
+    assert template.names == ("name", "age")
+    assert template.render() == ".name = <str>$name AND .age > <int16>$age"
+    assert (
+        template.render("friends")
+        == ".name = <str>$friends__name AND .age > <int16>$friends__age"
+    )
+
+
+def test_tokenize_skips_literals() -> None:
+    s = """.name = '$1 off' AND .slug = "$slug" AND .bio = $$ $bio $$ AND .x = <str>$x # $comment"""
+    assert tokenize(s).names == ("x",)
+    assert prefix_variables(s, "p") == s.replace("<str>$x", "<str>$p__x")
+    assert tokenize(r".name = r'\' AND .id = <uuid>$id").names == ("id",)
+    assert tokenize(".a = $tag$ $b $tag$").names == ()
+
+
+def test_nested_prefix_keeps_literals() -> None:
+    rez = db.UserResolver().friends(
+        db.UserResolver()
+        .filter(".name = '$money' AND .age = <int16>$age", {"age": 3})
+        .order_by(".name")
+    )
+    s, variables = rez.full_query_str_and_vars(include_select=True, prefix="")
+    assert "FILTER .name = '$money' AND .age = <int16>$friends__age" in s
+    assert variables == {"friends__age": 3}
+
+
+def test_compact_variables() -> None:
+    rez = (
+        db.UserResolver()
+        .compact_variables()
+        .filter(".name = <str>$name", {"name": "a"})
+        .friends(
+            db.UserResolver()
+            .filter(".name = <str>$name OR .slug = <str>$name", {"name": "b"})
+            .friends(db.UserResolver().filter(".age = <int16>$age", {"age": 3}))
+        )
+    )
+    s, variables = rez.full_query_str_and_vars(include_select=True, prefix="")
+    compact_s, compact_vars, variable_names = compact_query_str_and_vars(
+        query_str=s, variables=variables
+    )
+    assert tokenize(compact_s).names == ("v0", "v1", "v1", "v2")
+    assert "$friends__" not in compact_s
+    assert compact_vars == {"v0": 3, "v1": "b", "v2": "a"}
+    assert variable_names == {
+        "v0": "friends__friends__age",
+        "v1": "friends__name",
+        "v2": "name",
+    }
+    assert compact_query_str_and_vars(query_str=s, variables=variables) == (
+        compact_s,
+        compact_vars,
+        variable_names,
+    )
+
+
+def test_compact_missing_variable() -> None:
+    with pytest.raises(ResolverException, match=r"\$age"):
+        compact_query_str_and_vars(
+            query_str="SELECT User FILTER .name = <str>$name AND .age = <int16>$age",
+            variables={"name": "a"},
+        )
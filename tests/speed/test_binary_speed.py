@@ -0,0 +1,73 @@
+import time
+import uuid
+import pytest
+from datetime import datetime, timezone
+import orjson
+from edgedb.datatypes.datatypes import create_object_factory
+from tests.generator.gen import db_hydrated as db
+
+pytestmark = pytest.mark.benchmark
+
+N = 200
+FRIENDS = 5
+
+factory = create_object_factory(
+    id="property",
+    name="property",
+    phone_number="property",
+    age="property",
+    created_at="property",
+    friends="link",
+)
+
+
+def build_objects() -> list:  # type: ignore
+    created_at = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+    def user(friends: list) -> object:  # type: ignore
+        return factory(uuid.uuid4(), "name", "+1", 3, created_at, friends)
+
+    return [user([user([]) for _ in range(FRIENDS)]) for _ in range(N)]
+
+
+def to_json(objects: list) -> str:  # type: ignore
+    """what the json protocol sends for the same objects"""
+
+    def d(o: object) -> dict:  # type: ignore
+        return {
+            "id": o.id,  # type: ignore
+            "name": o.name,  # type: ignore
+            "phone_number": o.phone_number,  # type: ignore
+            "age": o.age,  # type: ignore
+            "created_at": o.created_at,  # type: ignore
+            "friends": [d(f) for f in o.friends],  # type: ignore
+        }
+
+    return orjson.dumps([d(o) for o in objects]).decode()
+
+
+def test_binary_vs_json_parse_speed() -> None:
+    rez = (
+        db.UserResolver()
+        .include_fields("created_at")
+        .friends(db.UserResolver().include_fields("created_at"))
+    )
+    objects = build_objects()
+    json_str = to_json(objects)
+    # warm up both paths
+    rez.parse_obj_with_cache_list(orjson.loads(to_json(objects[:5])))
+    rez.parse_obj_with_cache_list(objects[:5])
+
+    start = time.time()
+    from_json = rez.parse_obj_with_cache_list(orjson.loads(json_str))
+    json_ms = (time.time() - start) * 1_000
+
+    start = time.time()
+    from_binary = rez.parse_obj_with_cache_list(objects)
+    binary_ms = (time.time() - start) * 1_000
+
+    print(
+        f"{N} users with {FRIENDS} friends each: "
+        f"json {json_ms:.1f} ms, binary {binary_ms:.1f} ms"
+    )
+    assert from_json == from_binary
@@ -0,0 +1,57 @@
+import time
+import pytest
+from tests.generator.gen import db_hydrated as db
+from edge_orm.resolver import query_cache
+from edge_orm.resolver.template import compact, compact_query_str_and_vars
+
+pytestmark = pytest.mark.benchmark
+
+N = 500
+
+
+def build_wide_resolver() -> db.UserResolver:
+    """4 levels of filtered friends, 2 wide at every level"""
+
+    def level(depth: int) -> db.UserResolver:
+        rez = db.UserResolver().filter(
+            ".created_at > <datetime>$created_at AND .name != <str>$name",
+            {"created_at": "2022-01-01T00:00:00+00:00", "name": f"level {depth}"},
+        )
+        if depth < 3:
+            rez.friends(level(depth + 1)).friends_Count(level(depth + 1))
+        return rez
+
+    return level(0)
+
+
+def compile_ms(compact_variables: bool) -> float:
+    rez = build_wide_resolver()
+    query_cache.clear()
+    compact.cache_clear()
+    start = time.time()
+    for _ in range(N):
+        s, variables = rez.full_query_str_and_vars(include_select=True, prefix="")
+        if compact_variables:
+            compact_query_str_and_vars(query_str=s, variables=variables)
+    return (time.time() - start) * 1_000
+
+
+def test_compact_variables_size_and_speed() -> None:
+    s, variables = build_wide_resolver().full_query_str_and_vars(
+        include_select=True, prefix=""
+    )
+    compact_s, compact_vars, _ = compact_query_str_and_vars(
+        query_str=s, variables=variables
+    )
+    names_len = sum(len(k) for k in variables)
+    compact_names_len = sum(len(k) for k in compact_vars)
+    long_ms = compile_ms(compact_variables=False)
+    short_ms = compile_ms(compact_variables=True)
+    print(
+        f"query text {len(s)} -> {len(compact_s)} chars, "
+        f"variable names {names_len} -> {compact_names_len} chars, "
+        f"{N} compiles {long_ms:.1f} ms -> {short_ms:.1f} ms"
+    )
+    assert len(compact_s) < len(s)
+    assert compact_names_len < names_len
+    assert len(compact_vars) == len(variables)
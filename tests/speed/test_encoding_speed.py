@@ -0,0 +1,25 @@
+import time
+import json
+import pytest
+from edge_orm.external import encoders
+from edge_orm.resolver import encoding
+from tests.resolver.test_encoding import build_rows
+
+pytestmark = pytest.mark.benchmark
+
+N = 10_000
+
+
+def test_encoding_speed() -> None:
+    rows = build_rows(N)
+
+    start = time.time()
+    json.dumps(encoders.jsonable_encoder(rows))
+    jsonable_ms = (time.time() - start) * 1_000
+
+    start = time.time()
+    encoding.dumps(rows)
+    orjson_ms = (time.time() - start) * 1_000
+
+    print(f"{N} rows: jsonable_encoder {jsonable_ms:.1f} ms, orjson {orjson_ms:.1f} ms")
+    assert orjson_ms < jsonable_ms
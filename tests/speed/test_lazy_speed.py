@@ -0,0 +1,49 @@
+import time
+import tracemalloc
+import pytest
+from tests.speed.test_parse_plan_speed import build_users, N, FRIENDS
+from tests.generator.gen import db_hydrated as db
+
+pytestmark = pytest.mark.benchmark
+
+# tracemalloc slows parsing down a lot, so memory is measured on fewer users
+MEMORY_N = 1_000
+
+
+def build_resolver() -> db.UserResolver:
+    return (
+        db.UserResolver()
+        .friends(db.UserResolver())
+        .friends(db.UserResolver().limit(1))
+        .friends_Count()
+    )
+
+
+def parse_ms(rez: db.UserResolver, users: list[dict]) -> float:  # type: ignore
+    start = time.time()
+    rez.parse_obj_with_cache_list(users)
+    return (time.time() - start) * 1_000
+
+
+def parse_peak_mb(rez: db.UserResolver, users: list[dict]) -> float:  # type: ignore
+    tracemalloc.start()
+    rez.parse_obj_with_cache_list(users)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def test_lazy_vs_eager_parse() -> None:
+    users = build_users()
+    eager_ms = parse_ms(build_resolver(), users)
+    lazy_ms = parse_ms(build_resolver().lazy(), users)
+    eager_mb = parse_peak_mb(build_resolver(), users[:MEMORY_N])
+    lazy_mb = parse_peak_mb(build_resolver().lazy(), users[:MEMORY_N])
+
+    print(
+        f"{N} users with {FRIENDS + 1} friends each: "
+        f"eager {eager_ms:.1f} ms, lazy {lazy_ms:.1f} ms. "
+        f"Peak for {MEMORY_N}: eager {eager_mb:.1f} MB, lazy {lazy_mb:.1f} MB"
+    )
+    assert lazy_ms < eager_ms
+    assert lazy_mb < eager_mb
@@ -0,0 +1,51 @@
+import time
+import pytest
+from tests.generator.gen import db_hydrated as db
+
+pytestmark = pytest.mark.benchmark
+
+N = 500
+
+
+def build_deep_resolver() -> db.UserResolver:
+    """3 levels of nested resolvers, with siblings that can be merged at every level"""
+
+    def level_two() -> db.UserResolver:
+        return (
+            db.UserResolver()
+            .friends(db.UserResolver().limit(1))
+            .friends(db.UserResolver().limit(1).include(ids_of_friends=True))
+        )
+
+    def level_one() -> db.UserResolver:
+        return db.UserResolver().friends(level_two()).friends(level_two().limit(5))
+
+    return db.UserResolver().friends(level_one()).friends(level_one())
+
+
+def invalidate_tree(rez: db.UserResolver) -> None:
+    rez._invalidate()
+    for resolvers in rez._nested_resolvers.d.values():
+        for r in resolvers:
+            invalidate_tree(r)
+
+
+def test_memoized_merge_speed() -> None:
+    rez = build_deep_resolver()
+    rez.full_query_str_and_vars(include_select=True, prefix="")
+
+    start = time.time()
+    for _ in range(N):
+        invalidate_tree(rez)
+        rez.full_query_str_and_vars(include_select=True, prefix="")
+    re_merge_ms = (time.time() - start) * 1_000
+
+    start = time.time()
+    for _ in range(N):
+        rez.full_query_str_and_vars(include_select=True, prefix="")
+    memoized_ms = (time.time() - start) * 1_000
+
+    print(
+        f"{N} compiles of a 3 level resolver: re-merging {re_merge_ms:.1f} ms, memoized {memoized_ms:.1f} ms"
+    )
+    assert memoized_ms < re_merge_ms
@@ -0,0 +1,60 @@
+import time
+import uuid
+import pytest
+from tests.generator.gen import db_hydrated as db
+
+pytestmark = pytest.mark.benchmark
+
+N = 10_000
+FRIENDS = 3
+
+
+def build_users() -> list[dict]:  # type: ignore
+    """users with friends and a count, as the json protocol sends them"""
+
+    def user(i: int) -> dict:  # type: ignore
+        return {
+            "id": str(uuid.uuid4()),
+            "name": f"user {i}",
+            "phone_number": "+1",
+            "age": i,
+        }
+
+    return [
+        {
+            **user(i),
+            "friends": [user(j) for j in range(FRIENDS)],
+            "friends__1": [user(0)],
+            "friends_Count": FRIENDS,
+        }
+        for i in range(N)
+    ]
+
+
+def test_parse_speed() -> None:
+    users = build_users()
+    rez = (
+        db.UserResolver()
+        .friends(db.UserResolver())
+        .friends(db.UserResolver().limit(1))
+        .friends_Count()
+    )
+    rez.parse_obj_with_cache_list(users[:5])
+
+    start = time.time()
+    for d in users:
+        db.User(**d)
+        for friend in d["friends"] + d["friends__1"]:
+            db.User(**friend)
+    construct_ms = (time.time() - start) * 1_000
+
+    start = time.time()
+    nodes = rez.parse_obj_with_cache_list(users)
+    parse_ms = (time.time() - start) * 1_000
+
+    print(
+        f"{N} users with {FRIENDS + 1} friends each: "
+        f"nodes alone {construct_ms:.1f} ms, parse {parse_ms:.1f} ms, "
+        f"overhead {parse_ms - construct_ms:.1f} ms"
+    )
+    assert len(nodes) == N
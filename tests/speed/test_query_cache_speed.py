@@ -0,0 +1,49 @@
+import time
+import pytest
+from tests.generator.gen import db_hydrated as db
+from edge_orm.resolver import query_cache
+from edge_orm.resolver.query_cache import DEFAULT_MAXSIZE
+
+pytestmark = pytest.mark.benchmark
+
+N = 3_000
+
+
+def build_tree(i: int) -> db.UserResolver:
+    """a new 3 level tree of the same shape, like every request builds"""
+    return (
+        db.UserResolver()
+        .filter(".name = <str>$name", {"name": f"user {i}"})
+        .limit(10)
+        .friends(
+            db.UserResolver()
+            .filter(".age > <int16>$age", {"age": i % 100})
+            .order_by(".name")
+            .friends(db.UserResolver().limit(3))
+            .friends_Count(db.UserResolver())
+        )
+    )
+
+
+def compile_fresh_ms() -> float:
+    """builds a fresh resolver every iteration, so only the query cache can help"""
+    start = time.time()
+    for i in range(N):
+        build_tree(i).full_query_str_and_vars(include_select=True, prefix="")
+    return (time.time() - start) * 1_000
+
+
+def test_query_cache_speed_on_fresh_resolvers() -> None:
+    query_cache.resize(0)
+    try:
+        uncached_ms = compile_fresh_ms()
+    finally:
+        query_cache.resize(DEFAULT_MAXSIZE)
+    query_cache.clear()
+    cached_ms = compile_fresh_ms()
+    print(
+        f"{N} fresh resolvers compiled {uncached_ms:.1f} ms without the query cache, "
+        f"{cached_ms:.1f} ms with it"
+    )
+    assert query_cache.info().hits == N - 1
+    assert cached_ms < uncached_ms
@@ -0,0 +1,41 @@
+import time
+import uuid
+import orjson
+import pytest
+from tests.generator.gen import db_hydrated as db
+
+pytestmark = pytest.mark.benchmark
+
+N = 10_000
+
+
+def test_raw_vs_nodes_relay_speed() -> None:
+    """relaying a response: through nodes and dumped again, or passed through"""
+    text = orjson.dumps(
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"user {i}",
+                "phone_number": "+1",
+                "age": i,
+                "created_at": "2022-01-01T00:00:00+00:00",
+            }
+            for i in range(N)
+        ]
+    ).decode()
+    rez = db.UserResolver().include_fields("created_at")
+
+    start = time.time()
+    nodes = rez.parse_obj_with_cache_list(orjson.loads(text))
+    orjson.dumps([node.dict(by_alias=True, exclude_unset=True) for node in nodes])
+    nodes_ms = (time.time() - start) * 1_000
+
+    start = time.time()
+    orjson.dumps(orjson.loads(text))
+    decoded_ms = (time.time() - start) * 1_000
+
+    print(
+        f"{N} users: through nodes {nodes_ms:.1f} ms, "
+        f"decode=True {decoded_ms:.1f} ms, raw 0 ms"
+    )
+    assert decoded_ms < nodes_ms
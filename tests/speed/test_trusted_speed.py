@@ -0,0 +1,43 @@
+import time
+import uuid
+import pytest
+from tests.generator.gen import db_hydrated as db
+
+pytestmark = pytest.mark.benchmark
+
+N = 10_000
+
+
+def build_users() -> list[dict]:  # type: ignore
+    """users as the json protocol sends them"""
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"user {i}",
+            "phone_number": "+1",
+            "age": i,
+            "created_at": "2022-01-01T00:00:00+00:00",
+            "last_updated_at": "2022-01-02T00:00:00+00:00",
+            "user_role": "buyer",
+        }
+        for i in range(N)
+    ]
+
+
+def test_trusted_vs_validated_parse_speed() -> None:
+    users = build_users()
+    rez = db.UserResolver().include_fields("created_at", "last_updated_at")
+    rez.parse_obj_with_cache_list(users[:5])
+
+    start = time.time()
+    validated = rez.parse_obj_with_cache_list(users)
+    validated_ms = (time.time() - start) * 1_000
+
+    rez.trusted()
+    start = time.time()
+    trusted = rez.parse_obj_with_cache_list(users)
+    trusted_ms = (time.time() - start) * 1_000
+
+    print(f"{N} users: validated {validated_ms:.1f} ms, trusted {trusted_ms:.1f} ms")
+    assert trusted == validated
+    assert trusted_ms < validated_ms
@@ -0,0 +1,101 @@
+import asyncio
+import typing as T
+import edgedb
+import pytest
+from edgedb.asyncio_client import AsyncIOIteration
+from edge_orm import execute, ExecuteOverloadedException
+from tests.fakes import FakeClient
+
+
+async def run(client: FakeClient, query_str: str) -> T.Any:
+    return await execute.query(
+        client=client, query_str=query_str, only_one=False  # type: ignore
+    )
+
+
+@pytest.mark.asyncio
+async def test_limiter_lanes() -> None:
+    execute.limiter.configure(execute.Limits(max_reads=2, max_writes=1))
+    try:
+        client = FakeClient(delay=0.01)
+        results = await asyncio.gather(
+            *[run(client, "SELECT User") for _ in range(6)],
+            *[run(client, "DELETE User") for _ in range(3)],
+        )
+        # every query ran, 2 reads and 1 write at a time
+        assert results == [[]] * 9 and len(client.queries) == 9
+        assert client.max_running == 3
+        reads = execute.limiter.info("query")
+        assert reads.admitted == 6 and reads.in_flight == 0 and reads.queued == 0
+        assert reads.wait_ms_max > 0
+        assert execute.limiter.info("mutation").admitted == 3
+    finally:
+        execute.limiter.configure(None)
+    assert not execute.limiter.enabled
+
+
+@pytest.mark.asyncio
+async def test_limiter_sheds_load() -> None:
+    client = FakeClient(delay=0.01)
+    execute.limiter.configure(execute.Limits(max_reads=1, max_queued=1), client=client)  # type: ignore
+    try:
+        results = await asyncio.gather(
+            *[run(client, "SELECT User") for _ in range(3)], return_exceptions=True
+        )
+        assert [isinstance(r, ExecuteOverloadedException) for r in results] == [
+            False,
+            False,
+            True,
+        ]
+        # the shed query never reached the client
+        assert len(client.queries) == 2
+        # other clients are not limited
+        other = FakeClient(delay=0.01)
+        await asyncio.gather(*[run(other, "SELECT User") for _ in range(3)])
+        assert other.max_running == 3
+
+        execute.limiter.configure(
+            execute.Limits(max_reads=1, queue_timeout=0.001), client=client  # type: ignore
+        )
+        results = await asyncio.gather(
+            *[run(client, "SELECT User") for _ in range(2)], return_exceptions=True
+        )
+        assert isinstance(results[1], ExecuteOverloadedException)
+        assert execute.limiter.info().rejected == 1
+    finally:
+        execute.limiter.configure(None, client=client)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_the_pool() -> None:
+    client = edgedb.create_async_client(dsn="edgedb://localhost:5656")
+    retry = client.transaction()
+    # transactions and derived clients share the pool of client, nothing connects here
+    clients = [
+        *[AsyncIOIteration(retry, client, i) for i in range(8)],
+        client.with_globals(a=1),
+        client,
+    ]
+    running = 0
+    max_running = 0
+
+    async def slow() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    execute.limiter.configure(execute.Limits(max_reads=2), client=client)
+    try:
+        await asyncio.gather(
+            *[
+                execute.limiter.run(client=c, operation="query", func=slow)  # type: ignore
+                for c in clients
+            ]
+        )
+        assert max_running == 2
+        assert execute.limiter.info("query").admitted == len(clients)
+    finally:
+        execute.limiter.configure(None, client=client)
+    assert not execute.limiter.enabled
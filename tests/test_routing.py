@@ -0,0 +1,97 @@
+import re
+import typing as T
+import uuid
+import pytest
+from edge_orm import ClientRouter, read_your_writes, batch
+from tests.fakes import FakeClient
+from tests.generator.gen import db_hydrated as db
+
+USER = {"id": str(uuid.uuid4()), "name": "a", "phone_number": "+1", "age": 1}
+
+
+def one(query: str, variables: dict[str, T.Any]) -> T.Any:
+    if query.startswith("SELECT {"):
+        return {"users": [USER], "total": 1}
+    if query.startswith("SELECT count("):
+        return 1
+    return USER
+
+
+def local_client() -> FakeClient:
+    return FakeClient(many=[USER], one=one)
+
+
+def statements(client: FakeClient) -> list[str]:
+    """the kind of every query the client was sent, looking past WITH model := (...)"""
+    return [
+        re.search(r"INSERT|UPDATE|DELETE|SELECT", query)[0]  # type: ignore
+        for query, _ in client.queries
+    ]
+
+
+@pytest.mark.asyncio
+async def test_router() -> None:
+    primary, replica1, replica2 = local_client(), local_client(), local_client()
+    db.User.EdgeConfig.router = ClientRouter(
+        primary=primary, replicas=[replica1, replica2]  # type: ignore
+    )
+    try:
+        assert str((await db.UserResolver().query())[0].id) == USER["id"]
+        assert await db.UserResolver().count() == 1
+        await db.UserResolver().get(id=USER["id"])
+        await batch(users=db.UserResolver(), total=db.UserResolver().count_query())
+        # the reads are spread over the replicas
+        assert len(replica1.queries) == 2 and len(replica2.queries) == 2
+        assert primary.queries == []
+
+        await db.UserResolver().insert_one(db.UserInsert(name="a", phone_number="+1"))
+        await db.UserResolver().delete_one(id=USER["id"])
+        assert statements(primary) == ["INSERT", "DELETE"]
+
+        # client= wins over the router
+        override = local_client()
+        await db.UserResolver().query(client=override)  # type: ignore
+        assert len(override.queries) == 1
+
+        with read_your_writes():
+            await db.UserResolver().query()
+            assert len(primary.queries) == 2
+            await db.UserResolver().update_one(db.UserPatch(age=2), id=USER["id"])
+            await db.UserResolver().query()
+            await db.UserResolver().get(id=USER["id"])
+            # after the write, the reads of this context go to the primary
+            assert statements(primary)[2:] == ["UPDATE", "SELECT", "SELECT"]
+        await db.UserResolver().query()
+        assert len(primary.queries) == 5
+    finally:
+        db.User.EdgeConfig.router = None
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_after_a_write_on_a_given_client() -> None:
+    primary, replica = local_client(), local_client()
+    db.User.EdgeConfig.router = ClientRouter(
+        primary=primary, replicas=[replica]  # type: ignore
+    )
+    try:
+        with read_your_writes():
+            await db.UserResolver().query()
+            tx = local_client()
+            await db.UserResolver().update_one(db.UserPatch(age=2), id=USER["id"], client=tx)  # type: ignore
+            await db.UserResolver().query()
+            assert statements(tx) == ["UPDATE"]
+            # the write was not routed, but the reads after it still go to the primary
+            assert statements(replica) == ["SELECT"]
+            assert statements(primary) == ["SELECT"]
+
+        with read_your_writes():
+            await batch(
+                client=FakeClient(one={"paul": USER}),  # type: ignore
+                paul=db.UserResolver().insert_query(
+                    db.UserInsert(name="a", phone_number="+1")
+                ),
+            )
+            await db.UserResolver().query()
+            assert len(primary.queries) == 2 and len(replica.queries) == 1
+    finally:
+        db.User.EdgeConfig.router = None
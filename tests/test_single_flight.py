@@ -0,0 +1,62 @@
+import asyncio
+import itertools
+import typing as T
+import pytest
+from edge_orm import execute
+from tests.fakes import FakeClient
+
+
+def counting_client() -> FakeClient:
+    """answers with how many queries reached it"""
+    calls = itertools.count(1)
+    return FakeClient(
+        many=lambda query, variables: [{"n": next(calls)}],
+        one=lambda query, variables: {"n": next(calls)},
+        delay=0.01,
+    )
+
+
+async def run(client: FakeClient, query_str: str, **variables: T.Any) -> T.Any:
+    return await execute.query(
+        client=client,  # type: ignore
+        query_str=query_str,
+        variables=variables,
+        only_one=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_single_flight() -> None:
+    execute.single_flight.enable()
+    execute.single_flight.reset()
+    try:
+        client = counting_client()
+        results = await asyncio.gather(
+            *[run(client, "SELECT User { name }", name="a") for _ in range(5)],
+            run(client, "SELECT User { name }", name="b"),
+            run(client, "INSERT User { name := <str>$name }", name="a"),
+            run(client, "INSERT User { name := <str>$name }", name="a"),
+        )
+        assert len(client.queries) == 4
+        # the identical reads share one response, everything else got its own
+        assert all(r == results[0] for r in results[:5])
+        assert len({r[0]["n"] for r in [results[0], *results[5:]]}) == 4
+        # every caller gets its own parsed copy
+        assert results[0] is not results[1]
+        assert execute.single_flight.info() == execute.SingleFlightInfo(
+            calls=2, coalesced=4, in_flight=0
+        )
+        # a read after the first returned is sent again
+        assert await run(client, "SELECT User { name }", name="a") == [{"n": 5}]
+    finally:
+        execute.single_flight.enable(False)
+        execute.single_flight.reset()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_disabled() -> None:
+    client = counting_client()
+    results = await asyncio.gather(
+        *[run(client, "SELECT User { name }") for _ in range(3)]
+    )
+    assert sorted(r[0]["n"] for r in results) == [1, 2, 3]